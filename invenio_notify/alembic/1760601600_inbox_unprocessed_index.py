@@ -0,0 +1,33 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2016-2018 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""add partial index for unprocessed notify inbox records"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '1760601600'
+down_revision = '1751970206'
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_index(
+        'ix_notify_inbox_unprocessed',
+        'notify_inbox',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('process_date IS NULL'),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index('ix_notify_inbox_unprocessed', table_name='notify_inbox')
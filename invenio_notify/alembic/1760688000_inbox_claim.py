@@ -0,0 +1,29 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2016-2018 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""add claim columns to notify inbox"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '1760688000'
+down_revision = '1760601600'
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column('notify_inbox', sa.Column('claimed_by', sa.Text(), nullable=True))
+    op.add_column('notify_inbox', sa.Column('claimed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_column('notify_inbox', 'claimed_at')
+    op.drop_column('notify_inbox', 'claimed_by')
@@ -0,0 +1,73 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2016-2018 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""add normalized notification columns to notify inbox"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '1760774400'
+down_revision = '1760688000'
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column('notify_inbox', sa.Column('notification_type', sa.Text(), nullable=True))
+    op.add_column('notify_inbox', sa.Column('workflow_status', sa.Text(), nullable=True))
+    op.add_column('notify_inbox', sa.Column('actor_id', sa.Text(), nullable=True))
+    op.add_column('notify_inbox', sa.Column('in_reply_to', sa.Text(), nullable=True))
+    op.add_column('notify_inbox', sa.Column('context_url', sa.Text(), nullable=True))
+    op.create_index(op.f('ix_notify_inbox_notification_type'), 'notify_inbox', ['notification_type'], unique=False)
+    op.create_index(op.f('ix_notify_inbox_actor_id'), 'notify_inbox', ['actor_id'], unique=False)
+    op.create_index(op.f('ix_notify_inbox_in_reply_to'), 'notify_inbox', ['in_reply_to'], unique=False)
+
+    # backfill the existing notifications like invenio_notify.tasks.get_normalized_fields,
+    # `type` is a string or an array of strings
+    op.execute("""
+        UPDATE notify_inbox inbox
+        SET notification_type = CASE
+                WHEN t.types @> '["coar-notify:ReviewAction"]' THEN 'coar-notify:ReviewAction'
+                WHEN t.types @> '["coar-notify:EndorsementAction"]' THEN 'coar-notify:EndorsementAction'
+                WHEN t.types @> '["TentativeAccept"]' THEN 'TentativeAccept'
+                WHEN t.types @> '["Reject"]' THEN 'Reject'
+                WHEN t.types @> '["TentativeReject"]' THEN 'TentativeReject'
+            END,
+            workflow_status = CASE
+                WHEN t.types @> '["TentativeAccept"]' THEN 'tentative_accept'
+                WHEN t.types @> '["TentativeReject"]' THEN 'tentative_reject'
+                WHEN t.types @> '["Reject"]' THEN 'reject'
+                WHEN t.types @> '["Announce", "coar-notify:EndorsementAction"]' THEN 'announce_endorsement'
+                WHEN t.types @> '["Announce", "coar-notify:ReviewAction"]' THEN 'announce_review'
+            END,
+            actor_id = inbox.raw -> 'actor' ->> 'id',
+            in_reply_to = inbox.raw ->> 'inReplyTo',
+            context_url = inbox.raw -> 'context' ->> 'id'
+        FROM (
+            SELECT id, CASE jsonb_typeof(raw -> 'type')
+                    WHEN 'array' THEN raw -> 'type'
+                    WHEN 'string' THEN jsonb_build_array(raw -> 'type')
+                    ELSE '[]'::jsonb
+                END AS types
+            FROM notify_inbox
+        ) t
+        WHERE t.id = inbox.id
+    """)
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(op.f('ix_notify_inbox_in_reply_to'), table_name='notify_inbox')
+    op.drop_index(op.f('ix_notify_inbox_actor_id'), table_name='notify_inbox')
+    op.drop_index(op.f('ix_notify_inbox_notification_type'), table_name='notify_inbox')
+    op.drop_column('notify_inbox', 'context_url')
+    op.drop_column('notify_inbox', 'in_reply_to')
+    op.drop_column('notify_inbox', 'actor_id')
+    op.drop_column('notify_inbox', 'workflow_status')
+    op.drop_column('notify_inbox', 'notification_type')
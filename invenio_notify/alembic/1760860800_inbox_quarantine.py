@@ -0,0 +1,31 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2016-2018 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""add failed attempts and quarantine columns to notify inbox"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '1760860800'
+down_revision = '1760774400'
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.add_column('notify_inbox', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('notify_inbox', sa.Column('last_error', sa.Text(), nullable=True))
+    op.add_column('notify_inbox', sa.Column('quarantined_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_column('notify_inbox', 'quarantined_at')
+    op.drop_column('notify_inbox', 'last_error')
+    op.drop_column('notify_inbox', 'attempts')
@@ -0,0 +1,47 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2016-2018 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""add delivery columns to endorsement request"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '1761033600'
+down_revision = '1760947200'
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    # requests created before were sent synchronously, i.e. they are delivered
+    op.add_column('endorsement_request', sa.Column('delivery_status', sa.Text(), server_default='delivered',
+                                                   nullable=False))
+    op.alter_column('endorsement_request', 'delivery_status', server_default=None)
+    op.add_column('endorsement_request', sa.Column('delivery_attempts', sa.Integer(), server_default='0',
+                                                   nullable=False))
+    op.add_column('endorsement_request', sa.Column('next_delivery_at', sa.DateTime(), nullable=True))
+    op.add_column('endorsement_request', sa.Column('last_delivery_error', sa.Text(), nullable=True))
+    op.add_column('endorsement_request', sa.Column('delivered_at', sa.DateTime(), nullable=True))
+    op.create_index(
+        'ix_endorsement_request_pending_delivery',
+        'endorsement_request',
+        ['next_delivery_at'],
+        unique=False,
+        postgresql_where=sa.text("delivery_status = 'pending'"),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index('ix_endorsement_request_pending_delivery', table_name='endorsement_request')
+    op.drop_column('endorsement_request', 'delivered_at')
+    op.drop_column('endorsement_request', 'last_delivery_error')
+    op.drop_column('endorsement_request', 'next_delivery_at')
+    op.drop_column('endorsement_request', 'delivery_attempts')
+    op.drop_column('endorsement_request', 'delivery_status')
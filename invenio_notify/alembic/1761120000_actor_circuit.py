@@ -0,0 +1,40 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2016-2018 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""add circuit breaker table of actor inboxes"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '1761120000'
+down_revision = '1761033600'
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        'notify_actor_circuit',
+        sa.Column('actor_id', sa.Integer(), nullable=False),
+        sa.Column('failures', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('open_until', sa.DateTime(), nullable=True),
+        sa.Column('last_failure_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('probe_started_at', sa.DateTime(), nullable=True),
+        sa.Column('created', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['actor_id'], ['notify_actor.id'],
+                                name=op.f('fk_notify_actor_circuit_actor_id_notify_actor'), ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('actor_id', name=op.f('pk_notify_actor_circuit')),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table('notify_actor_circuit')
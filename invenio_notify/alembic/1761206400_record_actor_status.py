@@ -0,0 +1,80 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2016-2018 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""add latest workflow status table of records and actors"""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '1761206400'
+down_revision = '1761120000'
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        'record_actor_status',
+        sa.Column('record_id', sqlalchemy_utils.types.uuid.UUIDType(), nullable=False),
+        sa.Column('actor_id', sa.Integer(), nullable=False),
+        sa.Column('endorsement_type', sa.Text(), nullable=True),
+        sa.Column('request_id', sa.Integer(), nullable=True),
+        sa.Column('request_status', sa.Text(), nullable=True),
+        sa.Column('reply_notification_id', sa.Text(), nullable=True),
+        sa.Column('created', sa.DateTime(), nullable=False),
+        sa.Column('updated', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['record_id'], ['rdm_records_metadata.id'],
+                                name=op.f('fk_record_actor_status_record_id_rdm_records_metadata'),
+                                ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['actor_id'], ['notify_actor.id'],
+                                name=op.f('fk_record_actor_status_actor_id_notify_actor'), ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['request_id'], ['endorsement_request.id'],
+                                name=op.f('fk_record_actor_status_request_id_endorsement_request'),
+                                ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('record_id', 'actor_id', name=op.f('pk_record_actor_status')),
+    )
+    op.create_index(op.f('ix_record_actor_status_actor_id'), 'record_actor_status', ['actor_id'], unique=False)
+
+    # backfill with the latest endorsement, the latest request that was not failed
+    # to be delivered and its latest reply with the matching status
+    op.execute("""
+        WITH latest_endorsement AS (
+            SELECT DISTINCT ON (record_id, actor_id) record_id, actor_id, review_type
+            FROM endorsement
+            WHERE record_id IS NOT NULL AND actor_id IS NOT NULL
+            ORDER BY record_id, actor_id, created DESC
+        ), latest_request AS (
+            SELECT DISTINCT ON (record_id, actor_id) id, record_id, actor_id, latest_status
+            FROM endorsement_request
+            WHERE delivery_status != 'failed'
+            ORDER BY record_id, actor_id, created DESC
+        ), latest_reply AS (
+            SELECT DISTINCT ON (reply.endorsement_request_id) reply.endorsement_request_id, inbox.notification_id
+            FROM endorsement_reply reply
+            JOIN notify_inbox inbox ON inbox.id = reply.inbox_id
+            JOIN endorsement_request request ON request.id = reply.endorsement_request_id
+                AND request.latest_status = reply.status
+            ORDER BY reply.endorsement_request_id, reply.created DESC
+        )
+        INSERT INTO record_actor_status (record_id, actor_id, endorsement_type, request_id, request_status,
+                                         reply_notification_id, created, updated)
+        SELECT COALESCE(e.record_id, r.record_id), COALESCE(e.actor_id, r.actor_id), e.review_type,
+               r.id, r.latest_status, reply.notification_id,
+               timezone('utc', now()), timezone('utc', now())
+        FROM latest_endorsement e
+        FULL OUTER JOIN latest_request r ON r.record_id = e.record_id AND r.actor_id = e.actor_id
+        LEFT JOIN latest_reply reply ON reply.endorsement_request_id = r.id
+    """)
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(op.f('ix_record_actor_status_actor_id'), table_name='record_actor_status')
+    op.drop_table('record_actor_status')
@@ -0,0 +1,102 @@
+"""
+Circuit breaker of the requests to actor inboxes.
+
+Each actor (``ActorModel.id``) has a circuit, stored in ``notify_actor_circuit``
+so it is shared by all processes. Consecutive failed requests to the inbox
+(connection errors, timeouts and 5xx responses) are counted; after
+NOTIFY_CIRCUIT_FAILURE_THRESHOLD failures the circuit opens for
+NOTIFY_CIRCUIT_RESET_TIMEOUT seconds. While it is open ``send_to_actor_inbox``
+raises ``CircuitOpenError`` at once instead of waiting for the timeout, and the
+delivery of pending endorsement requests is deferred. Afterwards the circuit is
+half-open: one caller claims the probe request, a success closes the circuit and
+a failure opens it again.
+
+Failures and successes are recorded in the transaction of the caller, which
+commits them together with the outcome of the request (e.g. the delivery
+attempt of an endorsement request). Only the claim of a probe is committed at
+once (see ``ActorCircuitModel.claim_probe``), so the circuit is not locked
+while the probe request is sent.
+
+The state of a circuit is dumped with the actor by the actor admin API, and
+``ActorModel.get_available_actors`` reports actors with an open circuit as
+``unavailable``.
+
+Counters recorded with ``current_notify_metrics``:
+
+- ``notify_actor_circuit_events_total`` (labels ``actor``, ``event``): opened,
+  closed, probe and rejected
+"""
+
+from datetime import datetime, timezone
+
+from flask import current_app
+
+from invenio_notify import constants
+from invenio_notify.errors import CircuitOpenError
+from invenio_notify.proxies import current_notify_metrics
+from invenio_notify.records.models import ActorCircuitModel
+
+
+class ActorCircuitBreaker:
+    """Circuit breakers of the actor inboxes, a ``failure_threshold`` of 0 disables them."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 300):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+    @property
+    def enabled(self):
+        return self.failure_threshold > 0
+
+    def _event(self, actor_id, event):
+        current_notify_metrics.incr('notify_actor_circuit_events_total', actor=str(actor_id), event=event)
+
+    def before_request(self, actor_id):
+        """
+        Check that a request may be sent to the inbox of an actor.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open and another caller probes the inbox
+        """
+        if not self.enabled:
+            return
+        open_until = ActorCircuitModel.get_open_until(actor_id)
+        state = ActorCircuitModel.state_of(open_until)
+        if state == constants.CIRCUIT_CLOSED:
+            return
+
+        if state == constants.CIRCUIT_HALF_OPEN:
+            if ActorCircuitModel.claim_probe(actor_id, self.reset_timeout):
+                current_app.logger.info(f'Circuit of actor [{actor_id}] is half-open, probing the inbox')
+                self._event(actor_id, 'probe')
+                return
+            # another caller is probing the inbox
+            retry_after = self.reset_timeout
+        else:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            retry_after = (open_until.replace(tzinfo=None) - now).total_seconds()
+
+        self._event(actor_id, 'rejected')
+        raise CircuitOpenError(actor_id, retry_after)
+
+    def record_success(self, actor_id):
+        """Close the circuit of an actor after a request reached its inbox."""
+        if not self.enabled:
+            return
+        if ActorCircuitModel.record_success(actor_id):
+            current_app.logger.info(f'Circuit of actor [{actor_id}] is closed')
+            self._event(actor_id, 'closed')
+
+    def record_failure(self, actor_id, error: str):
+        """Count a failed request to the inbox of an actor, the circuit opens at the threshold."""
+        if not self.enabled:
+            return
+        failures, is_open = ActorCircuitModel.record_failure(
+            actor_id, error, self.failure_threshold, self.reset_timeout,
+        )
+        if is_open:
+            current_app.logger.warning(
+                f'Circuit of actor [{actor_id}] is open for {self.reset_timeout}s after {failures} failures'
+            )
+            self._event(actor_id, 'opened')
+
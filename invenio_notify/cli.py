@@ -11,7 +11,7 @@ from sqlalchemy import desc
 
 from invenio_notify import tasks
 from invenio_notify.records.models import EndorsementModel, NotifyInboxModel, ActorMapModel, ActorModel
-from invenio_notify.utils import user_utils
+from invenio_notify.utils import actor_utils, user_utils
 
 
 def print_key_value(k, v):
@@ -39,10 +39,11 @@ def notify():
 # =============================================================================
 
 @notify.command()
+@click.option('--batch-size', '-b', type=int, default=None, help='Number of inbox records claimed per batch')
 @with_appcontext
-def run():
+def run(batch_size):
     """Run the notify background job"""
-    tasks.inbox_processing()
+    tasks.inbox_processing(batch_size=batch_size)
 
 
 @notify.command()
@@ -84,8 +85,8 @@ def test_data(email):
 
     print("Generating a test record for ActorModel...")
 
-    # Generate actor record
-    actor = ActorModel.create({
+    # Generate actor record, committed and announced to the actor caches of all processes
+    actor = actor_utils.create_actor({
         'name': "Peer Community in Evolutionary Biology",
         'actor_id': 'https://evolbiol.peercommunityin.org/coar_notify/',
         'inbox_url': "https://evolbiol.peercommunityin.org/coar_notify/inbox/",
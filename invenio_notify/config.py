@@ -1,7 +1,7 @@
 from invenio_i18n import lazy_gettext as _
 
 from invenio_notify.constants import WORKFLOW_STATUS_REQUEST_ENDORSEMENT, WORKFLOW_STATUS_TENTATIVE_ACCEPT, \
-    WORKFLOW_STATUS_TENTATIVE_REJECT, WORKFLOW_STATUS_REJECT, WORKFLOW_STATUS_AVAILABLE
+    WORKFLOW_STATUS_TENTATIVE_REJECT, WORKFLOW_STATUS_REJECT, WORKFLOW_STATUS_AVAILABLE, WORKFLOW_STATUS_UNAVAILABLE
 
 NOTIFY_INBOX_SEARCH = {
     "facets": [],
@@ -337,9 +337,178 @@ NOTIFY_ENDORSEMENT_STATUS_LABELS = {
     WORKFLOW_STATUS_TENTATIVE_REJECT: {'label': 'Not endorsed in current form', 'labelClass': 'orange'},
     WORKFLOW_STATUS_REQUEST_ENDORSEMENT: 'Pending',
     WORKFLOW_STATUS_AVAILABLE: {'label': 'Available', 'labelClass': 'green'},
+    WORKFLOW_STATUS_UNAVAILABLE: {'label': 'Temporarily unavailable', 'labelClass': 'grey',
+                                  'labelTitle': 'The inbox of the reviewer is not reachable, please try again later'},
 }
 
 # Config variable for endorsement requests react component that determines
 # which workflow states mean that an actor is available to request an endorsement
 # from
 NOTIFY_AVAILABLE_ACTORS = [WORKFLOW_STATUS_TENTATIVE_REJECT, WORKFLOW_STATUS_AVAILABLE]
+
+# Number of inbox records claimed by a worker in one batch
+NOTIFY_INBOX_BATCH_SIZE = 100
+
+# Seconds after which a claimed, still unprocessed inbox record can be claimed
+# again by another worker (e.g. when the claiming worker crashed)
+NOTIFY_INBOX_CLAIM_TIMEOUT = 600
+
+# Number of concurrent workers started by the scheduled inbox processing job.
+# Each worker claims its own batches, so records are never processed twice.
+NOTIFY_INBOX_WORKERS = 1
+
+# If True, each notification accepted by the inbox API is processed by a Celery
+# task scheduled right after the insert is committed. The scheduled inbox job
+# then only picks up records that were missed (e.g. when the task failed).
+NOTIFY_INBOX_PROCESS_ON_RECEIVE = False
+
+# Number of inbox records committed in one transaction while processing a batch.
+# Each record runs in its own savepoint, so a failing record only rolls back its
+# own changes. Larger values reduce the number of commits when draining a backlog.
+NOTIFY_INBOX_COMMIT_SIZE = 1
+
+# Number of failed processing attempts of an inbox record after which it is not
+# retried anymore. A record failing with a transient error (e.g. the record is
+# not resolvable yet) is then marked as processed with the error as note, a record
+# failing with an unexpected error is quarantined and no longer processed.
+NOTIFY_INBOX_MAX_ATTEMPTS = 5
+
+# Seconds before a failed inbox record is retried, doubled after each failed attempt
+NOTIFY_INBOX_RETRY_BACKOFF = 60
+
+# Maximum number of seconds between two attempts of a failed inbox record
+NOTIFY_INBOX_RETRY_BACKOFF_MAX = 6 * 3600
+
+# Import path of the metrics backend of the inbox processing (a subclass of
+# invenio_notify.metrics.NotifyMetrics), use "invenio_notify.metrics:NotifyMetrics"
+# to disable metrics
+NOTIFY_METRICS_BACKEND = 'invenio_notify.metrics:InMemoryMetrics'
+
+# If set, the metrics are written to this file in the Prometheus text format after
+# each inbox processing run (e.g. for the textfile collector of the node exporter).
+# "{pid}" is replaced by the process id.
+NOTIFY_METRICS_EXPORT_PATH = None
+
+# If True, the emails about new endorsements and endorsement updates of a batch
+# of inbox records are sent as one digest per record owner once the batch is
+# processed (see NOTIFY_INBOX_BATCH_SIZE). The "endorsement-digest" builder is
+# added to NOTIFICATIONS_BUILDERS by the extension. Digests only aggregate the
+# batches of the inbox processing workers: a record processed on receive (see
+# NOTIFY_INBOX_PROCESS_ON_RECEIVE) is a batch of one, so its owner gets a digest
+# per notification.
+NOTIFY_EMAIL_DIGEST = False
+
+# Seconds actors and actor memberships are cached in each process, 0 disables
+# the cache. Changes made through ActorService are applied immediately.
+NOTIFY_ACTOR_CACHE_TTL = 60
+
+# Maximum number of cached actors and of cached memberships per process
+NOTIFY_ACTOR_CACHE_MAXSIZE = 1024
+
+# If True, each process LISTENs for actor changes of other processes (Postgres
+# LISTEN/NOTIFY) on a dedicated database connection and clears its cache.
+# Otherwise changes of other processes are seen after NOTIFY_ACTOR_CACHE_TTL.
+NOTIFY_ACTOR_CACHE_LISTEN = True
+
+# Seconds the recid of a DOI cited by a notification is cached in each process,
+# 0 disables the cache. Entries are dropped when the DOI PID is updated in the
+# same process only, there is no invalidation across processes: a DOI changed
+# or deleted by another process may still resolve to the old recid until its
+# entry expires, so keep this short.
+NOTIFY_DOI_CACHE_TTL = 60
+
+# Maximum number of cached DOIs per process
+NOTIFY_DOI_CACHE_MAXSIZE = 10000
+
+# Maximum number of notifications accepted by one request to the bulk inbox
+# endpoint (POST /notify/inbox/bulk)
+NOTIFY_INBOX_BULK_MAX_ITEMS = 1000
+
+# Seconds the existence (or absence) of a record cited by a received
+# notification is cached in each process, 0 disables the cache. Keep it short,
+# records published in the meantime are reported missing until it expires.
+NOTIFY_RECORD_CACHE_TTL = 30
+
+# Maximum number of cached records per process
+NOTIFY_RECORD_CACHE_MAXSIZE = 10000
+
+# Rate limits of the inbox endpoints as (rate, burst): an API token may send
+# ``rate`` notifications per second and bursts of up to ``burst`` notifications,
+# e.g. (5, 100). Requests above the limit are answered with 429 and Retry-After.
+# None disables the limit.
+NOTIFY_INBOX_RATE_LIMIT_PER_TOKEN = None
+
+# Rate limit of each actor (``actor.id`` of the notifications) as (rate, burst),
+# None disables the limit
+NOTIFY_INBOX_RATE_LIMIT_PER_ACTOR = None
+
+# Rate limits of single actors by actor_id, instead of NOTIFY_INBOX_RATE_LIMIT_PER_ACTOR
+NOTIFY_INBOX_RATE_LIMITS_BY_ACTOR = {}
+
+# Import path of the backend that keeps the rate limit buckets, in-process by
+# default. Use 'invenio_notify.rate_limit:RedisRateLimitBackend' to share the
+# limits between all processes.
+NOTIFY_INBOX_RATE_LIMIT_BACKEND = 'invenio_notify.rate_limit:InMemoryRateLimitBackend'
+
+# Redis URL of RedisRateLimitBackend, CACHE_REDIS_URL is used if not set
+NOTIFY_INBOX_RATE_LIMIT_REDIS_URL = None
+
+# The duration and the number of SQL statements of each phase (auth, rate_limit,
+# coar_validate, record_id, membership, record_exists, insert and total) of the
+# requests to the inbox endpoints are logged in the structured log field
+# ``server_timing``. If True, they are also sent in the Server-Timing header of
+# the responses. Disabled by default, as the header is sent to every client of
+# the public inbox
+NOTIFY_INBOX_SERVER_TIMING = False
+
+# Number of endorsement requests claimed in one batch by the delivery to the
+# actor inboxes (the scheduled "deliver_endorsement_requests" job)
+NOTIFY_DELIVERY_BATCH_SIZE = 100
+
+# Seconds after which a claimed, still pending endorsement request can be claimed
+# again (e.g. when the delivering worker crashed), longer than the request timeout
+NOTIFY_DELIVERY_CLAIM_TIMEOUT = 120
+
+# Number of failed delivery attempts of an endorsement request after which it is
+# marked as failed. Requests rejected by the actor inbox with a 4xx status (other
+# than 408, 425 and 429) fail immediately. The actor is then available again for
+# a new request.
+NOTIFY_DELIVERY_MAX_ATTEMPTS = 8
+
+# Seconds before a failed delivery is retried, doubled after each failed attempt
+NOTIFY_DELIVERY_RETRY_BACKOFF = 30
+
+# Maximum number of seconds between two delivery attempts of an endorsement request
+NOTIFY_DELIVERY_RETRY_BACKOFF_MAX = 6 * 3600
+
+# Maximum number of keep-alive connections kept open to each actor inbox host
+# per process, for sending endorsement requests
+NOTIFY_OUTBOUND_POOL_MAXSIZE = 10
+
+# Seconds to wait for a connection to an actor inbox
+NOTIFY_OUTBOUND_CONNECT_TIMEOUT = 5
+
+# Seconds to wait for the response of an actor inbox
+NOTIFY_OUTBOUND_READ_TIMEOUT = 30
+
+# Number of times a failed connection to an actor inbox is retried before the
+# delivery attempt fails
+NOTIFY_OUTBOUND_RETRIES = 2
+
+# Backoff factor of the connection retries, the n-th retry waits
+# NOTIFY_OUTBOUND_RETRY_BACKOFF * 2 ** (n - 1) seconds
+NOTIFY_OUTBOUND_RETRY_BACKOFF = 0.5
+
+# Number of consecutive failed requests (connection errors, timeouts and 5xx
+# responses) to the inbox of an actor after which its circuit breaker opens. No
+# request is sent to the inbox while it is open, pending endorsement requests are
+# delivered later. 0 disables the circuit breaker.
+NOTIFY_CIRCUIT_FAILURE_THRESHOLD = 5
+
+# Seconds the circuit breaker of an actor inbox stays open, then one probe
+# request is sent and closes it again if it succeeds
+NOTIFY_CIRCUIT_RESET_TIMEOUT = 300
+
+# Maximum number of actors of one multi-actor endorsement request
+# (POST /endorsement-request/send-many/<pid_value>)
+NOTIFY_ENDORSEMENT_REQUEST_MAX_ACTORS = 20
@@ -17,6 +17,17 @@ WORKFLOW_STATUS_ANNOUNCE_REVIEW = 'announce_review'
 WORKFLOW_STATUS_ANNOUNCE_ENDORSEMENT = 'announce_endorsement'
 WORKFLOW_STATUS_REJECT = 'reject'
 WORKFLOW_STATUS_AVAILABLE = 'available' # This is not COAR standard, used internally.
+WORKFLOW_STATUS_UNAVAILABLE = 'unavailable' # Not COAR standard, the inbox of the actor is temporarily unavailable.
+
+# Delivery status of endorsement requests to the inbox of the actor
+DELIVERY_STATUS_PENDING = 'pending'
+DELIVERY_STATUS_DELIVERED = 'delivered'
+DELIVERY_STATUS_FAILED = 'failed'
+
+# States of the circuit breaker of the inbox of an actor
+CIRCUIT_CLOSED = 'closed'
+CIRCUIT_OPEN = 'open'
+CIRCUIT_HALF_OPEN = 'half_open'
 
 
 STATUS_NOT_ACCEPTED = 422
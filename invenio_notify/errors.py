@@ -1,3 +1,6 @@
+import math
+
+
 class NotExistsError(Exception):
     """not found exception."""
 
@@ -17,6 +20,18 @@ class COARProcessFail(Exception):
         self.description = description
 
 
+class DuplicateNotificationError(Exception):
+    """A notification with the same notification ID already exists in the inbox."""
+
+    def __init__(self, notification_id):
+        self.notification_id = notification_id
+
+    @property
+    def description(self):
+        """Exception's description."""
+        return f"Notification already exists: {self.notification_id}"
+
+
 class SendRequestFail(Exception):
     """Send request fail exception."""
 
@@ -25,6 +40,15 @@ class SendRequestFail(Exception):
         self.description = description
 
 
+class CircuitOpenError(SendRequestFail):
+    """The circuit breaker of the actor inbox is open, the request is not sent."""
+
+    def __init__(self, actor_id, retry_after: float):
+        self.actor_id = actor_id
+        self.retry_after = max(1, math.ceil(retry_after))
+        super().__init__(f"Inbox of actor {actor_id} is unavailable, retry after {self.retry_after} seconds")
+
+
 class BadRequestError(Exception):
     """ General error if you can 400 from error handler. """
 
@@ -1,5 +1,10 @@
+from invenio_base.utils import obj_or_import_string
+
 from invenio_notify import config, cli, feature_toggle
 from invenio_notify.blueprints import blueprint
+from invenio_notify.circuit_breaker import ActorCircuitBreaker
+from invenio_notify.notifications.builders import EndorsementDigestNotificationBuilder
+from invenio_notify.rate_limit import InboxRateLimiter
 from invenio_notify.resources import (
     InboxAdminResourceConfig,
     ActorAdminResourceConfig,
@@ -28,6 +33,10 @@ from invenio_notify.services import (
     ActorMapService,
     ActorService,
 )
+from invenio_notify.utils.actor_cache import ActorCache
+from invenio_notify.utils.doi_cache import DoiCache
+from invenio_notify.utils.http_session import InboxSessionPool
+from invenio_notify.utils.record_cache import RecordExistenceCache
 
 
 class InvenioNotify:
@@ -44,6 +53,14 @@ class InvenioNotify:
 
     def init_app(self, app):
         self.init_config(app)
+        self.init_metrics(app)
+        self.init_actor_cache(app)
+        self.init_doi_cache(app)
+        self.init_record_cache(app)
+        self.init_rate_limiter(app)
+        self.init_inbox_sessions(app)
+        self.init_circuit_breaker(app)
+        self.init_notification_builders(app)
         self.init_services(app)
         self.init_resources(app)
         app.extensions["invenio-notify"] = self
@@ -57,6 +74,60 @@ class InvenioNotify:
             if k.startswith("NOTIFY_"):
                 app.config.setdefault(k, getattr(config, k))
 
+    def init_metrics(self, app):
+        """Initialize the metrics backend."""
+        self.metrics = obj_or_import_string(app.config['NOTIFY_METRICS_BACKEND'])()
+
+    def init_actor_cache(self, app):
+        """Initialize the cache of actors and memberships."""
+        self.actor_cache = ActorCache(
+            ttl=app.config['NOTIFY_ACTOR_CACHE_TTL'],
+            maxsize=app.config['NOTIFY_ACTOR_CACHE_MAXSIZE'],
+            listen=app.config['NOTIFY_ACTOR_CACHE_LISTEN'],
+        )
+
+    def init_doi_cache(self, app):
+        """Initialize the cache of recids by DOI."""
+        self.doi_cache = DoiCache(
+            ttl=app.config['NOTIFY_DOI_CACHE_TTL'],
+            maxsize=app.config['NOTIFY_DOI_CACHE_MAXSIZE'],
+        )
+
+    def init_record_cache(self, app):
+        """Initialize the cache of existing records."""
+        self.record_cache = RecordExistenceCache(
+            ttl=app.config['NOTIFY_RECORD_CACHE_TTL'],
+            maxsize=app.config['NOTIFY_RECORD_CACHE_MAXSIZE'],
+        )
+
+    def init_rate_limiter(self, app):
+        """Initialize the rate limiter of the inbox."""
+        backend = obj_or_import_string(app.config['NOTIFY_INBOX_RATE_LIMIT_BACKEND'])()
+        self.inbox_rate_limiter = InboxRateLimiter(backend)
+
+    def init_inbox_sessions(self, app):
+        """Initialize the pool of HTTP sessions to the actor inboxes."""
+        self.inbox_sessions = InboxSessionPool(
+            pool_maxsize=app.config['NOTIFY_OUTBOUND_POOL_MAXSIZE'],
+            connect_timeout=app.config['NOTIFY_OUTBOUND_CONNECT_TIMEOUT'],
+            read_timeout=app.config['NOTIFY_OUTBOUND_READ_TIMEOUT'],
+            retries=app.config['NOTIFY_OUTBOUND_RETRIES'],
+            retry_backoff=app.config['NOTIFY_OUTBOUND_RETRY_BACKOFF'],
+        )
+
+    def init_circuit_breaker(self, app):
+        """Initialize the circuit breakers of the actor inboxes."""
+        self.circuit_breaker = ActorCircuitBreaker(
+            failure_threshold=app.config['NOTIFY_CIRCUIT_FAILURE_THRESHOLD'],
+            reset_timeout=app.config['NOTIFY_CIRCUIT_RESET_TIMEOUT'],
+        )
+
+    def init_notification_builders(self, app):
+        """Register the notification builders of invenio-notify that are not configured by the instance."""
+        # updated in place, the manager of invenio-notifications may already hold the dict
+        builders = app.config.setdefault('NOTIFICATIONS_BUILDERS', {})
+        builders.setdefault(EndorsementDigestNotificationBuilder.type, EndorsementDigestNotificationBuilder)
+
     def init_services(self, app):
         """Initialize the services for notifications."""
         self.notify_inbox_service = NotifyInboxService(config=NotifyInboxServiceConfig)
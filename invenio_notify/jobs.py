@@ -10,3 +10,12 @@ class ProcessNotifyInboxJob(JobType):
     id = 'process_notify_inbox'
     title = 'Process notify inbox'
     description = 'Process notify inbox records'
+
+
+class DeliverEndorsementRequestsJob(JobType):
+    """ Deliver pending endorsement requests job """
+
+    task = tasks.shared_task_endorsement_request_delivery
+    id = 'deliver_endorsement_requests'
+    title = 'Deliver endorsement requests'
+    description = 'Deliver pending endorsement requests to the actor inboxes'
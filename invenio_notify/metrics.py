@@ -0,0 +1,194 @@
+"""
+Metrics of the inbox processing.
+
+The extension creates one metrics backend per process from the import path in
+NOTIFY_METRICS_BACKEND, available as ``current_notify_metrics``. Custom backends
+(e.g. StatsD or OpenTelemetry) subclass ``NotifyMetrics`` and implement
+``incr``, ``observe`` and ``gauge``.
+
+Metrics recorded by the inbox processing:
+
+- ``notify_inbox_stage_seconds`` (histogram, label ``stage``): decode,
+  actor_lookup, record_resolve, reply_create, endorsement_create,
+  notification_build, reindex, prefetch, commit and claim
+- ``notify_inbox_notifications_total`` (counter, labels ``type``, ``actor``,
+  ``outcome``): processed, rejected, retry, failed and quarantined
+- ``notify_inbox_queue_depth`` and ``notify_inbox_oldest_unprocessed_age_seconds``
+  (gauges), ``notify_inbox_quarantined`` (gauge)
+
+The delivery of endorsement requests records ``notify_endorsement_request_deliveries_total``
+(counter, labels ``actor``, ``outcome``): delivered, deferred, retry and failed,
+and the circuit breakers of the actor inboxes ``notify_actor_circuit_events_total``,
+see ``invenio_notify.circuit_breaker``.
+
+The rate limits of the inbox endpoints record ``notify_inbox_rate_limit_requests_total``,
+see ``invenio_notify.rate_limit``.
+"""
+
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+""" Upper bounds in seconds of the histogram buckets """
+
+
+class NotifyMetrics:
+    """Metrics backend that discards all metrics."""
+
+    def incr(self, name, value=1, **labels):
+        """Increase a counter."""
+
+    def observe(self, name, seconds, **labels):
+        """Record a duration in seconds."""
+
+    def gauge(self, name, value, **labels):
+        """Set the current value of a gauge."""
+
+    def export(self, path):
+        """Write the collected metrics to a local file, if supported by the backend."""
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Record the duration of the block, also if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+
+class InMemoryMetrics(NotifyMetrics):
+    """
+    Metrics backend that aggregates all metrics in memory of the current process.
+
+    ``snapshot`` returns the collected metrics as Python objects and ``export``
+    writes them in the Prometheus text format, e.g. for the textfile collector
+    of the node exporter.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._counters = {}
+            self._gauges = {}
+            self._histograms = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def incr(self, name, value=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {
+                    'buckets': [0] * (len(self.buckets) + 1),
+                    'sum': 0.0,
+                    'count': 0,
+                }
+            histogram['buckets'][bisect_left(self.buckets, seconds)] += 1
+            histogram['sum'] += seconds
+            histogram['count'] += 1
+
+    def gauge(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def snapshot(self) -> dict:
+        """
+        Get a copy of the collected metrics.
+
+        Returns:
+            dict: ``counters``, ``gauges`` and ``histograms``, each a list of dicts
+            with ``name`` and ``labels``, plus ``value`` or the histogram ``buckets``
+            (counts per upper bound, not cumulative), ``sum`` and ``count``
+        """
+        with self._lock:
+            return {
+                'counters': [{'name': n, 'labels': dict(l), 'value': v}
+                             for (n, l), v in self._counters.items()],
+                'gauges': [{'name': n, 'labels': dict(l), 'value': v}
+                           for (n, l), v in self._gauges.items()],
+                'histograms': [{'name': n, 'labels': dict(l),
+                                'buckets': dict(zip(self.buckets + (float('inf'),), h['buckets'])),
+                                'sum': h['sum'], 'count': h['count']}
+                               for (n, l), h in self._histograms.items()],
+            }
+
+    def export(self, path):
+        """
+        Write the collected metrics in the Prometheus text format.
+
+        The file is replaced atomically. ``{pid}`` in the path is replaced by the
+        process id, so several worker processes do not overwrite each other's file.
+
+        Args:
+            path: Path of the file
+        """
+        path = path.format(pid=os.getpid())
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile('w', dir=directory, delete=False, suffix='.tmp') as f:
+            f.write(to_prometheus_text(self.snapshot()))
+        os.replace(f.name, path)
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ''
+    escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for v in labels.values())
+    return '{' + ','.join(f'{k}="{v}"' for k, v in zip(labels.keys(), escaped)) + '}'
+
+
+def to_prometheus_text(snapshot: dict) -> str:
+    """
+    Format a snapshot of ``InMemoryMetrics`` in the Prometheus text format.
+
+    Args:
+        snapshot: The snapshot of the metrics
+
+    Returns:
+        str: The metrics in the Prometheus text format
+    """
+    lines = []
+    typed = set()
+
+    def add_type(name, metric_type):
+        if name not in typed:
+            typed.add(name)
+            lines.append(f'# TYPE {name} {metric_type}')
+
+    for c in sorted(snapshot['counters'], key=lambda m: m['name']):
+        add_type(c['name'], 'counter')
+        lines.append(f"{c['name']}{_format_labels(c['labels'])} {c['value']}")
+
+    for g in sorted(snapshot['gauges'], key=lambda m: m['name']):
+        add_type(g['name'], 'gauge')
+        lines.append(f"{g['name']}{_format_labels(g['labels'])} {g['value']}")
+
+    for h in sorted(snapshot['histograms'], key=lambda m: m['name']):
+        add_type(h['name'], 'histogram')
+        cumulative = 0
+        for le, count in h['buckets'].items():
+            cumulative += count
+            le = '+Inf' if le == float('inf') else le
+            lines.append(f"{h['name']}_bucket{_format_labels({**h['labels'], 'le': le})} {cumulative}")
+        lines.append(f"{h['name']}_sum{_format_labels(h['labels'])} {h['sum']}")
+        lines.append(f"{h['name']}_count{_format_labels(h['labels'])} {h['count']}")
+
+    return '\n'.join(lines) + '\n'
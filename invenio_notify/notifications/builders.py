@@ -1,4 +1,5 @@
 import logging
+from typing import ClassVar, Union
 
 from invenio_accounts.models import User
 from invenio_notifications.models import Notification
@@ -11,6 +12,7 @@ from invenio_users_resources.notifications.generators import EmailRecipient
 from invenio_rdm_records.records.models import RDMRecordMetadata
 
 from invenio_notify import constants
+from invenio_notify.utils.record_utils import RecordSummary
 
 log = logging.getLogger(__name__)
 
@@ -38,13 +40,14 @@ def get_record_url(record):
     Get record URL from record object.
     
     Args:
-        record: The record object
+        record: The record object or its RecordSummary
     
     Returns:
         str: The record URL or "Unknown" if error occurs
     """
     try:
-        r = RecordIdProviderV2.get(record.data['id'])
+        pid_value = record.pid_value if isinstance(record, RecordSummary) else record.data['id']
+        r = RecordIdProviderV2.get(pid_value)
         rec_link = RecordEndpointLink("invenio_app_rdm_records.record_detail",
                                       params=["pid_value"],
                                       )
@@ -59,11 +62,13 @@ def get_record_title(record):
     Get record title from record object.
     
     Args:
-        record: The record object
+        record: The record object or its RecordSummary
     
     Returns:
         str: The record title or "Unknown" if error occurs
     """
+    if isinstance(record, RecordSummary):
+        return record.title or "Unknown"
     try:
         return record.data['metadata']['title']
     except Exception as e:
@@ -76,14 +81,14 @@ class NewEndorsementNotificationBuilder(NotificationBuilder):
     type = 'new-endorsement'
 
     @classmethod
-    def build(cls, record: RDMRecordMetadata = None,
+    def build(cls, record: Union[RDMRecordMetadata, RecordSummary] = None,
               actor_name="Unknown", endorsement_url="Unknown",
               receiver_email=None, user_id=None):
         """
         Build notification with the provided parameters.
 
         Args:
-            record: The record object (optional)
+            record: The record object or its RecordSummary (optional)
             actor_name: Name of the actor (default: "Unknown")
             endorsement_url: URL of the endorsement (default: "Unknown")
             receiver_email: Email of the recipient (default: "Unknown")
@@ -108,15 +113,15 @@ class NewEndorsementNotificationBuilder(NotificationBuilder):
 
         return Notification(type=cls.type, context=context, )
 
-    context = []
+    context: ClassVar[list] = []
 
-    recipients = [
+    recipients: ClassVar[list] = [
         EmailRecipient("receiver_email"),
     ]
 
-    recipient_filters = []
+    recipient_filters: ClassVar[list] = []
 
-    recipient_backends = [
+    recipient_backends: ClassVar[list] = [
         UserEmailBackend(),
     ]
 
@@ -126,14 +131,14 @@ class EndorsementUpdateNotificationBuilder(NotificationBuilder):
     type = 'endorsement-update'
 
     @classmethod
-    def build(cls, record: RDMRecordMetadata = None,
+    def build(cls, record: Union[RDMRecordMetadata, RecordSummary] = None,
               actor_name="Unknown", endorsement_status="Unknown",
               receiver_email=None, user_id=None):
         """
         Build notification with the provided parameters.
 
         Args:
-            record: The record object (optional)
+            record: The record object or its RecordSummary (optional)
             actor_name: Name of the actor (default: "Unknown")
             endorsement_status: Status of the endorsement (default: "Unknown")
             receiver_email: Email of the recipient (default: "Unknown")
@@ -162,14 +167,54 @@ class EndorsementUpdateNotificationBuilder(NotificationBuilder):
 
         return Notification(type=cls.type, context=context, )
 
-    context = []
+    context: ClassVar[list] = []
 
-    recipients = [
+    recipients: ClassVar[list] = [
         EmailRecipient("receiver_email"),
     ]
 
-    recipient_filters = []
+    recipient_filters: ClassVar[list] = []
 
-    recipient_backends = [
+    recipient_backends: ClassVar[list] = [
+        UserEmailBackend(),
+    ]
+
+
+class EndorsementDigestNotificationBuilder(NotificationBuilder):
+    """Notification builder for a digest of endorsements and endorsement updates of a record owner."""
+    type = 'endorsement-digest'
+
+    @classmethod
+    def build(cls, items=None, receiver_email=None, user_id=None):
+        """
+        Build notification with the provided parameters.
+
+        Args:
+            items: The endorsements and endorsement updates, dicts with ``type``,
+                ``record_title``, ``record_url``, ``actor_name`` and
+                ``endorsement_url`` or ``endorsement_status``
+            receiver_email: Email of the recipient (default: "Unknown")
+            user_id: ID of the user who should receive the notification (optional)
+
+        Returns:
+            Notification: A notification object with the context from the parameters
+        """
+        context = {
+            'items': items or [],
+            'receiver_email': get_receiver_email(receiver_email, user_id),
+            'TYPE_NEW_ENDORSEMENT': NewEndorsementNotificationBuilder.type,
+        }
+
+        return Notification(type=cls.type, context=context, )
+
+    context: ClassVar[list] = []
+
+    recipients: ClassVar[list] = [
+        EmailRecipient("receiver_email"),
+    ]
+
+    recipient_filters: ClassVar[list] = []
+
+    recipient_backends: ClassVar[list] = [
         UserEmailBackend(),
     ]
@@ -0,0 +1,129 @@
+import logging
+from collections import defaultdict
+
+from invenio_accounts.models import User
+from invenio_db.uow import Operation
+from invenio_notifications.tasks import broadcast_notification
+
+from invenio_notify.notifications.builders import NewEndorsementNotificationBuilder, \
+    EndorsementUpdateNotificationBuilder, EndorsementDigestNotificationBuilder, get_record_title, get_record_url
+from invenio_notify.utils.record_utils import get_record_summaries
+
+log = logging.getLogger(__name__)
+
+
+class NotificationDigest:
+    """
+    Buffer endorsement notifications of a processing window per recipient.
+
+    Instead of one e-mail per notification, ``flush`` sends one notification per
+    record owner with all endorsements and endorsement updates of the window.
+    Records (only the needed fields) and recipients are loaded once per window,
+    not once per notification.
+
+    A window is a batch of the inbox processing workers, records processed on
+    receive are batches of one and are not aggregated.
+    """
+
+    def __init__(self):
+        self._events: dict[int, list[dict]] = defaultdict(list)
+        self._owners: dict[str, int] = {}
+
+    def get_owner(self, record_id, lookup) -> int:
+        """
+        Get the user_id of the record owner, ``lookup(record_id)`` is called once per record.
+        """
+        record_id = str(record_id)
+        if record_id not in self._owners:
+            self._owners[record_id] = lookup(record_id)
+        return self._owners[record_id]
+
+    def add(self, user_id: int, event: dict):
+        """
+        Add an event for a recipient.
+
+        Args:
+            user_id: ID of the user who should receive the notification
+            event: ``type`` (type of the builder), ``record_id``, ``actor_name`` and
+                ``endorsement_url`` or ``endorsement_status``
+        """
+        self._events[user_id].append(event)
+
+    def flush(self) -> int:
+        """
+        Send one notification per recipient with the buffered events.
+
+        A recipient with a single event receives the regular notification.
+
+        Returns:
+            int: Number of notifications sent
+        """
+        if not self._events:
+            return 0
+
+        events, self._events = self._events, defaultdict(list)
+        records = get_record_summaries(e['record_id'] for user_events in events.values() for e in user_events)
+        emails = dict(User.query.with_entities(User.id, User.email).filter(User.id.in_(events.keys())).all())
+
+        for user_id, user_events in events.items():
+            receiver_email = emails.get(user_id)
+            if len(user_events) == 1:
+                notification = build_single_notification(user_events[0], records, receiver_email, user_id)
+            else:
+                notification = EndorsementDigestNotificationBuilder.build(
+                    items=[build_digest_item(e, records) for e in user_events],
+                    receiver_email=receiver_email,
+                    user_id=user_id,
+                )
+            broadcast_notification.delay(notification.dumps())
+
+        log.info(f"Sent endorsement notification digests to {len(events)} recipients")
+        return len(events)
+
+
+def build_single_notification(event: dict, records: dict, receiver_email, user_id):
+    record = records.get(str(event['record_id']))
+    if event['type'] == NewEndorsementNotificationBuilder.type:
+        return NewEndorsementNotificationBuilder.build(
+            record=record,
+            actor_name=event['actor_name'],
+            endorsement_url=event['endorsement_url'],
+            receiver_email=receiver_email,
+            user_id=user_id,
+        )
+    return EndorsementUpdateNotificationBuilder.build(
+        record=record,
+        actor_name=event['actor_name'],
+        endorsement_status=event['endorsement_status'],
+        receiver_email=receiver_email,
+        user_id=user_id,
+    )
+
+
+def build_digest_item(event: dict, records: dict) -> dict:
+    record = records.get(str(event['record_id']))
+    return {
+        'type': event['type'],
+        'record_title': get_record_title(record) if record else "Unknown",
+        'record_url': get_record_url(record) if record else "Unknown",
+        'actor_name': event['actor_name'],
+        'endorsement_url': event.get('endorsement_url'),
+        'endorsement_status': event.get('endorsement_status'),
+    }
+
+
+class DigestEventOp(Operation):
+    """
+    Add an event to a notification digest once the unit of work is committed.
+
+    Like ``NotificationOp``, the event is dropped if the unit of work is rolled
+    back or the operation is discarded with a failed savepoint.
+    """
+
+    def __init__(self, digest: NotificationDigest, user_id: int, event: dict):
+        self._digest = digest
+        self._user_id = user_id
+        self._event = event
+
+    def on_post_commit(self, uow):
+        self._digest.add(self._user_id, self._event)
@@ -6,6 +6,13 @@ from flask import current_app
 from werkzeug.local import LocalProxy
 
 if TYPE_CHECKING:
+    from invenio_notify.circuit_breaker import ActorCircuitBreaker
+    from invenio_notify.metrics import NotifyMetrics
+    from invenio_notify.rate_limit import InboxRateLimiter
+    from invenio_notify.utils.actor_cache import ActorCache
+    from invenio_notify.utils.doi_cache import DoiCache
+    from invenio_notify.utils.http_session import InboxSessionPool
+    from invenio_notify.utils.record_cache import RecordExistenceCache
     from invenio_notify.services import (
         NotifyInboxService,
         ActorService,
@@ -36,4 +43,30 @@ current_endorsement_reply_service: 'EndorsementReplyService' = LocalProxy( # typ
     lambda: current_notify.endorsement_reply_service
 )
 
+current_notify_metrics: 'NotifyMetrics' = LocalProxy(  # type:ignore[assignment]
+    lambda: current_notify.metrics
+)
+
+current_actor_cache: 'ActorCache' = LocalProxy(  # type:ignore[assignment]
+    lambda: current_notify.actor_cache
+)
+
+current_doi_cache: 'DoiCache' = LocalProxy(  # type:ignore[assignment]
+    lambda: current_notify.doi_cache
+)
+
+current_record_cache: 'RecordExistenceCache' = LocalProxy(  # type:ignore[assignment]
+    lambda: current_notify.record_cache
+)
+
+current_inbox_rate_limiter: 'InboxRateLimiter' = LocalProxy(  # type:ignore[assignment]
+    lambda: current_notify.inbox_rate_limiter
+)
 
+current_inbox_sessions: 'InboxSessionPool' = LocalProxy(  # type:ignore[assignment]
+    lambda: current_notify.inbox_sessions
+)
+
+current_actor_circuit_breaker: 'ActorCircuitBreaker' = LocalProxy(  # type:ignore[assignment]
+    lambda: current_notify.circuit_breaker
+)
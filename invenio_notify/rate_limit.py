@@ -0,0 +1,235 @@
+"""
+Rate limits of the inbox endpoints.
+
+Each API token and each actor has a token bucket: it holds at most ``burst``
+notifications and refills with ``rate`` notifications per second. A request
+is rejected with HTTP 429 and ``Retry-After`` when a bucket is empty, so one
+client cannot flood the inbox and starve the database connections of the
+whole repository. The bucket of an actor is only charged for notifications of
+a user that is a member of the actor, the notifications claiming other actors
+are only charged to the bucket of the API token.
+
+The buckets are kept by a backend created from the import path in
+NOTIFY_INBOX_RATE_LIMIT_BACKEND. ``InMemoryRateLimitBackend`` (default) limits
+each process on its own, ``RedisRateLimitBackend`` shares the buckets between
+all processes.
+
+Counters recorded with ``current_notify_metrics``:
+
+- ``notify_inbox_rate_limit_requests_total`` (labels ``scope``, ``outcome``):
+  checked requests by scope (token or actor) and outcome (allowed or limited)
+"""
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from flask import current_app
+
+from invenio_notify.proxies import current_notify_metrics
+
+
+class RateLimitExceeded(Exception):
+    """A rate limit of the inbox is exceeded."""
+
+    def __init__(self, scope, retry_after: float):
+        self.scope = scope
+        self.retry_after = max(1, math.ceil(retry_after))
+
+    @property
+    def description(self):
+        """Exception's description."""
+        return f"Too many notifications per {self.scope}, retry after {self.retry_after} seconds"
+
+
+class RateLimitBackend(ABC):
+    """Backend that keeps the token buckets."""
+
+    @abstractmethod
+    def consume(self, key: str, rate: float, burst: int, cost: int = 1) -> float:
+        """
+        Take ``cost`` tokens from a bucket.
+
+        A request is allowed if the bucket holds ``min(cost, burst)`` tokens, the
+        balance may become negative for a cost above ``burst`` (e.g. a bulk
+        request) and is paid back before the next request is allowed.
+
+        Args:
+            key: Key of the bucket
+            rate: Tokens added per second
+            burst: Capacity of the bucket
+            cost: Number of tokens to take
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise the seconds until they are available
+        """
+
+    @abstractmethod
+    def refund(self, key: str, rate: float, burst: int, cost: int = 1):
+        """
+        Give back ``cost`` tokens taken by ``consume`` (at most up to ``burst``),
+        e.g. when the request is rejected by another bucket.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Backend that keeps the token buckets in memory of the current process."""
+
+    def __init__(self):
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key, rate, burst, cost=1):
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            required = min(cost, burst)
+            if tokens < required:
+                self._buckets[key] = (tokens, now)
+                return (required - tokens) / rate
+            self._buckets[key] = (tokens - cost, now)
+            return 0
+
+    def refund(self, key, rate, burst, cost=1):
+        with self._lock:
+            if key in self._buckets:
+                tokens, updated = self._buckets[key]
+                self._buckets[key] = (min(burst, tokens + cost), updated)
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    Backend that keeps the token buckets in Redis, shared by all processes.
+
+    The Redis URL is read from NOTIFY_INBOX_RATE_LIMIT_REDIS_URL, or CACHE_REDIS_URL
+    if not set. A bucket is updated atomically by a Lua script using the clock of
+    Redis, and expires once it would be full again.
+    """
+
+    SCRIPT = """
+redis.replicate_commands()
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or burst
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local required = math.min(cost, burst)
+local wait = 0
+if tokens < required then
+    wait = (required - tokens) / rate
+else
+    tokens = tokens - cost
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+return tostring(wait)
+"""
+
+    REFUND_SCRIPT = """
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+if not bucket[1] then
+    return 0
+end
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local tokens = math.min(burst, tonumber(bucket[1]) + tonumber(ARGV[3]))
+redis.call('HSET', KEYS[1], 'tokens', tokens)
+redis.call('EXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+return 0
+"""
+
+    key_prefix = 'invenio_notify:rate_limit:'
+
+    def __init__(self):
+        self._scripts = None
+        self._lock = threading.Lock()
+
+    def _get_scripts(self):
+        with self._lock:
+            if self._scripts is None:
+                import redis
+
+                url = (current_app.config.get('NOTIFY_INBOX_RATE_LIMIT_REDIS_URL')
+                       or current_app.config['CACHE_REDIS_URL'])
+                client = redis.StrictRedis.from_url(url)
+                self._scripts = (client.register_script(self.SCRIPT), client.register_script(self.REFUND_SCRIPT))
+            return self._scripts
+
+    def consume(self, key, rate, burst, cost=1):
+        consume_script, _ = self._get_scripts()
+        return float(consume_script(keys=[self.key_prefix + key], args=[rate, burst, cost]))
+
+    def refund(self, key, rate, burst, cost=1):
+        _, refund_script = self._get_scripts()
+        refund_script(keys=[self.key_prefix + key], args=[rate, burst, cost])
+
+
+class InboxRateLimiter:
+    """
+    Check the rate limits of the inbox per API token and per actor.
+
+    The limits are ``(rate, burst)`` tuples read from the config on each check:
+    NOTIFY_INBOX_RATE_LIMIT_PER_TOKEN, NOTIFY_INBOX_RATE_LIMIT_PER_ACTOR and
+    NOTIFY_INBOX_RATE_LIMITS_BY_ACTOR (limits of single actors by actor_id). A
+    limit of None disables it.
+
+    A request is only charged if every bucket allows it: when one bucket rejects
+    it, the tokens already taken from the other buckets are refunded.
+    """
+
+    def __init__(self, backend: RateLimitBackend):
+        self.backend = backend
+
+    def _consume(self, scope, key, limit: Optional[tuple], cost, consumed: list):
+        if not limit:
+            return
+        rate, burst = limit
+        bucket_key = f'{scope}:{key}'
+        wait = self.backend.consume(bucket_key, rate, burst, cost)
+        outcome = 'limited' if wait > 0 else 'allowed'
+        current_notify_metrics.incr('notify_inbox_rate_limit_requests_total', scope=scope, outcome=outcome)
+        if wait > 0:
+            current_app.logger.warning(f'Rate limit of {scope} [{key}] exceeded, retry after {wait:.1f}s')
+            raise RateLimitExceeded(scope, wait)
+        consumed.append((bucket_key, rate, burst, cost))
+
+    def check(self, token_key, actor_ids: Iterable[Optional[str]]):
+        """
+        Take one token per notification from the buckets of the API token and the actors.
+
+        Nothing is taken if the request is rejected.
+
+        Args:
+            token_key: Key of the API token (or user) of the request
+            actor_ids: ``actor.id`` of each notification of the request, None if missing or
+                the user of the request is not a member of the actor
+
+        Raises:
+            RateLimitExceeded: If a bucket is empty
+        """
+        actor_ids = list(actor_ids)
+        config = current_app.config
+        consumed = []
+        try:
+            self._consume('token', token_key, config['NOTIFY_INBOX_RATE_LIMIT_PER_TOKEN'],
+                          max(1, len(actor_ids)), consumed)
+
+            by_actor = config['NOTIFY_INBOX_RATE_LIMITS_BY_ACTOR']
+            for actor_id in sorted({a for a in actor_ids if a}):
+                limit = by_actor.get(actor_id, config['NOTIFY_INBOX_RATE_LIMIT_PER_ACTOR'])
+                self._consume('actor', actor_id, limit, actor_ids.count(actor_id), consumed)
+        except RateLimitExceeded:
+            for bucket_key, rate, burst, cost in consumed:
+                self.backend.refund(bucket_key, rate, burst, cost)
+            raise
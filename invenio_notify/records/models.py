@@ -1,8 +1,9 @@
-from typing import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
 
 from invenio_accounts.models import User
 from invenio_db import db
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, case, or_, func
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import selectinload
 from sqlalchemy_utils.types import JSONType, UUIDType, URLType
@@ -128,11 +129,44 @@ class NotifyInboxModel(db.Model, UTCTimestamp, DbOperationMixin):
     record_id = db.Column(db.Text, nullable=False)
     """ Record ID (e.g. p97a0-c4p20) instead of UUID of the record """
 
+    notification_type = db.Column(db.Text, nullable=True, index=True)
+    """ Supported notification type, extracted from `raw` when the notification is received """
+
+    workflow_status = db.Column(db.Text, nullable=True)
+    """ Workflow status, extracted from `raw` when the notification is received """
+
+    actor_id = db.Column(db.Text, nullable=True, index=True)
+    """ `actor.id` of the COAR notification (ActorModel.actor_id), not the ID of ActorModel """
+
+    in_reply_to = db.Column(db.Text, nullable=True, index=True)
+    """ `inReplyTo` of the COAR notification """
+
+    context_url = db.Column(db.Text, nullable=True)
+    """ `context.id` of the COAR notification, the URL of the record """
+
     process_date = db.Column(db.DateTime, nullable=True)
 
     process_note = db.Column(db.Text, nullable=True)
     """ An additional note (such as error message) after processing """
 
+    claimed_by = db.Column(db.Text, nullable=True)
+    """ Identifier of the worker that claimed the record for processing """
+
+    claimed_at = db.Column(db.DateTime, nullable=True)
+    """ When the record was claimed, the claim expires after the claim timeout """
+
+    attempts = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    """ Number of failed processing attempts """
+
+    next_attempt_at = db.Column(db.DateTime, nullable=True)
+    """ A failed record is not processed again before this time """
+
+    last_error = db.Column(db.Text, nullable=True)
+    """ The error of the last failed processing attempt """
+
+    quarantined_at = db.Column(db.DateTime, nullable=True)
+    """ When the record was quarantined after too many failed attempts, quarantined records are not processed """
+
     user_id = db.Column(
         db.Integer(),
         db.ForeignKey(User.id, ondelete="NO ACTION"),
@@ -144,25 +178,180 @@ class NotifyInboxModel(db.Model, UTCTimestamp, DbOperationMixin):
     )
     """ User ID of the sender """
 
+    __table_args__ = (
+        db.Index(
+            "ix_notify_inbox_unprocessed",
+            "id",
+            postgresql_where=db.text("process_date IS NULL"),
+        ),
+    )
+
     @classmethod
     def unprocessed_records(cls, batch_size=100) -> Iterable["NotifyInboxModel"]:
-        """Generator that yields batches of unprocessed inbox records.
+        """Generator that yields unprocessed inbox records in ascending id order.
+
+        Records are fetched in batches using the last seen id as a watermark
+        (keyset pagination) instead of an OFFSET. Rows that are marked as processed
+        while iterating therefore never shift later batches, and each batch is an
+        index range scan on ``ix_notify_inbox_unprocessed``. Quarantined records and
+        failed records whose next attempt is not due yet are skipped.
 
         Args:
             batch_size: Number of records per batch (default: 100)
 
         Yields:
-            List of NotifyInboxModel instances (up to batch_size per batch)
+            NotifyInboxModel instances, one at a time
         """
-        offset = 0
+        last_id = 0
         while True:
-            query = cls.query.filter(cls.process_date.is_(None))
-            batch = query.offset(offset).limit(batch_size).all()
+            batch = (cls.query
+                     .filter(cls.process_date.is_(None), cls.quarantined_at.is_(None), cls.id > last_id,
+                             or_(cls.next_attempt_at.is_(None),
+                                 cls.next_attempt_at <= datetime.now(timezone.utc)))
+                     .order_by(cls.id.asc())
+                     .limit(batch_size)
+                     .all())
             if not batch:
                 break
             for r in batch:
                 yield r
-            offset += batch_size
+            last_id = batch[-1].id
+
+    @classmethod
+    def claim_unprocessed_records(cls, worker_id, batch_size=100, claim_timeout=600,
+                                  ids=None) -> list["NotifyInboxModel"]:
+        """Claim a batch of unprocessed inbox records for one worker.
+
+        Candidate rows are locked with ``SELECT ... FOR UPDATE SKIP LOCKED``, so
+        concurrent workers never wait on each other and never claim the same rows.
+        The claim is stamped on the rows and committed immediately, which keeps the
+        rows owned by this worker while each record is processed in its own
+        transaction. Claims older than ``claim_timeout`` seconds (e.g. left behind
+        by a crashed worker) can be claimed again, so a worker checks that it
+        still owns each record before processing it, see ``lock_claimed``.
+        Quarantined records and failed records whose next attempt is not due yet
+        are not claimed.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            batch_size: Maximum number of records to claim (default: 100)
+            claim_timeout: Seconds after which a claim expires (default: 600)
+            ids: Optional list of inbox ids, only these records will be claimed
+
+        Returns:
+            List of claimed NotifyInboxModel instances in ascending id order
+        """
+        now = datetime.now(timezone.utc)
+        query = db.session.query(cls.id).filter(
+            cls.process_date.is_(None),
+            cls.quarantined_at.is_(None),
+            or_(cls.next_attempt_at.is_(None), cls.next_attempt_at <= now),
+            or_(cls.claimed_at.is_(None),
+                cls.claimed_at < now - timedelta(seconds=claim_timeout)),
+        )
+        if ids is not None:
+            query = query.filter(cls.id.in_(ids))
+
+        ids = [r[0] for r in (
+            query
+            .order_by(cls.id.asc())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )]
+
+        if ids:
+            (db.session.query(cls)
+             .filter(cls.id.in_(ids))
+             .update({'claimed_by': worker_id, 'claimed_at': now}, synchronize_session=False))
+        db.session.commit()
+
+        if not ids:
+            return []
+        return cls.query.filter(cls.id.in_(ids)).order_by(cls.id.asc()).all()
+
+    @classmethod
+    def lock_claimed(cls, inbox_id, worker_id) -> bool:
+        """Lock an inbox record until the end of the transaction if the worker still owns it.
+
+        A slow worker may lose its claim once it is older than the claim timeout.
+        The record is only locked if it is still claimed by ``worker_id`` and not
+        processed yet, and its claim is renewed. A worker claiming it again skips
+        the locked row until the transaction of the owner ends.
+
+        Args:
+            inbox_id: ID of the inbox record
+            worker_id: Identifier of the worker that claimed the record
+
+        Returns:
+            bool: True if the record is locked, False if another worker claimed or processed it
+        """
+        locked_id = (db.session.query(cls.id)
+                     .filter(cls.id == inbox_id, cls.claimed_by == worker_id, cls.process_date.is_(None))
+                     .with_for_update(skip_locked=True)
+                     .scalar())
+        if locked_id is None:
+            return False
+        (db.session.query(cls)
+         .filter(cls.id == inbox_id)
+         .update({'claimed_at': datetime.now(timezone.utc)}, synchronize_session=False))
+        return True
+
+    @classmethod
+    def queue_stats(cls) -> dict:
+        """Get the state of the queue of unprocessed inbox records.
+
+        Returns:
+            dict: ``depth`` (unprocessed, not quarantined records), ``oldest_created``
+            (creation date of the oldest of them or None) and ``quarantined``
+        """
+        depth, oldest_created, quarantined = (
+            db.session.query(
+                func.count().filter(cls.quarantined_at.is_(None)),
+                func.min(cls.created).filter(cls.quarantined_at.is_(None)),
+                func.count().filter(cls.quarantined_at.isnot(None)),
+            )
+            .filter(cls.process_date.is_(None))
+            .one()
+        )
+        return {'depth': depth, 'oldest_created': oldest_created, 'quarantined': quarantined}
+
+    @classmethod
+    def insert_many(cls, rows: list[dict], chunk_size=500) -> dict[str, int]:
+        """Insert inbox records with multi-row inserts, skipping notification IDs that already exist.
+
+        ``INSERT ... ON CONFLICT (notification_id) DO NOTHING RETURNING id`` turns a
+        duplicate into a no-op instead of a unique violation, so the transaction
+        stays usable and concurrent inserts of the same notification do not fail.
+        The records are not loaded into the session.
+
+        Args:
+            rows: Column values of the inbox records
+            chunk_size: Maximum number of rows per insert statement (default: 500)
+
+        Returns:
+            dict: IDs of the inserted inbox records by notification ID, duplicates are not included
+        """
+        columns = {k for row in rows for k in row}
+        rows = [{k: row.get(k) for k in columns} for row in rows]
+        ids = {}
+        with db.session.begin_nested():
+            for i in range(0, len(rows), chunk_size):
+                stmt = (postgresql.insert(cls.__table__)
+                        .values(rows[i:i + chunk_size])
+                        .on_conflict_do_nothing(index_elements=[cls.notification_id])
+                        .returning(cls.id, cls.notification_id))
+                ids.update({notification_id: id_ for id_, notification_id in db.session.execute(stmt)})
+        return ids
+
+    @classmethod
+    def insert_if_absent(cls, data: dict) -> Optional[int]:
+        """Insert an inbox record, see ``insert_many``.
+
+        Returns:
+            int: ID of the inserted inbox record, None if the notification ID already exists
+        """
+        return cls.insert_many([data]).get(data['notification_id'])
 
 
 class ActorMapModel(db.Model, UTCTimestamp, DbOperationMixin):
@@ -239,6 +428,9 @@ class ActorModel(db.Model, UTCTimestamp, DbOperationMixin):
 
     endorsements = db.relationship("EndorsementModel", back_populates="actor")
 
+    circuit = db.relationship("ActorCircuitModel", uselist=False, viewonly=True)
+    """ Circuit breaker of the inbox of the actor, None if no delivery failed yet """
+
     @classmethod
     def has_member_with_email(cls, email, actor_id) -> bool:
         """Check if a user with given email is a member of an actor with the given actor_id.
@@ -274,6 +466,26 @@ class ActorModel(db.Model, UTCTimestamp, DbOperationMixin):
                   .first())
         return result is not None
 
+    @classmethod
+    def find_memberships(cls, user_ids, actor_ids) -> set[tuple]:
+        """Find which of the given users are members of which of the given actors.
+
+        Args:
+            user_ids: IDs of the users
+            actor_ids: The actor_ids of the actors
+
+        Returns:
+            set: (user_id, actor_id) pairs of existing memberships
+        """
+        if not user_ids or not actor_ids:
+            return set()
+
+        rows = (db.session.query(ActorMapModel.user_id, cls.actor_id)
+                .join(cls, ActorMapModel.actor_id == cls.id)
+                .filter(ActorMapModel.user_id.in_(user_ids), cls.actor_id.in_(actor_ids))
+                .all())
+        return {(user_id, actor_id) for user_id, actor_id in rows}
+
     @classmethod
     def has_available_actors(cls, record_id) -> bool:
         """Check if there are any available actors for endorsement requests.
@@ -286,34 +498,6 @@ class ActorModel(db.Model, UTCTimestamp, DbOperationMixin):
             bool: True if there are available actors, False otherwise
         """
         
-        # Subquery to get latest endorsement by creation date
-        latest_endorsement = (
-            db.session.query(
-                EndorsementModel.actor_id,
-                EndorsementModel.review_type,
-                func.row_number().over(
-                    partition_by=EndorsementModel.actor_id,
-                    order_by=EndorsementModel.created.desc()
-                ).label('rn')
-            )
-            .filter(EndorsementModel.record_id == record_id)
-            .subquery()
-        )
-        
-        # Subquery to get latest endorsement request status
-        latest_request = (
-            db.session.query(
-                EndorsementRequestModel.actor_id,
-                EndorsementRequestModel.latest_status,
-                func.row_number().over(
-                    partition_by=EndorsementRequestModel.actor_id,
-                    order_by=EndorsementRequestModel.created.desc()
-                ).label('rn')
-            )
-            .filter(EndorsementRequestModel.record_id == record_id)
-            .subquery()
-        )
-        
         # Check if there's at least one available actor
         available_actor = (
             db.session.query(cls.id)
@@ -324,21 +508,14 @@ class ActorModel(db.Model, UTCTimestamp, DbOperationMixin):
                 )
             )
             .outerjoin(
-                latest_endorsement,
+                RecordActorStatusModel,
                 and_(
-                    latest_endorsement.c.actor_id == cls.id,
-                    latest_endorsement.c.rn == 1
-                )
-            )
-            .outerjoin(
-                latest_request,
-                and_(
-                    latest_request.c.actor_id == cls.id,
-                    latest_request.c.rn == 1
+                    RecordActorStatusModel.actor_id == cls.id,
+                    RecordActorStatusModel.record_id == record_id,
                 )
             )
             .filter(
-                latest_endorsement.c.review_type.is_(None)
+                RecordActorStatusModel.endorsement_type.is_(None)
             )
             .first()
         )
@@ -352,6 +529,9 @@ class ActorModel(db.Model, UTCTimestamp, DbOperationMixin):
               2. Have inbox_api_token configured
               3. Either have no endorsements OR have endorsements that aren't completed types,
                  endorsement are sorted by created date descending
+
+        An actor that could be requested but whose inbox circuit breaker is open is
+        reported with the status ``unavailable``.
         
         Args:
             record_id: UUID of the record
@@ -360,40 +540,13 @@ class ActorModel(db.Model, UTCTimestamp, DbOperationMixin):
             list: List of actor dictionaries with actor_id, actor_name, and status
         """
         
-        # Subquery to get latest endorsement by creation date
-        latest_endorsement = (
-            db.session.query(
-                EndorsementModel.actor_id,
-                EndorsementModel.review_type,
-                func.row_number().over(
-                    partition_by=EndorsementModel.actor_id,
-                    order_by=EndorsementModel.created.desc()
-                ).label('rn')
-            )
-            .filter(EndorsementModel.record_id == record_id)
-            .subquery()
-        )
-        
-        # Subquery to get latest endorsement request status
-        latest_request = (
-            db.session.query(
-                EndorsementRequestModel.actor_id,
-                EndorsementRequestModel.latest_status,
-                func.row_number().over(
-                    partition_by=EndorsementRequestModel.actor_id,
-                    order_by=EndorsementRequestModel.created.desc()
-                ).label('rn')
-            )
-            .filter(EndorsementRequestModel.record_id == record_id)
-            .subquery()
-        )
-        
-        # Main query with exclusion filter
+        # Main query with exclusion filter, the latest statuses are looked up in record_actor_status
         query = (
             db.session.query(
                 cls.id.label('actor_id'),
                 cls.name.label('actor_name'),
-                latest_request.c.latest_status.label('request_status'),
+                RecordActorStatusModel.request_status.label('request_status'),
+                (ActorCircuitModel.open_until > datetime.now(timezone.utc)).label('circuit_open'),
             )
             .filter(
                 and_(
@@ -401,22 +554,16 @@ class ActorModel(db.Model, UTCTimestamp, DbOperationMixin):
                     cls.inbox_api_token.isnot(None)
                 )
             )
+            .outerjoin(ActorCircuitModel, ActorCircuitModel.actor_id == cls.id)
             .outerjoin(
-                latest_endorsement,
-                and_(
-                    latest_endorsement.c.actor_id == cls.id,
-                    latest_endorsement.c.rn == 1
-                )
-            )
-            .outerjoin(
-                latest_request,
+                RecordActorStatusModel,
                 and_(
-                    latest_request.c.actor_id == cls.id,
-                    latest_request.c.rn == 1
+                    RecordActorStatusModel.actor_id == cls.id,
+                    RecordActorStatusModel.record_id == record_id,
                 )
             )
             .filter(
-                latest_endorsement.c.review_type.is_(None)
+                RecordActorStatusModel.endorsement_type.is_(None)
             )
         )
         
@@ -424,15 +571,124 @@ class ActorModel(db.Model, UTCTimestamp, DbOperationMixin):
         actors = []
         
         for result in results:
+            status = result.request_status or WORKFLOW_STATUS_AVAILABLE
+            if result.circuit_open and status in (WORKFLOW_STATUS_AVAILABLE, constants.WORKFLOW_STATUS_TENTATIVE_REJECT):
+                status = constants.WORKFLOW_STATUS_UNAVAILABLE
             actors.append({
                 "actor_id": result.actor_id,
                 "actor_name": result.actor_name,
-                "status": result.request_status or WORKFLOW_STATUS_AVAILABLE,
+                "status": status,
             })
         
         return actors
 
 
+class ActorCircuitModel(db.Model, UTCTimestamp, DbOperationMixin):
+    """
+    Circuit breaker state of the inbox of an actor, see ``invenio_notify.circuit_breaker``.
+
+    The circuit is open until ``open_until``, half-open after it (one probe
+    request is let through) and closed once a request succeeds.
+    """
+    __tablename__ = "notify_actor_circuit"
+
+    actor_id = db.Column(
+        db.Integer,
+        db.ForeignKey("notify_actor.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    failures = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    """ Number of consecutive failed requests to the inbox """
+
+    open_until = db.Column(db.DateTime, nullable=True)
+    """ No request is sent to the inbox before this time, None if the circuit is closed """
+
+    last_failure_at = db.Column(db.DateTime, nullable=True)
+
+    last_error = db.Column(db.Text, nullable=True)
+    """ The error of the last failed request """
+
+    probe_started_at = db.Column(db.DateTime, nullable=True)
+    """ Time the probe request of the half-open circuit was claimed, None once its outcome is recorded """
+
+    @property
+    def state(self) -> str:
+        return self.state_of(self.open_until)
+
+    @staticmethod
+    def state_of(open_until) -> str:
+        """State of a circuit that is open until ``open_until``."""
+        if open_until is None:
+            return constants.CIRCUIT_CLOSED
+        if open_until.replace(tzinfo=None) > datetime.now(timezone.utc).replace(tzinfo=None):
+            return constants.CIRCUIT_OPEN
+        return constants.CIRCUIT_HALF_OPEN
+
+    @classmethod
+    def get_open_until(cls, actor_id):
+        """Get ``open_until`` of the circuit of an actor from the database, None if it is closed."""
+        return db.session.query(cls.open_until).filter(cls.actor_id == actor_id).scalar()
+
+    @classmethod
+    def record_failure(cls, actor_id, error: str, failure_threshold: int, reset_timeout: float) -> tuple[int, bool]:
+        """Count a failed request to the inbox of an actor and open the circuit at ``failure_threshold`` failures.
+
+        Returns:
+            tuple: (consecutive failures, True if the circuit is open)
+        """
+        now = datetime.now(timezone.utc)
+        open_until = now + timedelta(seconds=reset_timeout)
+        failures = cls.__table__.c.failures + 1
+        stmt = postgresql.insert(cls.__table__).values(
+            actor_id=actor_id, failures=1, last_failure_at=now, last_error=error,
+            open_until=open_until if failure_threshold <= 1 else None, created=now, updated=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.actor_id],
+            set_={
+                'failures': failures,
+                'open_until': case((failures >= failure_threshold, open_until),
+                                   else_=cls.__table__.c.open_until),
+                'last_failure_at': now,
+                'last_error': error,
+                'probe_started_at': None,
+                'updated': now,
+            },
+        ).returning(cls.__table__.c.failures, cls.__table__.c.open_until)
+        failures, open_until = db.session.execute(stmt).one()
+        return failures, open_until is not None
+
+    @classmethod
+    def record_success(cls, actor_id) -> bool:
+        """Close the circuit of an actor, True if it had failures."""
+        return (db.session.query(cls)
+                .filter(cls.actor_id == actor_id, or_(cls.failures > 0, cls.open_until.isnot(None)))
+                .update({'failures': 0, 'open_until': None, 'probe_started_at': None},
+                        synchronize_session=False)) > 0
+
+    @classmethod
+    def claim_probe(cls, actor_id, reset_timeout: float) -> bool:
+        """Claim the probe request of a half-open circuit.
+
+        ``open_until`` is pushed ``reset_timeout`` seconds ahead if it has passed,
+        so only one caller gets to probe the inbox, the others still see the
+        circuit open. Like the claims of inbox records and endorsement requests,
+        the claim is committed immediately: the row is not locked while the probe
+        request is sent, and its outcome is recorded in a later transaction.
+
+        Returns:
+            bool: True if the caller may send the probe request
+        """
+        now = datetime.now(timezone.utc)
+        claimed = (db.session.query(cls)
+                   .filter(cls.actor_id == actor_id, cls.open_until <= now)
+                   .update({'open_until': now + timedelta(seconds=reset_timeout), 'probe_started_at': now},
+                           synchronize_session=False))
+        db.session.commit()
+        return claimed > 0
+
+
 class EndorsementModel(db.Model, UTCTimestamp, DbOperationMixin):
     """
     Endorsement data for the record
@@ -509,7 +765,25 @@ class EndorsementModel(db.Model, UTCTimestamp, DbOperationMixin):
         return (
             db.session.query(cls)
             .join(RDMRecordMetadata, cls.record_id == RDMRecordMetadata.id)
-            .options(selectinload(cls.record))
+            .filter(RDMRecordMetadata.parent_id == parent_id)
+        )
+
+    @classmethod
+    def query_with_record_index_by_parent_id(cls, parent_id):
+        """Get all endorsements for a parent's children with the version index of their record.
+
+        Only the index column of the records is selected, not their JSON.
+
+        Args:
+            parent_id: The UUID of the parent record
+
+        Returns:
+            Query of (endorsement, record index) tuples
+        """
+        return (
+            db.session.query(cls, RDMRecordMetadata.index)
+            .join(RDMRecordMetadata, cls.record_id == RDMRecordMetadata.id)
+            .options(selectinload(cls.actor))
             .filter(RDMRecordMetadata.parent_id == parent_id)
         )
 
@@ -555,8 +829,80 @@ class EndorsementRequestModel(db.Model, UTCTimestamp, DbOperationMixin):
     """ Latest status, e.g., 'coar-notify:EndorsementAction', 'Request Endorsement', 'Reject', 'Announce Endorsement'
         This field is updated when a reply is received."""
 
+    delivery_status = db.Column(db.Text, nullable=False, default=constants.DELIVERY_STATUS_PENDING)
+    """ Delivery to the inbox of the actor: 'pending', 'delivered' or 'failed' """
+
+    delivery_attempts = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    """ Number of failed delivery attempts """
+
+    next_delivery_at = db.Column(db.DateTime, nullable=True)
+    """ A pending request is not delivered before this time """
+
+    last_delivery_error = db.Column(db.Text, nullable=True)
+    """ The error of the last failed delivery attempt """
+
+    delivered_at = db.Column(db.DateTime, nullable=True)
+    """ When the actor inbox accepted the request """
+
     replies = db.relationship("EndorsementReplyModel", back_populates="endorsement_request")
 
+    __table_args__ = (
+        db.Index(
+            "ix_endorsement_request_pending_delivery",
+            "next_delivery_at",
+            postgresql_where=db.text("delivery_status = 'pending'"),
+        ),
+    )
+
+    @classmethod
+    def claim_pending_deliveries(cls, batch_size=100, claim_timeout=120,
+                                 ids=None) -> list["EndorsementRequestModel"]:
+        """Claim a batch of endorsement requests whose delivery is due.
+
+        Candidate rows are locked with ``SELECT ... FOR UPDATE SKIP LOCKED`` and
+        their ``next_delivery_at`` is pushed ``claim_timeout`` seconds ahead before
+        the claim is committed, so concurrent workers never deliver the same
+        request twice, and a request left behind by a crashed worker is due again
+        once the claim expires.
+
+        Args:
+            batch_size: Maximum number of requests to claim (default: 100)
+            claim_timeout: Seconds after which a claim expires (default: 120)
+            ids: Optional list of request ids, only these requests will be claimed
+
+        Returns:
+            List of claimed EndorsementRequestModel instances in ascending id order
+        """
+        now = datetime.now(timezone.utc)
+        query = db.session.query(cls.id).filter(
+            cls.delivery_status == constants.DELIVERY_STATUS_PENDING,
+            cls.next_delivery_at <= now,
+        )
+        if ids is not None:
+            query = query.filter(cls.id.in_(ids))
+
+        ids = [r[0] for r in (
+            query
+            .order_by(cls.id.asc())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )]
+
+        if ids:
+            (db.session.query(cls)
+             .filter(cls.id.in_(ids))
+             .update({'next_delivery_at': now + timedelta(seconds=claim_timeout)}, synchronize_session=False))
+        db.session.commit()
+
+        if not ids:
+            return []
+        return (cls.query
+                .options(selectinload(cls.actor))
+                .filter(cls.id.in_(ids))
+                .order_by(cls.id.asc())
+                .all())
+
     @classmethod
     def get_latest_status(cls, record_id, actor_id, include_id=False):
         """Get latest endorsement request status for record and actor.
@@ -572,12 +918,13 @@ class EndorsementRequestModel(db.Model, UTCTimestamp, DbOperationMixin):
             tuple: (status, reply_notification_id) if include_id=True
             None: if no request found
         """
-        # Get the latest endorsement request
+        # Get the latest endorsement request, requests that could not be delivered don't count
         request = (
             cls.query.filter_by(
                 record_id=record_id,
                 actor_id=actor_id,
             )
+            .filter(cls.delivery_status != constants.DELIVERY_STATUS_FAILED)
             .order_by(cls.created.desc())
             .first()
         )
@@ -660,3 +1007,116 @@ class EndorsementReplyModel(db.Model, UTCTimestamp, DbOperationMixin):
 
     message = db.Column(db.Text, nullable=True)
     """ Message of the reply, can be empty """
+
+
+class RecordActorStatusModel(db.Model, UTCTimestamp, DbOperationMixin):
+    """
+    Latest workflow status of a record with each actor.
+
+    Materialized from ``endorsement``, ``endorsement_request`` and
+    ``endorsement_reply``, so the availability of the actors of a record is one
+    indexed lookup instead of window functions over these tables. The rows are
+    maintained incrementally when endorsements, requests and replies are
+    created, and recomputed with ``refresh`` when they are deleted or changed
+    otherwise (e.g. a request that could not be delivered).
+    """
+
+    __tablename__ = "record_actor_status"
+
+    record_id = db.Column(UUIDType, db.ForeignKey(
+        RDMRecordMetadata.id, ondelete="CASCADE",
+    ), primary_key=True)
+
+    actor_id = db.Column(
+        db.Integer,
+        db.ForeignKey("notify_actor.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+    endorsement_type = db.Column(db.Text, nullable=True)
+    """ review_type of the latest endorsement, None if the actor did not endorse or review the record """
+
+    request_id = db.Column(
+        db.Integer,
+        db.ForeignKey("endorsement_request.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    """ The latest endorsement request that was not failed to be delivered """
+
+    request_status = db.Column(db.Text, nullable=True)
+    """ latest_status of the latest endorsement request """
+
+    reply_notification_id = db.Column(db.Text, nullable=True)
+    """ Notification ID of the latest reply with the status of the latest request (``inReplyTo`` of a new request) """
+
+    @classmethod
+    def _upsert(cls, record_id, actor_id, values: dict):
+        now = datetime.now(timezone.utc)
+        stmt = postgresql.insert(cls.__table__).values(
+            record_id=record_id, actor_id=actor_id, created=now, updated=now, **values,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[cls.record_id, cls.actor_id],
+            set_={**values, 'updated': now},
+        )
+        db.session.execute(stmt)
+
+    @classmethod
+    def set_endorsement(cls, record_id, actor_id, endorsement_type):
+        """Set the latest endorsement, called when an endorsement is created."""
+        cls._upsert(record_id, actor_id, {'endorsement_type': endorsement_type})
+
+    @classmethod
+    def set_request(cls, record_id, actor_id, request_id, request_status):
+        """Set the latest endorsement request, called when a request is created."""
+        cls._upsert(record_id, actor_id, {
+            'request_id': request_id,
+            'request_status': request_status,
+            'reply_notification_id': None,
+        })
+
+    @classmethod
+    def set_reply(cls, record_id, actor_id, request_id, request_status, reply_notification_id):
+        """Set the status of a reply, if it replies to the latest endorsement request."""
+        (db.session.query(cls)
+         .filter(cls.record_id == record_id, cls.actor_id == actor_id, cls.request_id == request_id)
+         .update({'request_status': request_status, 'reply_notification_id': reply_notification_id},
+                 synchronize_session=False))
+
+    @classmethod
+    def get_statuses(cls, record_id, actor_ids: Iterable[int]) -> dict:
+        """Get the status rows of a record with each of the actors, actors without row are not included."""
+        rows = cls.query.filter(cls.record_id == record_id, cls.actor_id.in_(list(actor_ids))).all()
+        return {row.actor_id: row for row in rows}
+
+    @classmethod
+    def refresh(cls, record_id, actor_id):
+        """Recompute the status of a record with an actor from the endorsement tables."""
+        endorsement_type = EndorsementModel.get_latest_status(record_id, actor_id)
+        request = (EndorsementRequestModel.query
+                   .filter_by(record_id=record_id, actor_id=actor_id)
+                   .filter(EndorsementRequestModel.delivery_status != constants.DELIVERY_STATUS_FAILED)
+                   .order_by(EndorsementRequestModel.created.desc())
+                   .first())
+        if endorsement_type is None and request is None:
+            cls.query.filter_by(record_id=record_id, actor_id=actor_id).delete(synchronize_session=False)
+            return
+
+        reply_notification_id = None
+        if request is not None:
+            reply_notification_id = (
+                EndorsementReplyModel.query
+                .filter_by(endorsement_request_id=request.id, status=request.latest_status)
+                .join(NotifyInboxModel, EndorsementReplyModel.inbox_id == NotifyInboxModel.id)
+                .order_by(EndorsementReplyModel.created.desc())
+                .with_entities(NotifyInboxModel.notification_id)
+                .limit(1)
+                .scalar()
+            )
+        cls._upsert(record_id, actor_id, {
+            'endorsement_type': endorsement_type,
+            'request_id': request.id if request else None,
+            'request_status': request.latest_status if request else None,
+            'reply_notification_id': reply_notification_id,
+        })
@@ -6,6 +6,8 @@ from invenio_records_resources.resources import (
 )
 from invenio_records_resources.services.base.config import ConfiguratorMixin
 
+from invenio_notify.resources.deserializers import NDJSONDeserializer
+
 
 class BasicSearchRequestArgsSchema(SearchRequestArgsSchema):
     """Common search request parameters for basic resources."""
@@ -64,9 +66,12 @@ class InboxApiResourceConfig(RecordResourceConfig):
     url_prefix = ""  # No prefix needed as route is defined directly
     
     json_parser = RequestBodyParser(JSONDeserializer())
+    ndjson_parser = RequestBodyParser(NDJSONDeserializer())
     request_body_parsers = {
         "application/json": json_parser,
         "application/ld+json": json_parser,
+        "application/x-ndjson": ndjson_parser,
+        "application/ndjson": ndjson_parser,
     }
 
 
@@ -77,6 +82,7 @@ class EndorsementRequestResourceConfig(ResourceConfig, ConfiguratorMixin):
 
     routes = {
         'send': '/send/<path:pid_value>',
+        'send_many': '/send-many/<path:pid_value>',
         'actors': '/actors/<path:pid_value>',
     }
 
@@ -0,0 +1,23 @@
+import json
+
+from flask_resources.deserializers import DeserializerMixin
+
+from invenio_notify.errors import BadRequestError
+
+
+class NDJSONDeserializer(DeserializerMixin):
+    """Deserialize newline delimited JSON (one JSON document per line) into a list."""
+
+    def deserialize(self, data):
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+
+        items = []
+        for line_no, line in enumerate(data.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError as e:
+                raise BadRequestError(f'Invalid JSON on line {line_no}: {e}')
+        return items
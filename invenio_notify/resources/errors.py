@@ -6,7 +6,8 @@ from flask_resources import HTTPJSONException, create_error_handler
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_records_resources.errors import validation_error_to_list_errors
 
-from invenio_notify.errors import NotExistsError, SendRequestFail, BadRequestError
+from invenio_notify.errors import NotExistsError, SendRequestFail, BadRequestError, DuplicateNotificationError
+from invenio_notify.rate_limit import RateLimitExceeded
 
 
 def create_description(e, description_fn=None):
@@ -38,6 +39,19 @@ class HTTPJSONValidationException(HTTPJSONException):
         super().__init__(code=400, errors=validation_error_to_list_errors(exception))
 
 
+class HTTPJSONRateLimitException(HTTPJSONException):
+    """HTTP 429 exception serializing to JSON with a Retry-After header."""
+
+    def __init__(self, exception):
+        """Constructor."""
+        super().__init__(code=429, description=exception.description)
+        self.retry_after = exception.retry_after
+
+    def get_headers(self, environ=None, scope=None):
+        """Get a list of headers."""
+        return [*super().get_headers(environ, scope), ("Retry-After", str(self.retry_after))]
+
+
 class ErrorHandlersMixin:
     """Mixin to define error handlers."""
 
@@ -47,6 +61,7 @@ class ErrorHandlersMixin:
             lambda e: HTTPJSONValidationException(e)
         ),
         ValueError: create_error_handler_with_json(400),
+        DuplicateNotificationError: create_error_handler_with_json(400),
     }
 
 
@@ -60,4 +75,7 @@ class ApiErrorHandlersMixin(ErrorHandlersMixin):
         PIDDoesNotExistError: create_error_handler_with_json(404, 'Record not found'),
         sqlalchemy.orm.exc.NoResultFound: create_error_handler_with_json(404, 'Data not found'),
         BadRequestError: create_error_handler_with_json(400),
+        RateLimitExceeded: create_error_handler(
+            lambda e: HTTPJSONRateLimitException(e)
+        ),
     }
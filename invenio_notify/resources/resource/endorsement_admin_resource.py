@@ -10,7 +10,8 @@ from invenio_records_resources.resources.records.resource import (
 
 from invenio_rdm_records.proxies import current_rdm_records_service
 from .basic_db_resource import BasicDbResource
-from ...records.models import EndorsementModel, EndorsementReplyModel, EndorsementRequestModel
+from ...records.models import EndorsementModel, EndorsementReplyModel, EndorsementRequestModel, \
+    RecordActorStatusModel
 from ...utils import record_utils
 
 
@@ -41,6 +42,7 @@ class EndorsementAdminResource(BasicDbResource):
 
             if endo_reply:
                 delete_endo_reply_with_status(endo_reply)
+            refresh_record_actor_status(result[0]['record_id'], result[0]['actor_id'])
         return result
 
     @classmethod
@@ -53,3 +55,8 @@ class EndorsementAdminResource(BasicDbResource):
 def delete_endo_reply_with_status(endo_reply, uow=None):
     EndorsementReplyModel.query.filter_by(id=endo_reply.id).delete()
     EndorsementRequestModel.update_latest_status_by_request_id(endo_reply.endorsement_request_id)
+
+
+@unit_of_work()
+def refresh_record_actor_status(record_id, actor_id, uow=None):
+    RecordActorStatusModel.refresh(record_id, actor_id)
@@ -1,4 +1,5 @@
-import requests
+from datetime import datetime, timezone
+
 from flask import g, current_app
 from flask_resources import (
     Resource,
@@ -9,6 +10,7 @@ from flask_resources import (
 from invenio_access.permissions import system_identity
 from invenio_accounts.models import User
 from invenio_db.uow import unit_of_work
+from invenio_records_resources.services.uow import TaskOp
 from invenio_records_resources.resources.records.resource import (
     request_data,
     request_view_args,
@@ -16,8 +18,9 @@ from invenio_records_resources.resources.records.resource import (
 from invenio_records_resources.services.records.results import RecordItem
 
 from invenio_notify import constants
-from invenio_notify.errors import SendRequestFail, BadRequestError
-from invenio_notify.records.models import ActorModel, EndorsementRequestModel, EndorsementModel
+from invenio_notify.errors import BadRequestError
+from invenio_notify.records.models import ActorModel, EndorsementRequestModel, RecordActorStatusModel
+from invenio_notify.tasks import shared_task_deliver_endorsement_request
 from invenio_notify.utils import record_utils
 from invenio_notify.utils.endorsement_request_utils import (
     create_endorsement_request_data,
@@ -41,9 +44,45 @@ def validate_owner_id(record: RDMRecord, user_id):
         raise BadRequestError('User is not the owner of this record')
 
 
+def validate_actor_available(actor: ActorModel, endorsement_status, request_status):
+    """Check if an endorsement can be requested from the actor.
+
+    Args:
+        actor: ActorModel instance
+        endorsement_status: Latest endorsement status of the record by the actor
+        request_status: Latest endorsement request status of the record to the actor
+
+    Raises:
+        BadRequestError: If the actor is not available for endorsement request
+    """
+    if not actor.inbox_url or not actor.inbox_api_token:
+        raise BadRequestError('Actor not available for endorsement request')
+
+    # First check if there's an actual endorsement
+    if endorsement_status:
+        raise BadRequestError('Actor not available for endorsement request')
+
+    # If there is a previous request, only allow if the status is TentativeReject
+    if request_status and request_status != constants.WORKFLOW_STATUS_TENTATIVE_REJECT:
+        raise BadRequestError('Actor not available for endorsement request')
+
+
+def endorsement_request_result(actor_id, status, msg, notification_id=None) -> dict:
+    """Result of one actor of a multi-actor endorsement request."""
+    return {
+        "actor_id": actor_id,
+        "status": status,
+        "message": msg,
+        "notification_id": notification_id,
+    }
+
+
 @unit_of_work()
 def create_endorsement_request_record(endorsement_request_data, record_id, user_id, actor_id, uow=None):
     """Create endorsement request database record.
+
+    The request is pending delivery, it is sent to the actor inbox by a Celery
+    task scheduled after the commit.
     
     Args:
         endorsement_request_data: Dictionary containing endorsement request data
@@ -54,56 +93,38 @@ def create_endorsement_request_record(endorsement_request_data, record_id, user_
     Returns:
         EndorsementRequestModel: The created endorsement request record
     """
-    return EndorsementRequestModel.create({
+    endorsement_request = EndorsementRequestModel.create({
         "notification_id": endorsement_request_data["id"],
         "record_id": record_id,
         "user_id": user_id,
         "actor_id": actor_id,
         "raw": endorsement_request_data,
         "latest_status": constants.WORKFLOW_STATUS_REQUEST_ENDORSEMENT,
+        "delivery_status": constants.DELIVERY_STATUS_PENDING,
+        "next_delivery_at": datetime.now(timezone.utc),
     })
+    RecordActorStatusModel.set_request(record_id, actor_id, endorsement_request.id,
+                                       constants.WORKFLOW_STATUS_REQUEST_ENDORSEMENT)
+    uow.register(TaskOp(shared_task_deliver_endorsement_request, endorsement_request.id))
+    return endorsement_request
 
 
-def send_to_actor_inbox(actor, endorsement_request_data: dict):
-    """Send endorsement request to actor's inbox.
-    
+@unit_of_work()
+def create_endorsement_request_records(payloads, record_id, user_id, uow=None):
+    """Create endorsement request database records of several actors in one transaction.
+
     Args:
-        actor: ActorModel instance
-        endorsement_request_data: Dictionary containing endorsement request data
-        
+        payloads: List of (actor_id, endorsement_request_data) tuples
+        record_id: ID of the record
+        user_id: ID of the user making the requests
+
     Returns:
-        str: Error message if validation fails, None if successful
+        list: The created EndorsementRequestModel records
     """
-    if not actor.inbox_url:
-        current_app.logger.error(
-            f'Actor inbox URL is not configured for actor {actor.id} url[{actor.inbox_url}]'
-        )
-        raise ValueError('Actor inbox URL is not configured')
-
-    try:
-        response = requests.post(
-            actor.inbox_url,
-            json=endorsement_request_data,
-            headers={
-                'Content-Type': 'application/ld+json',
-                'Authorization': f'Bearer {actor.inbox_api_token}',
-            },
-            timeout=30
-        )
-
-    except requests.exceptions.RequestException as e:
-        current_app.logger.error(f'Failed to send request to actor inbox: {e}')
-        raise SendRequestFail('Failed to send request')
-
-    if response.status_code not in {200, 201, 202}:
-        current_app.logger.warning(
-            f'Actor inbox request failed with '
-            f'status code [{response.status_code}] for actor [{actor.inbox_url}]'
-            f' -- {response.text}'
-        )
-        raise SendRequestFail('Actor reply invalid request', status=response.status_code)
-
-    return None
+    return [
+        create_endorsement_request_record(endorsement_request_data, record_id, user_id, actor_id, uow=uow)
+        for actor_id, endorsement_request_data in payloads
+    ]
 
 
 class EndorsementRequestResource(ApiErrorHandlersMixin, Resource):
@@ -117,6 +138,7 @@ class EndorsementRequestResource(ApiErrorHandlersMixin, Resource):
         """Create the URL rules for the endorsement request resource."""
         return [
             route("POST", self.config.routes["send"], self.send, ),
+            route("POST", self.config.routes["send_many"], self.send_many, ),
             route("GET", self.config.routes["actors"], self.list_actors, ),
         ]
 
@@ -147,21 +169,19 @@ class EndorsementRequestResource(ApiErrorHandlersMixin, Resource):
 
         record_id = record._record.model.id
 
-        # First check if there's an actual endorsement
-        status = EndorsementModel.get_latest_status(record_id, actor_id)
-        if status:
-            raise BadRequestError(f'Actor not available for endorsement request')
-
-        # If no endorsement, check endorsement request status
-        status = EndorsementRequestModel.get_latest_status(record_id, actor_id)
-
-        # If there is a previous request, only allow if the status is TentativeReject
-        if status and status != constants.WORKFLOW_STATUS_TENTATIVE_REJECT:
-            raise BadRequestError(f'Actor not available for endorsement request')
+        status = RecordActorStatusModel.get_statuses(record_id, [actor_id]).get(actor_id)
+        latest_request_status = (status.request_status, status.reply_notification_id) if status else (None, None)
+        validate_actor_available(
+            actor,
+            status.endorsement_type if status else None,
+            latest_request_status[0],
+        )
 
-        endorsement_request_data = create_endorsement_request_data(user, record, actor)
-        send_to_actor_inbox(actor, endorsement_request_data)
+        endorsement_request_data = create_endorsement_request_data(
+            user, record, actor, latest_request_status=latest_request_status,
+        )
 
+        # the request is delivered to the actor inbox in the background
         try:
             create_endorsement_request_record(endorsement_request_data, record._record.model.id, user.id, actor_id)
             current_app.logger.info(f'Created endorsement request record for actor {actor_id}')
@@ -171,6 +191,78 @@ class EndorsementRequestResource(ApiErrorHandlersMixin, Resource):
 
         return {'is_success': 1, 'message': 'Request Accepted'}, 200
 
+    @request_view_args
+    @request_data
+    @response_handler()
+    def send_many(self):
+        """Send endorsement requests to several actors at once.
+
+        The record, the owner and the statuses of all actors (one lookup in
+        ``record_actor_status``) are checked once,
+        the requests are stored in one transaction and delivered to the actor
+        inboxes concurrently by the delivery tasks (one per request).
+
+        Returns:
+            dict: Number of accepted and rejected actors, and the result of each actor
+        """
+        data = resource_requestctx.data
+        pid_value = resource_requestctx.view_args["pid_value"]
+
+        actor_ids = (data or {}).get('actor_ids')
+        if not isinstance(actor_ids, list) or not actor_ids:
+            raise BadRequestError('actor_ids is required')
+        if not all(isinstance(a, int) and not isinstance(a, bool) for a in actor_ids):
+            raise BadRequestError('actor_ids must be a list of integers')
+        actor_ids = list(dict.fromkeys(actor_ids))
+        max_actors = current_app.config['NOTIFY_ENDORSEMENT_REQUEST_MAX_ACTORS']
+        if len(actor_ids) > max_actors:
+            raise BadRequestError(f'Too many actors, at most {max_actors} per request')
+        if g.identity is None or g.identity.id is None:
+            raise BadRequestError('User identity is required')
+
+        record: RecordItem = record_utils.read_record_item(system_identity, pid_value)
+        user = User.query.get(g.identity.id)
+
+        validate_owner_id(record._record, user.id)
+
+        record_id = record._record.model.id
+        actors = {a.id: a for a in ActorModel.query.filter(ActorModel.id.in_(actor_ids))}
+        statuses = RecordActorStatusModel.get_statuses(record_id, actor_ids)
+
+        results = {}
+        payloads = []
+        for actor_id in actor_ids:
+            actor = actors.get(actor_id)
+            if actor is None:
+                results[actor_id] = endorsement_request_result(actor_id, 'rejected', 'Actor not found')
+                continue
+            status = statuses.get(actor_id)
+            latest_request_status = (status.request_status, status.reply_notification_id) if status else (None, None)
+            try:
+                validate_actor_available(actor, status.endorsement_type if status else None,
+                                         latest_request_status[0])
+            except BadRequestError as e:
+                results[actor_id] = endorsement_request_result(actor_id, 'rejected', e.description)
+                continue
+            payloads.append((actor_id, create_endorsement_request_data(
+                user, record, actor, latest_request_status=latest_request_status,
+            )))
+
+        if payloads:
+            create_endorsement_request_records(payloads, record_id, user.id)
+            current_app.logger.info(f'Created endorsement request records for actors {[a for a, _ in payloads]}')
+        for actor_id, endorsement_request_data in payloads:
+            results[actor_id] = endorsement_request_result(
+                actor_id, 'accepted', 'Request Accepted', endorsement_request_data['id'],
+            )
+
+        return {
+            'is_success': 1 if payloads else 0,
+            'accepted': len(payloads),
+            'rejected': len(actor_ids) - len(payloads),
+            'results': [results[actor_id] for actor_id in actor_ids],
+        }, 200
+
     @request_view_args
     @response_handler()
     def list_actors(self):
@@ -1,6 +1,15 @@
+from flask_resources import (
+    resource_requestctx,
+)
 from flask_resources import route
+from invenio_records_resources.resources.records.resource import (
+    request_headers,
+    request_view_args,
+)
 
 from .basic_db_resource import BasicDbResource
+from .endorsement_admin_resource import refresh_record_actor_status
+from ...records.models import EndorsementReplyModel, EndorsementRequestModel
 
 
 class InboxAdminResource(BasicDbResource):
@@ -14,4 +23,21 @@ class InboxAdminResource(BasicDbResource):
             route("GET", routes["list"], self.search),
             route("DELETE", routes["item"], self.delete),
             # route("PUT", routes["item"], self.update),
-        ]
\ No newline at end of file
+        ]
+
+    @request_headers
+    @request_view_args
+    def delete(self):
+        inbox_id = resource_requestctx.view_args["record_id"]
+        # the statuses of the requests replied by the notification refer to it
+        replied = (EndorsementRequestModel.query
+                   .join(EndorsementReplyModel,
+                         EndorsementReplyModel.endorsement_request_id == EndorsementRequestModel.id)
+                   .filter(EndorsementReplyModel.inbox_id == inbox_id)
+                   .with_entities(EndorsementRequestModel.record_id, EndorsementRequestModel.actor_id)
+                   .distinct()
+                   .all())
+        result = super().delete()
+        for record_id, actor_id in replied:
+            refresh_record_actor_status(record_id, actor_id)
+        return result
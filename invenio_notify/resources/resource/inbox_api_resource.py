@@ -1,4 +1,7 @@
-from flask import g
+from functools import wraps
+from typing import Optional
+
+from flask import g, request
 from flask_resources import (
     Resource,
     resource_requestctx,
@@ -8,8 +11,11 @@ from flask_resources import (
 from invenio_records_resources.resources.records.resource import request_data
 
 from coarnotify.server import COARNotifyServerError
-from invenio_notify.errors import COARProcessFail
-from invenio_notify.utils.notify_response import response_coar_notify_receipt, create_default_msg_by_status
+from invenio_notify.errors import COARProcessFail, BadRequestError
+from invenio_notify.proxies import current_inbox_rate_limiter, current_actor_cache
+from invenio_notify.utils.request_timing import server_timing, begin_phase, end_phase, request_phase
+from invenio_notify.utils.notify_response import response_coar_notify_receipt, create_default_msg_by_status, \
+    response_bulk_receipts
 from invenio_rdm_records.resources.errors import HTTPJSONException
 from ..errors import ApiErrorHandlersMixin, create_error_handler_with_json, create_error_handler
 
@@ -21,13 +27,49 @@ def require_inbox_oauth():
         from invenio_oauth2server import require_oauth_scopes, require_api_auth
         from invenio_notify.scopes import inbox_scope
 
-        f = require_oauth_scopes(inbox_scope.id)(f)
-        f = require_api_auth()(f)
-        return f
+        @wraps(f)
+        def authenticated(*args, **kwargs):
+            end_phase('auth')
+            return f(*args, **kwargs)
+
+        protected = require_oauth_scopes(inbox_scope.id)(authenticated)
+        protected = require_api_auth()(protected)
+
+        @wraps(f)
+        def timed(*args, **kwargs):
+            begin_phase('auth')
+            return protected(*args, **kwargs)
+
+        return timed
 
     return decorator
 
 
+def get_rate_limit_key():
+    """Key of the API token of the request, the user if the token is not known."""
+    token = getattr(getattr(request, 'oauth', None), 'access_token', None)
+    if token is not None:
+        return f'token-{token.id}'
+    return f'user-{g.identity.id}'
+
+
+def get_actor_id(notification_raw) -> Optional[str]:
+    actor = notification_raw.get('actor') if isinstance(notification_raw, dict) else None
+    return actor.get('id') if isinstance(actor, dict) else None
+
+
+def get_member_actor_id(notification_raw) -> Optional[str]:
+    """``actor.id`` of the notification if the user of the request is a member of the actor, otherwise None.
+
+    The ``actor.id`` of the payload is not verified yet, only the buckets of the
+    actors of the user are charged, so a client cannot drain the bucket of another actor.
+    """
+    actor_id = get_actor_id(notification_raw)
+    if isinstance(actor_id, str) and current_actor_cache.has_member(g.identity.id, actor_id):
+        return actor_id
+    return None
+
+
 class InboxApiResource(Resource):
     """Resource for handling COAR notification inbox endpoint."""
 
@@ -51,8 +93,10 @@ class InboxApiResource(Resource):
         """Create the URL rules for the inbox resource."""
         return [
             route("POST", "/notify/inbox", self.receive_notification),
+            route("POST", "/notify/inbox/bulk", self.receive_notifications_bulk),
         ]
 
+    @server_timing
     @request_data
     @response_handler()
     @require_inbox_oauth()
@@ -63,8 +107,33 @@ class InboxApiResource(Resource):
         if not data:
             raise ValueError("Request data is required")
 
+        with request_phase('rate_limit'):
+            current_inbox_rate_limiter.check(get_rate_limit_key(), [get_member_actor_id(data)])
+
         result = self.service.receive_notification(
             notification_raw=data,
             identity=g.identity
         )
-        return response_coar_notify_receipt(result)
\ No newline at end of file
+        return response_coar_notify_receipt(result)
+
+    @server_timing
+    @request_data
+    @response_handler()
+    @require_inbox_oauth()
+    def receive_notifications_bulk(self):
+        """Receive COAR notifications as a JSON array or NDJSON via POST to /inbox/bulk."""
+        data = resource_requestctx.data
+
+        if not data:
+            raise ValueError("Request data is required")
+        if not isinstance(data, list):
+            raise BadRequestError("A JSON array or NDJSON of notifications is required")
+
+        with request_phase('rate_limit'):
+            current_inbox_rate_limiter.check(get_rate_limit_key(), [get_member_actor_id(n) for n in data])
+
+        receipts = self.service.receive_notifications(
+            notifications_raw=data,
+            identity=g.identity
+        )
+        return response_bulk_receipts(receipts)
\ No newline at end of file
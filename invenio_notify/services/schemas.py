@@ -4,6 +4,8 @@ from invenio_records_resources.services.records.schema import BaseRecordSchema
 from marshmallow import Schema, fields, pre_load
 from marshmallow_utils.fields import TZDateTime
 
+from invenio_notify.constants import CIRCUIT_CLOSED
+
 
 def create_current_utc_datetime():
     return datetime.now(timezone.utc)
@@ -16,15 +18,31 @@ class NotifyInboxSchema(BaseRecordSchema):
 
     user_id = fields.Integer(required=True)
 
+    notification_type = fields.String(required=False, allow_none=True)
+    workflow_status = fields.String(required=False, allow_none=True)
+    actor_id = fields.String(required=False, allow_none=True)
+    in_reply_to = fields.String(required=False, allow_none=True)
+    context_url = fields.String(required=False, allow_none=True)
+
     process_date = TZDateTime(timezone=timezone.utc, format="iso", required=False)
     process_note = fields.String(required=False)
 
+    attempts = fields.Integer(required=False)
+    next_attempt_at = TZDateTime(timezone=timezone.utc, format="iso", required=False, allow_none=True)
+    last_error = fields.String(required=False, allow_none=True)
+    quarantined_at = TZDateTime(timezone=timezone.utc, format="iso", required=False, allow_none=True)
+
 
 class ApiNotifyInboxSchema(BaseRecordSchema):
     notification_id = fields.String(required=True)
     raw = fields.Dict(required=True)  # raw for api must be a dict
     record_id = fields.String(required=True)
     user_id = fields.Integer(required=True)
+    notification_type = fields.String(required=False, allow_none=True)
+    workflow_status = fields.String(required=False, allow_none=True)
+    actor_id = fields.String(required=False, allow_none=True)
+    in_reply_to = fields.String(required=False, allow_none=True)
+    context_url = fields.String(required=False, allow_none=True)
 
 
 class EndorsementSchema(BaseRecordSchema):
@@ -56,6 +74,17 @@ class ActorSchema(BaseRecordSchema):
 
     members = fields.List(fields.Nested(UserSchema), required=False, dump_only=True)
 
+    circuit_state = fields.Function(
+        lambda obj: obj.circuit.state if obj.circuit else CIRCUIT_CLOSED, dump_only=True,
+    )
+    circuit_failures = fields.Function(lambda obj: obj.circuit.failures if obj.circuit else 0, dump_only=True)
+    circuit_open_until = fields.Function(
+        lambda obj: (obj.circuit.open_until.replace(tzinfo=timezone.utc).isoformat()
+                     if obj.circuit and obj.circuit.open_until else None),
+        dump_only=True,
+    )
+    circuit_last_error = fields.Function(lambda obj: obj.circuit.last_error if obj.circuit else None, dump_only=True)
+
     @pre_load
     def process_empty_strings(self, data, **kwargs):
         if 'inbox_url' in data and data['inbox_url'] == '':
@@ -81,6 +110,12 @@ class EndorsementRequestSchema(BaseRecordSchema):
     latest_status = fields.String(required=True)
     user_id = fields.Integer(required=False)
 
+    delivery_status = fields.String(required=False)
+    delivery_attempts = fields.Integer(required=False)
+    next_delivery_at = TZDateTime(timezone=timezone.utc, format="iso", required=False, allow_none=True)
+    last_delivery_error = fields.String(required=False, allow_none=True)
+    delivered_at = TZDateTime(timezone=timezone.utc, format="iso", required=False, allow_none=True)
+
 
 class EndorsementReplySchema(BaseRecordSchema):
     endorsement_request_id = fields.Integer(required=True)
@@ -6,6 +6,7 @@ from invenio_records_resources.services.records.schema import ServiceSchemaWrapp
 from invenio_notify.records.models import ActorMapModel, ActorModel
 from invenio_notify.services.results import MembersList
 from invenio_notify.utils import user_utils, actor_utils
+from invenio_notify.utils.actor_cache import invalidate_actor_cache
 from .base_service import BasicDbService
 
 
@@ -22,6 +23,24 @@ class ActorService(BasicDbService):
 
         return super().search(identity, params, search_preference, expand, filter_maker, **kwargs)
 
+    @unit_of_work()
+    def create(self, identity, data, raise_errors=True, uow=None, schema=None):
+        result = super().create(identity, data, raise_errors=raise_errors, uow=uow, schema=schema)
+        invalidate_actor_cache(uow)
+        return result
+
+    @unit_of_work()
+    def update(self, identity, id, data, uow=None):
+        result = super().update(identity, id, data, uow=uow)
+        invalidate_actor_cache(uow)
+        return result
+
+    @unit_of_work()
+    def delete(self, identity, id, uow=None):
+        result = super().delete(identity, id, uow=uow)
+        invalidate_actor_cache(uow)
+        return result
+
     @property
     def schema_add_member(self):
         return ServiceSchemaWrapper(self, schema=self.config.schema_add_member)
@@ -94,6 +113,7 @@ class ActorService(BasicDbService):
             return self.result_item(self, identity, actor, links_tpl=self.links_item_tpl)
 
         ActorMapModel.delete(actor_map)
+        invalidate_actor_cache(uow)
 
         actor = self.record_cls.get(id)
         return self.result_item(self, identity, actor, links_tpl=self.links_item_tpl)
@@ -1,6 +1,6 @@
 from invenio_db.uow import unit_of_work
 
-from invenio_notify.records.models import EndorsementRequestModel
+from invenio_notify.records.models import EndorsementRequestModel, RecordActorStatusModel
 from .base_service import BasicDbService
 
 
@@ -30,5 +30,6 @@ class EndorsementReplyService(BasicDbService):
                 {'latest_status': data['status']},
                 data['endorsement_request_id']
             )
+            RecordActorStatusModel.refresh(request_record.record_id, request_record.actor_id)
 
         return result
\ No newline at end of file
@@ -27,13 +27,13 @@ class EndorsementAdminService(BasicDbService):
             return []
 
         # Get all endorsements for this parent's children
-        endorsements = EndorsementModel.query_by_parent_id(parent_id).all()
+        endorsements = EndorsementModel.query_with_record_index_by_parent_id(parent_id).all()
 
         if not endorsements:
             return []
 
         actor_endorsements = {}
-        for endorsement in endorsements:
+        for endorsement, record_index in endorsements:
             actor_id = endorsement.actor_id
             if actor_id not in actor_endorsements:
                 actor_endorsements[actor_id] = {
@@ -42,9 +42,9 @@ class EndorsementAdminService(BasicDbService):
                 }
 
             if endorsement.review_type == constants.TYPE_ENDORSEMENT:
-                actor_endorsements[actor_id]['endorsements'].append(endorsement)
+                actor_endorsements[actor_id]['endorsements'].append((endorsement, record_index))
             elif endorsement.review_type == constants.TYPE_REVIEW:
-                actor_endorsements[actor_id]['reviews'].append(endorsement)
+                actor_endorsements[actor_id]['reviews'].append((endorsement, record_index))
             else:
                 current_app.logger.warning(
                     f'Unknown review type: {endorsement.review_type} for endorsement {endorsement.id}')
@@ -54,22 +54,22 @@ class EndorsementAdminService(BasicDbService):
             sub_endorsement_list = []
             sub_review_list = []
 
-            for e in data['endorsements']:
+            for e, index in data['endorsements']:
                 sub_endorsement_list.append({
                     'created': e.created.isoformat(),
                     'url': e.result_url,
-                    'index': e.record.index
+                    'index': index
                 })
 
-            for r in data['reviews']:
+            for r, index in data['reviews']:
                 sub_review_list.append({
                     'created': r.created.isoformat(),
                     'url': r.result_url,
-                    'index': r.record.index
+                    'index': index
                 })
 
             _endorsements = data['reviews'] + data['endorsements']
-            actor_name = _endorsements[-1].actor.name if _endorsements else 'Unknown'
+            actor_name = _endorsements[-1][0].actor.name if _endorsements else 'Unknown'
             result.append({
                 'actor_id': actor_id,
                 'actor_name': actor_name,
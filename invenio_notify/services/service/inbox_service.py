@@ -1,29 +1,29 @@
-from flask import current_app, g
+from flask import current_app
 from idutils.normalizers import normalize_doi
 from idutils.validators import is_doi
 from invenio_db.uow import unit_of_work
 from invenio_records_resources.services.records.schema import ServiceSchemaWrapper
+from invenio_records_resources.services.uow import TaskOp
 from sqlalchemy.exc import IntegrityError
-from psycopg2 import errorcodes
 
 from coarnotify.core.notify import NotifyPattern
 from coarnotify.server import (
     COARNotifyReceipt,
     COARNotifyServer,
+    COARNotifyServerError,
     COARNotifyServiceBinding,
 )
 from invenio_notify import constants
-from invenio_notify.errors import COARProcessFail
-from invenio_notify.proxies import current_inbox_service
-from invenio_notify.records.models import ActorModel
-from invenio_notify.tasks import get_notification_type
+from invenio_notify.errors import COARProcessFail, DuplicateNotificationError
+from invenio_notify.proxies import current_inbox_service, current_actor_cache, current_doi_cache, \
+    current_record_cache
+from invenio_notify.tasks import get_notification_type, get_normalized_fields, shared_task_process_inbox_record
+from invenio_notify.utils.notify_response import bulk_receipt
 from invenio_notify.utils.notify_utils import get_recid_by_record_url
+from invenio_notify.utils.request_timing import begin_phase, end_phase, request_phase
 from invenio_pidstore.errors import PIDDoesNotExistError
-from invenio_rdm_records.proxies import current_rdm_records_service
-from invenio_rdm_records.proxies import current_rdm_records
-from invenio_rdm_records.services import RDMRecordService
 from .base_service import BasicDbService
-from sqlalchemy import or_, cast, String
+from sqlalchemy import or_, String
 
 
 def get_record_id_from_notification(raw: dict) -> str:
@@ -52,13 +52,12 @@ def get_record_id_from_notification(raw: dict) -> str:
     if is_doi(record_url):
         # Extract the normalized DOI from the URI
         normalized_doi = normalize_doi(record_url)
-        pids_service = current_rdm_records.records_service.pids
 
         try:
-           record = pids_service.resolve(g.identity, normalized_doi, "doi")
-           return record["id"]
-        except PIDDoesNotExistError as e:
-            current_app.logger.error(f'No record with the DOI {record_url} exists: {e}')
+            recid = current_doi_cache.get_recid(normalized_doi)
+            if recid:
+                return recid
+            current_app.logger.error(f'No record with the DOI {record_url} exists')
         except Exception as e:
             current_app.logger.error(f'Unexpected error while searching for records with DOI {record_url}: {e}')
 
@@ -79,7 +78,11 @@ class NotifyInboxService(BasicDbService):
                 model.notification_id.cast(String).ilike(search_term),  # Search in notification ID
                 model.record_id.ilike(search_term),  # Search in record ID
                 model.process_note.ilike(search_term),  # Search in process notes
-                cast(model.raw, String).ilike(search_term),  # Search in raw JSON data
+                model.notification_type.ilike(search_term),
+                model.workflow_status.ilike(search_term),
+                model.actor_id.ilike(search_term),
+                model.in_reply_to.ilike(search_term),
+                model.context_url.ilike(search_term),
             ]
 
             filters.append(or_(*search_conditions))
@@ -102,16 +105,72 @@ class NotifyInboxService(BasicDbService):
         """
         server = COARNotifyServer(InboxCOARBinding(identity))
         current_app.logger.debug(f'input announcement:')
+        # ended by the binding, once the notification is parsed and validated
+        begin_phase('coar_validate')
         result = server.receive(notification_raw, validate=True)
         current_app.logger.debug(f'result: {result}')
         return result
 
+    def receive_notifications(self, notifications_raw: list, identity) -> list[dict]:
+        """Process a batch of COAR notifications with injected identity.
+
+        Each notification is validated like in ``receive_notification``. The
+        accepted notifications are inserted with one multi-row insert in one
+        transaction.
+
+        Args:
+            notifications_raw: The raw notifications
+            identity: The identity object
+
+        Returns:
+            list: One receipt per notification, in the order of the notifications
+        """
+        max_items = current_app.config['NOTIFY_INBOX_BULK_MAX_ITEMS']
+        if len(notifications_raw) > max_items:
+            raise COARProcessFail(constants.STATUS_BAD_REQUEST, f'Too many notifications, at most {max_items}')
+
+        binding = BulkInboxCOARBinding(identity)
+        server = COARNotifyServer(binding)
+        receipts = []
+        inbox_records = {}
+        for index, raw in enumerate(notifications_raw):
+            notification_id = raw.get('id') if isinstance(raw, dict) else None
+            try:
+                if not isinstance(raw, dict):
+                    raise COARProcessFail(constants.STATUS_BAD_REQUEST, 'Notification must be a JSON object')
+                if notification_id in inbox_records:
+                    raise COARProcessFail(constants.STATUS_BAD_REQUEST,
+                                          f'Notification already exists: {notification_id}')
+                begin_phase('coar_validate')
+                server.receive(raw, validate=True)
+                inbox_records[notification_id] = self.load_inbox_record(identity, binding.inbox_record)
+                receipts.append(bulk_receipt(index, notification_id, COARNotifyReceipt.ACCEPTED))
+            except COARProcessFail as e:
+                receipts.append(bulk_receipt(index, notification_id, e.status, e.description))
+            except COARNotifyServerError as e:
+                # e.g. the notification is not a valid COAR notification
+                receipts.append(bulk_receipt(index, notification_id, constants.STATUS_BAD_REQUEST, e.message))
+            except PIDDoesNotExistError:
+                receipts.append(bulk_receipt(index, notification_id, constants.STATUS_NOT_FOUND, 'Record not found'))
+            except Exception as e:
+                current_app.logger.info(f'Invalid notification [{index}] in bulk: {e}')
+                receipts.append(bulk_receipt(index, notification_id, constants.STATUS_BAD_REQUEST))
+
+        with request_phase('insert'):
+            ids = self.create_many(identity, list(inbox_records.values())) if inbox_records else {}
+        for receipt in receipts:
+            if receipt['status'] == COARNotifyReceipt.ACCEPTED and receipt['notification_id'] not in ids:
+                receipt.update(status=constants.STATUS_BAD_REQUEST,
+                               message=f'Notification already exists: {receipt["notification_id"]}')
+        current_app.logger.info(f'Received {len(ids)} of {len(receipts)} notifications in bulk')
+        return receipts
+
     @property
     def schema_api(self):
         return ServiceSchemaWrapper(self, schema=self.config.schema_api)
 
-    @unit_of_work()
-    def create(self, identity, data, raise_errors=True, uow=None):
+    def prepare_inbox_record(self, identity, data: dict) -> dict:
+        """Add the user, the notification ID and the normalized fields of the raw notification to the data."""
         data['user_id'] = identity.id
 
         if 'notification_id' not in data and 'raw' in data:
@@ -123,12 +182,81 @@ class NotifyInboxService(BasicDbService):
                 current_app.logger.error('Missing notification ID in raw data')
                 raise ValueError('Missing notification ID in raw data')
 
-        return super().create(
-            identity,
-            data,
+        if isinstance(data.get('raw'), dict):
+            for key, value in get_normalized_fields(data['raw']).items():
+                data.setdefault(key, value)
+        return data
+
+    def load_inbox_record(self, identity, data: dict) -> dict:
+        """Prepare and validate the data of an inbox record, see ``create_many``."""
+        valid_data, _ = self.schema_api.load(
+            self.prepare_inbox_record(identity, data),
+            context={"identity": identity},
+            raise_errors=True,
+        )
+        return valid_data
+
+    @unit_of_work()
+    def create_many(self, identity, inbox_records: list[dict], uow=None) -> dict[str, int]:
+        """Insert inbox records with multi-row inserts, skipping notification IDs that already exist.
+
+        Args:
+            identity: The identity object
+            inbox_records: The inbox records, validated with ``load_inbox_record``
+            uow: The unit of work
+
+        Returns:
+            dict: IDs of the inserted inbox records by notification ID
+        """
+        self.require_permission(identity, "create")
+
+        ids = self.record_cls.insert_many(inbox_records)
+        if current_app.config.get('NOTIFY_INBOX_PROCESS_ON_RECEIVE', False):
+            for inbox_id in ids.values():
+                uow.register(TaskOp(shared_task_process_inbox_record, inbox_id))
+        return ids
+
+    @unit_of_work()
+    def create(self, identity, data, raise_errors=True, uow=None):
+        """Create an inbox record.
+
+        Raises:
+            DuplicateNotificationError: If the notification ID already exists
+        """
+        result = self.create_if_absent(identity, data, raise_errors=raise_errors, uow=uow)
+        if result is None:
+            raise DuplicateNotificationError(data['notification_id'])
+        return result
+
+    @unit_of_work()
+    def create_if_absent(self, identity, data, raise_errors=True, uow=None):
+        """Create an inbox record unless its notification ID already exists.
+
+        A duplicate is skipped by the insert (``ON CONFLICT DO NOTHING``), so it
+        neither raises a unique violation nor needs a rollback.
+
+        Returns:
+            The created inbox record, None if the notification ID already exists
+        """
+        self.require_permission(identity, "create")
+
+        valid_data, errors = self.schema_api.load(
+            self.prepare_inbox_record(identity, data),
+            context={"identity": identity},
             raise_errors=raise_errors,
-            uow=uow,
-            schema=self.schema_api
+        )
+
+        inbox_id = self.record_cls.insert_if_absent(valid_data)
+        if inbox_id is None:
+            return None
+
+        if current_app.config.get('NOTIFY_INBOX_PROCESS_ON_RECEIVE', False):
+            # process right after commit instead of waiting for the scheduled job
+            uow.register(TaskOp(shared_task_process_inbox_record, inbox_id))
+
+        record = self.record_cls.get(inbox_id)
+        return self.result_item(
+            self, identity, record, links_tpl=self.links_item_tpl, errors=errors
         )
 
 
@@ -147,8 +275,41 @@ class InboxCOARBinding(COARNotifyServiceBinding):
     def notification_received(self, notification: NotifyPattern) -> COARNotifyReceipt:
         current_app.logger.debug('called notification_received')
 
-        raw = notification.to_jsonld()
-        record_id = get_record_id_from_notification(raw)
+        end_phase('coar_validate')
+        inbox_record = self.validate_notification(notification.to_jsonld())
+        notification_id = inbox_record['notification_id']
+        try:
+            with request_phase('insert'):
+                result = current_inbox_service.create_if_absent(self._identity, inbox_record)
+        except IntegrityError as e:
+            # other integrity errors (foreign key, check constraints, etc.)
+            current_app.logger.error(f'Database integrity error: {e}')
+            raise COARProcessFail(constants.STATUS_BAD_REQUEST, f'Database integrity error')
+        except Exception as e:
+            current_app.logger.error(f'Failed to create inbox record: {e}')
+            raise COARProcessFail(constants.STATUS_BAD_REQUEST, f'Failed to create inbox record')
+
+        if result is None:
+            current_app.logger.warning(f'Duplicate notification_id {notification_id}')
+            raise COARProcessFail(constants.STATUS_BAD_REQUEST, f'Notification already exists: {notification_id}')
+
+        return COARNotifyReceipt(COARNotifyReceipt.ACCEPTED)
+
+    def validate_notification(self, raw: dict) -> dict:
+        """Check that the notification can be accepted from the user.
+
+        Args:
+            raw: The raw notification
+
+        Returns:
+            dict: The data of the inbox record
+
+        Raises:
+            COARProcessFail: If the notification is not accepted
+            PIDDoesNotExistError: If the record does not exist
+        """
+        with request_phase('record_id'):
+            record_id = get_record_id_from_notification(raw)
 
         notification_id = raw.get('id')
         if not notification_id:
@@ -156,7 +317,9 @@ class InboxCOARBinding(COARNotifyServiceBinding):
             raise COARProcessFail(constants.STATUS_BAD_REQUEST, 'Missing notification ID')
 
         actor_id = raw['actor']['id']
-        if not ActorModel.has_member(self._identity.id, actor_id):
+        with request_phase('membership'):
+            is_member = current_actor_cache.has_member(self._identity.id, actor_id)
+        if not is_member:
             current_app.logger.warning(f'Actor id not match with user: {actor_id}, {self._identity.id}')
             raise COARProcessFail(constants.STATUS_FORBIDDEN, 'Actor Id mismatch')
 
@@ -164,24 +327,24 @@ class InboxCOARBinding(COARNotifyServiceBinding):
             current_app.logger.info(f'Unknown type: [{record_id=}]{raw.get("type")}')
             raise COARProcessFail(constants.STATUS_NOT_ACCEPTED, 'Notification type not supported')
 
-        records_service: RDMRecordService = current_rdm_records_service
-        records_service.record_cls.pid.resolve(record_id)
+        with request_phase('record_exists'):
+            record_exists = current_record_cache.exists(record_id)
+        if not record_exists:
+            raise PIDDoesNotExistError('recid', record_id)
 
         current_app.logger.debug(f'client input raw: {raw}')
-        try:
-            inbox_record = {"notification_id": notification_id, "raw": raw, 'record_id': record_id}
-            current_inbox_service.create(self._identity, inbox_record)
-        except IntegrityError as e:
-            # Check if it's specifically a unique constraint violation
-            if hasattr(e.orig, 'pgcode') and e.orig.pgcode == errorcodes.UNIQUE_VIOLATION:
-                current_app.logger.warning(f'Duplicate notification_id {notification_id}: {e}')
-                raise COARProcessFail(constants.STATUS_BAD_REQUEST, f'Notification already exists: {notification_id}')
-            else:
-                # Re-raise other integrity errors (foreign key, check constraints, etc.)
-                current_app.logger.error(f'Database integrity error: {e}')
-                raise COARProcessFail(constants.STATUS_BAD_REQUEST, f'Database integrity error')
-        except Exception as e:
-            current_app.logger.error(f'Failed to create inbox record: {e}')
-            raise COARProcessFail(constants.STATUS_BAD_REQUEST, f'Failed to create inbox record')
+        return {"notification_id": notification_id, "raw": raw, 'record_id': record_id}
+
+
+class BulkInboxCOARBinding(InboxCOARBinding):
+    """COAR notification binding that only validates, see ``NotifyInboxService.receive_notifications``."""
 
+    def __init__(self, identity):
+        super().__init__(identity)
+        self.inbox_record = None
+        """ Data of the inbox record of the last accepted notification """
+
+    def notification_received(self, notification: NotifyPattern) -> COARNotifyReceipt:
+        end_phase('coar_validate')
+        self.inbox_record = self.validate_notification(notification.to_jsonld())
         return COARNotifyReceipt(COARNotifyReceipt.ACCEPTED)
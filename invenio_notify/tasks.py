@@ -1,12 +1,15 @@
 import logging
-from datetime import datetime, timezone
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Union
 
 from celery import shared_task
 from flask import current_app
 from invenio_access.permissions import system_identity
 from invenio_db import db
-from invenio_db.uow import unit_of_work
+from invenio_db.uow import UnitOfWork, unit_of_work
 from invenio_notifications.services.uow import NotificationOp
 from invenio_pidstore.errors import PIDDoesNotExistError
 
@@ -17,86 +20,112 @@ from invenio_notify import constants
 from invenio_notify.constants import SUPPORTED_TYPES
 from invenio_notify.notifications.builders import NewEndorsementNotificationBuilder, \
     EndorsementUpdateNotificationBuilder
+from invenio_notify.notifications.digest import DigestEventOp, NotificationDigest
+from invenio_notify.proxies import current_notify_metrics, current_actor_cache
 from invenio_notify.records.models import EndorsementReplyModel, EndorsementRequestModel
-from invenio_notify.records.models import NotifyInboxModel, ActorModel
+from invenio_notify.records.models import NotifyInboxModel, ActorModel, RecordActorStatusModel
+from invenio_notify.errors import CircuitOpenError, SendRequestFail
+from invenio_notify.utils.actor_cache import CachedActor
+from invenio_notify.utils.endorsement_request_utils import send_to_actor_inbox
+from invenio_notify.utils.inbox_batch_utils import InboxBatchContext
 from invenio_notify.utils.notify_utils import get_recid_by_record_url
+from invenio_notify.utils.record_utils import RecordSummary, get_record_summary
+from invenio_notify.utils.reindex_utils import ReindexCollector, reindex_parent_versions
+from invenio_notify.utils.uow_utils import savepoint
 from invenio_rdm_records.proxies import current_rdm_records_service
 from invenio_rdm_records.records import RDMRecord
-from invenio_rdm_records.records.models import RDMRecordMetadata, RDMParentMetadata
+from invenio_rdm_records.records.models import RDMRecordMetadata
 
 log = logging.getLogger(__name__)
 
 
-def get_record_by_id(record_id) -> RDMRecordMetadata:
+def stage_timer(stage: str):
+    """Time a stage of the inbox processing in the ``notify_inbox_stage_seconds`` histogram."""
+    return current_notify_metrics.timer('notify_inbox_stage_seconds', stage=stage)
+
+
+def count_notification(notification_type: Optional[str], actor_id: Optional[str], outcome: str):
+    """Count a processed notification by type, actor and outcome."""
+    current_notify_metrics.incr(
+        'notify_inbox_notifications_total',
+        type=notification_type or 'unknown',
+        actor=actor_id or 'unknown',
+        outcome=outcome,
+    )
+
+
+def record_queue_metrics():
+    """Update the gauges of the queue of unprocessed inbox records."""
+    stats = NotifyInboxModel.queue_stats()
+    oldest_age = 0
+    if stats['oldest_created'] is not None:
+        oldest_created = stats['oldest_created'].replace(tzinfo=timezone.utc)
+        oldest_age = (datetime.now(timezone.utc) - oldest_created).total_seconds()
+    current_notify_metrics.gauge('notify_inbox_queue_depth', stats['depth'])
+    current_notify_metrics.gauge('notify_inbox_oldest_unprocessed_age_seconds', oldest_age)
+    current_notify_metrics.gauge('notify_inbox_quarantined', stats['quarantined'])
+
+
+def get_record_summary_by_id(record_id) -> RecordSummary:
     """
-    Get RDMRecordMetadata by record ID.
+    Get the title, PID and owner of a record by record ID, without loading the
+    JSON of the record and its parent.
 
     Args:
         record_id: The record uuid
 
     Returns:
-        RDMRecordMetadata: The record metadata object
+        RecordSummary: The summary of the record
 
     Raises:
         DataNotFound: If record is not found
     """
-    record = RDMRecordMetadata.query.filter_by(id=record_id).first()
-    if not record:
+    record = get_record_summary(record_id)
+    if record is None:
         raise DataNotFound(f"Record with ID {record_id} not found")
     return record
 
 
-def create_endorsement_update_notification(record_id: str, actor_name: str,
-                                           noti_type: str, uow) -> None:
-    record = get_record_by_id(record_id)
-    record_owner_user_id = get_user_id_by_record(record)
-    uow.register(
-        NotificationOp(
-            EndorsementUpdateNotificationBuilder.build(
-                record=record,
-                actor_name=actor_name,
-                user_id=record_owner_user_id,
-                endorsement_status=noti_type,
-            ),
-        )
-    )
-
-
-def get_user_id_by_record(record: RDMRecordMetadata) -> int:
+def get_owner_id(record: RecordSummary) -> int:
     """
-    Get the user_id of the record owner by record object.
-    
-    Args:
-        record: The RDMRecordMetadata object
-        
-    Returns:
-        int: The user_id of the record owner
+    Get the user_id of the record owner from a record summary.
 
     Raises:
-        DataNotFound: If record is None, parent not found, or user_id not found
+        DataNotFound: If user_id not found
     """
-    if not record:
-        log.warning("Record object is None")
+    if record.owner_user_id is None:
+        log.warning(f"Owner user_id not found in parent {record.parent_id} for record {record.id}")
         raise DataNotFound("User ID not found for record")
+    return record.owner_user_id
 
-    parent_id = record.parent_id
 
-    # Get the parent record to find the owner
-    parent = RDMParentMetadata.query.filter_by(id=parent_id).first()
-    if not parent:
-        log.warning(f"Parent record with id {parent_id} not found")
-        raise DataNotFound("User ID not found for record")
+def get_record_owner_id(record_id) -> int:
+    """Get the user_id of the owner of a record by record ID."""
+    return get_owner_id(get_record_summary_by_id(record_id))
 
-    # Extract user_id from parent JSON: access.owned_by.user
-    access_data = parent.json.get('access', {})
-    owned_by = access_data.get('owned_by', {})
-    user_id = owned_by.get('user')
 
-    if user_id is None:
-        log.warning(f"Owner user_id not found in parent {parent_id} for record {record.id}")
-        raise DataNotFound("User ID not found for record")
+def create_endorsement_update_notification(record_id: str, actor_name: str,
+                                           noti_type: str, uow,
+                                           digest: Optional[NotificationDigest] = None) -> None:
+    if digest is not None:
+        user_id = digest.get_owner(record_id, get_record_owner_id)
+        uow.register(DigestEventOp(digest, user_id, {
+            'type': EndorsementUpdateNotificationBuilder.type,
+            'record_id': str(record_id),
+            'actor_name': actor_name,
+            'endorsement_status': noti_type,
+        }))
+        return
 
-    return int(user_id)
+    with stage_timer('notification_build'):
+        record = get_record_summary_by_id(record_id)
+        notification = EndorsementUpdateNotificationBuilder.build(
+            record=record,
+            actor_name=actor_name,
+            user_id=get_owner_id(record),
+            endorsement_status=noti_type,
+        )
+    uow.register(NotificationOp(notification))
 
 
 @unit_of_work()
@@ -114,6 +143,51 @@ def mark_as_processed(inbox_record: NotifyInboxModel, comment=None, uow=None):
         inbox_record.process_note = comment
 
 
+@unit_of_work()
+def record_processing_failure(inbox_record: NotifyInboxModel, error: Exception, uow=None) -> bool:
+    """
+    Count a failed processing attempt of an inbox record and schedule the next
+    attempt with exponential backoff (NOTIFY_INBOX_RETRY_BACKOFF doubled per
+    failed attempt, capped at NOTIFY_INBOX_RETRY_BACKOFF_MAX seconds).
+
+    The claim of the record is released, so whichever worker runs after
+    ``next_attempt_at`` picks the record up again.
+
+    Args:
+        inbox_record: The inbox record that failed to be processed
+        error: The error raised while processing the record
+
+    Returns:
+        bool: True if the record failed NOTIFY_INBOX_MAX_ATTEMPTS times and will not be retried
+    """
+    max_attempts = current_app.config.get('NOTIFY_INBOX_MAX_ATTEMPTS', 5)
+    backoff = current_app.config.get('NOTIFY_INBOX_RETRY_BACKOFF', 60)
+    backoff_max = current_app.config.get('NOTIFY_INBOX_RETRY_BACKOFF_MAX', 6 * 3600)
+
+    inbox_record.attempts = (inbox_record.attempts or 0) + 1
+    inbox_record.last_error = f"{type(error).__name__}: {error}"
+    inbox_record.claimed_by = None
+    inbox_record.claimed_at = None
+    if inbox_record.attempts >= max_attempts:
+        inbox_record.next_attempt_at = None
+        return True
+
+    delay = min(backoff * 2 ** (inbox_record.attempts - 1), backoff_max)
+    inbox_record.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+    return False
+
+
+@unit_of_work()
+def quarantine(inbox_record: NotifyInboxModel, uow=None):
+    """
+    Quarantine an inbox record, it is not processed anymore.
+
+    Args:
+        inbox_record: The inbox record to quarantine
+    """
+    inbox_record.quarantined_at = datetime.now(timezone.utc)
+
+
 class DataNotFound(Exception):
     """Custom exception for when notification processing fails due to missing or invalid data."""
 
@@ -122,6 +196,15 @@ class DataNotFound(Exception):
         self.message = message
 
 
+class TransientError(Exception):
+    """Exception for when notification processing fails for a reason that may clear on its own,
+    the notification is retried later."""
+
+    def __init__(self, message, **kwargs):
+        super().__init__(message, **kwargs)
+        self.message = message
+
+
 def get_notification_type(notification_raw: dict) -> str | None:
     """
     Extract notification type from raw notification data.
@@ -185,15 +268,40 @@ def get_workflow_status(notification_raw: dict) -> str | None:
     return None
 
 
-def get_actor_by_actor_id(notification_raw: dict) -> ActorModel:
+def get_normalized_fields(notification_raw: dict) -> dict:
+    """
+    Extract the fields that are stored as columns of NotifyInboxModel.
+
+    The fields are extracted once when the notification is received, so the
+    processor and the admin search do not need to parse the raw JSON again.
+
+    Args:
+        notification_raw: The raw notification data
+
+    Returns:
+        dict: notification_type, workflow_status, actor_id, in_reply_to and context_url
+    """
+    actor = notification_raw.get('actor')
+    context = notification_raw.get('context')
+    return {
+        'notification_type': get_notification_type(notification_raw),
+        'workflow_status': get_workflow_status(notification_raw),
+        'actor_id': actor.get('id') if isinstance(actor, dict) else None,
+        'in_reply_to': notification_raw.get('inReplyTo'),
+        'context_url': context.get('id') if isinstance(context, dict) else None,
+    }
+
+
+def get_actor_by_actor_id(notification_raw: dict, batch_context: Optional[InboxBatchContext] = None) -> CachedActor:
     """
     Extract actor data from notification by actor ID.
     
     Args:
         notification_raw: The raw notification data
+        batch_context: Batch context with prefetched actors (optional)
         
     Returns:
-        ActorModel if found
+        CachedActor: A snapshot of the actor, from the batch context or the actor cache
         
     Raises:
         DataNotFound: If actor ID is not found or actor doesn't exist
@@ -204,7 +312,10 @@ def get_actor_by_actor_id(notification_raw: dict) -> ActorModel:
         raise DataNotFound(f"Actor ID not found in notification, actor[{actor_id}]")
 
     # Find ActorModel with matching actor_id
-    actor = ActorModel.query.filter_by(actor_id=actor_id).first()
+    if batch_context is not None:
+        actor = batch_context.get_actor(actor_id)
+    else:
+        actor = current_actor_cache.get_actor(actor_id)
     if not actor:
         raise DataNotFound(f"Actor not found, actor_id[{actor_id}]")
 
@@ -213,7 +324,8 @@ def get_actor_by_actor_id(notification_raw: dict) -> ActorModel:
 
 @unit_of_work()
 def create_endorsement_record(identity, record_item: Union[str, RDMRecordMetadata], inbox_id, notification_raw,
-                              actor: ActorModel, endo_reply_id: Optional[int] = None, uow=None):
+                              actor: ActorModel, endo_reply_id: Optional[int] = None,
+                              digest: Optional[NotificationDigest] = None, uow=None):
     """
     Create a new endorsement record using the endorsement service.
 
@@ -227,6 +339,7 @@ def create_endorsement_record(identity, record_item: Union[str, RDMRecordMetadat
         notification_raw: The raw notification data
         actor: The actor associated with the notification
         endo_reply_id: Id of the endorsement reply if applicable
+        digest: Buffers the email in a digest of the record owner instead of sending it (optional)
 
     Returns:
         The created endorsement record
@@ -242,12 +355,10 @@ def create_endorsement_record(identity, record_item: Union[str, RDMRecordMetadat
 
     # Handle both string record_id and RDMRecordMetadata object
     if isinstance(record_item, str):
-        record = None  # Will be queried only if needed for endorsement type
         record_id = record_item
     else:
         # record_item is RDMRecordMetadata object
-        record = record_item
-        record_id = str(record.id)
+        record_id = str(record_item.id)
 
     review_url = notification_raw['object'].get(constants.KEY_INBOX_REVIEW_URL) or notification_raw['object'].get('id')
 
@@ -265,30 +376,39 @@ def create_endorsement_record(identity, record_item: Union[str, RDMRecordMetadat
     # Get actor name for notification
     actor_name = actor.name
 
-    if noti_type == constants.TYPE_ENDORSEMENT:
-        # Get the record if we don't have it yet
-        record = record or get_record_by_id(record_id)
-        uow.register(
-            NotificationOp(
-                NewEndorsementNotificationBuilder.build(
-                    record=record,
-                    actor_name=actor_name,
-                    endorsement_url=review_url,
-                    user_id=get_user_id_by_record(record),
-                ),
+    if noti_type == constants.TYPE_ENDORSEMENT and digest is not None:
+        user_id = digest.get_owner(record_id, get_record_owner_id)
+        uow.register(DigestEventOp(digest, user_id, {
+            'type': NewEndorsementNotificationBuilder.type,
+            'record_id': record_id,
+            'actor_name': actor_name,
+            'endorsement_url': review_url,
+        }))
+    elif noti_type == constants.TYPE_ENDORSEMENT:
+        with stage_timer('notification_build'):
+            record = get_record_summary_by_id(record_id)
+            notification = NewEndorsementNotificationBuilder.build(
+                record=record,
+                actor_name=actor_name,
+                endorsement_url=review_url,
+                user_id=get_owner_id(record),
             )
-        )
+        uow.register(NotificationOp(notification))
     elif noti_type == constants.TYPE_REVIEW:
         create_endorsement_update_notification(
             record_id,
             actor_name,
             constants.WORKFLOW_STATUS_ANNOUNCE_REVIEW,
-            uow
+            uow,
+            digest=digest,
         )
 
 
     # Create the endorsement record
-    return endorsement_service.create(identity, endorsement_data, uow=uow)
+    with stage_timer('endorsement_create'):
+        result = endorsement_service.create(identity, endorsement_data, uow=uow)
+        RecordActorStatusModel.set_endorsement(record_id, actor_id, noti_type)
+    return result
 
 
 def resolve_record_from_notification(record_url: str) -> Optional[RDMRecord]:
@@ -299,13 +419,16 @@ def resolve_record_from_notification(record_url: str) -> Optional[RDMRecord]:
         record_url: The record URL from notification context
         
     Returns:
-        RDMRecord if successfully resolved, None if extraction or resolution fails
+        RDMRecord if successfully resolved, None if no record with the extracted ID exists (yet)
+
+    Raises:
+        DataNotFound: If no record ID can be extracted from the URL
     """
     # Extract record_id from URL
     record_id = get_recid_by_record_url(record_url)
     if not record_id:
         log.error(f"Could not extract record_id from notification")
-        return None
+        raise DataNotFound(f"Failed to extract record ID from notification URL {record_url}")
 
     log.info(f"Extracted record_id: {record_id}")
 
@@ -325,6 +448,8 @@ def handle_endorsement_and_review(inbox_record: NotifyInboxModel,
                                   notification_raw: dict,
                                   actor: ActorModel,
                                   endo_reply_id: Optional[int] = None,
+                                  reindex_collector: Optional[ReindexCollector] = None,
+                                  digest: Optional[NotificationDigest] = None,
                                   uow=None, ):
     """
     Process endorsement review for a single inbox record.
@@ -334,15 +459,20 @@ def handle_endorsement_and_review(inbox_record: NotifyInboxModel,
         notification_raw: The raw notification data
         actor: The actor associated with the notification
         endo_reply_id: Id of the endorsement reply if applicable
+        reindex_collector: Collects the parent for a bulk reindex after the batch,
+            all versions of the parent are indexed immediately if not given
+        digest: Buffers the email in a digest of the record owner instead of sending it (optional)
         
     Returns:
         bool: True if processing was successful, False otherwise
     """
     # Resolve record from notification
-    record_url = notification_raw['context']['id']
-    record = resolve_record_from_notification(record_url)
+    record_url = inbox_record.context_url or notification_raw['context']['id']
+    with stage_timer('record_resolve'):
+        record = resolve_record_from_notification(record_url)
     if record is None:
-        raise DataNotFound(f"Failed to resolve record from notification")
+        # the record may not be registered yet
+        raise TransientError(f"Failed to resolve record from notification")
 
     # Create endorsement record
     endorsement = create_endorsement_record(
@@ -351,22 +481,25 @@ def handle_endorsement_and_review(inbox_record: NotifyInboxModel,
         inbox_record.id,
         notification_raw,
         actor,
-        endo_reply_id
+        endo_reply_id,
+        digest=digest,
+        uow=uow,
     )
 
     log.info(f"Created endorsement record: {endorsement._record.id}")
 
-    record_ids = [row[0] for row in db.session.query(RDMRecordMetadata.id).filter_by(parent_id=record.parent.id).all()]
-
-    # Iterate over all RDMRecordMetadata records with this parent_id
-    for record_id in record_ids:
-        # Indexing the record will add the endorsement data via EndorsementsDumperExt
-        current_rdm_records_service.indexer.index_by_id(record_id)
+    if reindex_collector is not None:
+        reindex_collector.add(record.parent.id)
+    else:
+        with stage_timer('reindex'):
+            reindex_parent_versions(record.parent.id)
 
 
 @unit_of_work()
 def handle_endorsement_reply(inbox_record: NotifyInboxModel,
-                             notification_raw: dict, uow=None) -> Optional[EndorsementReplyModel]:
+                             notification_raw: dict,
+                             batch_context: Optional[InboxBatchContext] = None,
+                             uow=None) -> Optional[EndorsementReplyModel]:
     """
     Process endorsement reply for a single inbox record.
     Creates a new EndorsementReplyModel record.
@@ -374,25 +507,29 @@ def handle_endorsement_reply(inbox_record: NotifyInboxModel,
     Args:
         inbox_record: The inbox record to process
         notification_raw: The raw notification data
+        batch_context: Batch context with prefetched endorsement requests (optional)
         
     Returns:
         bool: True if processing was successful, False otherwise
     """
 
     # Extract notification_id from inReplyTo field
-    notification_id = notification_raw.get('inReplyTo', '')
+    notification_id = inbox_record.in_reply_to or notification_raw.get('inReplyTo', '')
     if not notification_id:
         log.debug(f"Notification {inbox_record.id} does not have inReplyTo field")
         return
 
     # Find the endorsement request using notification_id instead of actor_id
-    endorsement_request = EndorsementRequestModel.query.filter_by(notification_id=notification_id).first()
+    if batch_context is not None:
+        endorsement_request = batch_context.get_endorsement_request(notification_id)
+    else:
+        endorsement_request = EndorsementRequestModel.query.filter_by(notification_id=notification_id).first()
     if not endorsement_request:
         log.debug(f"Endorsement request with notification_id {notification_id} not found")
         raise DataNotFound(f"Endorsement request not found for notification id[{inbox_record.id}], notification_id[{notification_id}]")
 
     # Extract workflow status from notification
-    workflow_status = get_workflow_status(notification_raw)
+    workflow_status = inbox_record.workflow_status or get_workflow_status(notification_raw)
     if not workflow_status:
         raise DataNotFound(f"Notification type not found in notification {inbox_record.id}")
     # Extract message from notification if available
@@ -406,72 +543,420 @@ def handle_endorsement_reply(inbox_record: NotifyInboxModel,
             endorsement_request.record_id,
             endorsement_request.actor.name,
             workflow_status,
-            uow
+            uow,
+            digest=batch_context.digest if batch_context else None,
         )
 
-    reply = EndorsementReplyModel.create({
-        'endorsement_request_id': endorsement_request.id,
-        'inbox_id': inbox_record.id,
-        'status': workflow_status,
-        'message': message
-    })
+    with stage_timer('reply_create'):
+        reply = EndorsementReplyModel.create({
+            'endorsement_request_id': endorsement_request.id,
+            'inbox_id': inbox_record.id,
+            'status': workflow_status,
+            'message': message
+        })
     log.info(f"Created endorsement reply record: {reply.id}")
 
     # Update endorsement_request.latest_status with workflow status
-    endorsement_request.latest_status = workflow_status
+    EndorsementRequestModel.update({'latest_status': workflow_status}, endorsement_request.id)
+    RecordActorStatusModel.set_reply(endorsement_request.record_id, endorsement_request.actor_id,
+                                     endorsement_request.id, workflow_status, inbox_record.notification_id)
 
     return reply
 
 
-def inbox_processing():
-    for inbox_record in NotifyInboxModel.unprocessed_records():
+@unit_of_work()
+def process_inbox_record(inbox_record: NotifyInboxModel, batch_context: Optional[InboxBatchContext] = None,
+                         uow=None):
+    """
+    Process a single inbox record and mark it as processed.
+
+    The endorsement reply and endorsement are created in a savepoint, so if
+    handling fails, only the work of this record is rolled back and the other
+    records of the unit of work are kept.
+
+    Args:
+        inbox_record: The inbox record to process
+        batch_context: State shared by the records of the batch, records are
+            reindexed immediately and lookups hit the database if not given
+    """
+    if inbox_record.notification_type:
+        # Validated and normalized when received, no need to parse it again
+        notification_raw: dict = inbox_record.raw
+        noti_type = inbox_record.notification_type
+    else:
         try:
-            notification = COARNotifyFactory.get_by_object(inbox_record.raw)
-            notification_raw: dict = notification.to_jsonld()
+            with stage_timer('decode'):
+                notification = COARNotifyFactory.get_by_object(inbox_record.raw)
+                notification_raw: dict = notification.to_jsonld()
         except Exception as e:
             msg = f"Failed to decode inbox json {inbox_record.id}: {e}"
             log.error(msg)
-            mark_as_processed(inbox_record, msg)
-            continue
+            mark_as_processed(inbox_record, msg, uow=uow)
+            return
 
         noti_type = get_notification_type(notification_raw)
 
-        # Check if the notification type is supported
-        if not noti_type:
-            log.error(f'Unknown type: [{inbox_record.id=}]{notification_raw.get("type")}')
-            mark_as_processed(inbox_record, "Notification type not supported")
-            continue
+    # Check if the notification type is supported
+    if not noti_type:
+        log.error(f'Unknown type: [{inbox_record.id=}]{notification_raw.get("type")}')
+        mark_as_processed(inbox_record, "Notification type not supported", uow=uow)
+        return
 
+    with stage_timer('actor_lookup'):
         # Get actor using the utility function
         try:
-            actor = get_actor_by_actor_id(notification_raw)
+            actor = get_actor_by_actor_id(notification_raw, batch_context)
         except DataNotFound as e:
             log.warning(f"Failed to get actor: {e}")
-            mark_as_processed(inbox_record, e.message)
-            continue
+            mark_as_processed(inbox_record, e.message, uow=uow)
+            return
 
         # Check if noti sender is a member of the actor
-        if not ActorModel.has_member(inbox_record.user_id, actor.actor_id):
-            log.warning(f"User {inbox_record.user_id} is not a member of actor {actor.actor_id}")
-            mark_as_processed(inbox_record, "User is not a member of actor")
-            continue
+        if batch_context is not None:
+            is_member = batch_context.has_member(inbox_record.user_id, actor.actor_id)
+        else:
+            is_member = current_actor_cache.has_member(inbox_record.user_id, actor.actor_id)
+    if not is_member:
+        log.warning(f"User {inbox_record.user_id} is not a member of actor {actor.actor_id}")
+        mark_as_processed(inbox_record, "User is not a member of actor", uow=uow)
+        return
 
-        try:
-            reply = handle_endorsement_reply(inbox_record, notification_raw)
+    try:
+        with savepoint(uow) as savepoint_uow:
+            reply = handle_endorsement_reply(inbox_record, notification_raw, batch_context, uow=savepoint_uow)
             if noti_type in {constants.TYPE_REVIEW, constants.TYPE_ENDORSEMENT}:
                 endo_reply_id = reply.id if reply else None
-                handle_endorsement_and_review(inbox_record, notification_raw, actor, endo_reply_id)
+                handle_endorsement_and_review(
+                    inbox_record, notification_raw, actor, endo_reply_id,
+                    reindex_collector=batch_context.reindex_collector if batch_context else None,
+                    digest=batch_context.digest if batch_context else None,
+                    uow=savepoint_uow,
+                )
+
+        # Mark inbox as processed after successful reply creation
+        mark_as_processed(inbox_record, uow=uow)
+    except DataNotFound as e:
+        log.warning(f"Failed to process inbox record {inbox_record.id}: {e}")
+        mark_as_processed(inbox_record, e.message, uow=uow)
+    except ValidationError as e:
+        log.warning(f"Failed to process inbox record {inbox_record.id}, validation error: {e}")
+        mark_as_processed(inbox_record, str(e), uow=uow)
+
+
+def process_inbox_batch(batch: list[NotifyInboxModel], commit_size: Optional[int] = None,
+                        worker_id: Optional[str] = None):
+    """
+    Process a batch of claimed inbox records.
 
-            # Mark inbox as processed after successful reply creation
-            mark_as_processed(inbox_record)
-        except DataNotFound as e:
-            log.warning(f"Failed to process inbox record {inbox_record.id}: {e}")
-            mark_as_processed(inbox_record, e.message)
-        except ValidationError as e:
-            log.warning(f"Failed to process inbox record {inbox_record.id}, validation error: {e}")
-            mark_as_processed(inbox_record, str(e))
+    Actors, memberships and endorsement requests of the whole batch are loaded
+    up front, and all versions of the touched parents are sent to the indexer
+    in one bulk request once the whole batch is processed.
+
+    Records are committed in chunks of ``commit_size``, each chunk in one
+    transaction in which every record runs in its own savepoint. A failing record
+    rolls back only its own work and is retried with exponential backoff. Once
+    its attempts are used up, a record failing with a ``TransientError`` is
+    marked as processed with the error as note, and a record failing with an
+    unexpected error is quarantined.
+
+    Each record is locked before it is processed, a record whose claim expired
+    and was taken by another worker (or that is processed already) is skipped.
+
+    Args:
+        batch: The claimed inbox records
+        commit_size: Number of records committed in one transaction
+            (default: NOTIFY_INBOX_COMMIT_SIZE)
+        worker_id: Identifier of the worker that claimed the records, the claims
+            are not checked if not given
+    """
+    commit_size = commit_size or current_app.config.get('NOTIFY_INBOX_COMMIT_SIZE', 1)
+    batch_context = InboxBatchContext(digest=current_app.config.get('NOTIFY_EMAIL_DIGEST', False))
+    with stage_timer('prefetch'):
+        batch_context.prefetch(batch)
+    # read before the commits expire the records, the claims are checked before they are loaded again
+    batch_ids = [inbox_record.id for inbox_record in batch]
+    try:
+        for start in range(0, len(batch), commit_size):
+            with UnitOfWork(db.session) as uow:
+                outcomes = []
+                chunk = zip(batch_ids[start:start + commit_size], batch[start:start + commit_size])
+                for inbox_id, inbox_record in chunk:
+                    if worker_id is not None and not NotifyInboxModel.lock_claimed(inbox_id, worker_id):
+                        log.warning(f"Inbox record {inbox_id} is not claimed by worker {worker_id} anymore, skipped")
+                        continue
+                    try:
+                        with savepoint(uow) as record_uow:
+                            process_inbox_record(inbox_record, batch_context=batch_context, uow=record_uow)
+                        # records with a note were rejected (e.g. actor not found)
+                        outcome = 'processed' if inbox_record.process_note is None else 'rejected'
+                    except TransientError as e:
+                        log.warning(f"Failed to process inbox record {inbox_record.id}, will retry: {e}")
+                        outcome = 'retry'
+                        if record_processing_failure(inbox_record, e, uow=uow):
+                            outcome = 'failed'
+                            mark_as_processed(inbox_record, e.message, uow=uow)
+                    except Exception as e:
+                        log.exception(f"Unexpected error while processing inbox record {inbox_record.id}")
+                        outcome = 'retry'
+                        if record_processing_failure(inbox_record, e, uow=uow):
+                            log.error(f"Inbox record {inbox_record.id} quarantined after "
+                                      f"{inbox_record.attempts} failed attempts")
+                            outcome = 'quarantined'
+                            quarantine(inbox_record, uow=uow)
+                    # read before the commit expires the record
+                    outcomes.append((inbox_record.notification_type, inbox_record.actor_id, outcome))
+
+                with stage_timer('commit'):
+                    uow.commit()
+            for notification_type, actor_id, outcome in outcomes:
+                count_notification(notification_type, actor_id, outcome)
+    finally:
+        try:
+            with stage_timer('reindex'):
+                batch_context.reindex_collector.flush()
+        except Exception:
+            # the records are committed already, a failing indexer must not stop the run
+            log.exception("Failed to queue the records of the inbox batch for indexing")
+        if batch_context.digest is not None:
+            try:
+                with stage_timer('notification_build'):
+                    batch_context.digest.flush()
+            except Exception:
+                log.exception("Failed to send the endorsement notification digests of the inbox batch")
+
+
+def create_worker_id() -> str:
+    """Create an identifier for an inbox processing worker (host, pid and a random suffix)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def inbox_processing(batch_size: Optional[int] = None):
+    """
+    Process unprocessed inbox records until none can be claimed.
+
+    Records are claimed in batches with ``SELECT ... FOR UPDATE SKIP LOCKED``,
+    so several workers (Celery tasks or ``invenio notify run`` processes) can run
+    at the same time, each draining its own disjoint batches.
+
+    Args:
+        batch_size: Number of records claimed per batch (default: NOTIFY_INBOX_BATCH_SIZE)
+    """
+    batch_size = batch_size or current_app.config.get('NOTIFY_INBOX_BATCH_SIZE', 100)
+    claim_timeout = current_app.config.get('NOTIFY_INBOX_CLAIM_TIMEOUT', 600)
+    worker_id = create_worker_id()
+    record_queue_metrics()
+
+    while True:
+        with stage_timer('claim'):
+            batch = NotifyInboxModel.claim_unprocessed_records(
+                worker_id, batch_size=batch_size, claim_timeout=claim_timeout,
+            )
+        if not batch:
+            break
+
+        log.info(f"Worker {worker_id} claimed {len(batch)} inbox records")
+        process_inbox_batch(batch, worker_id=worker_id)
+
+    record_queue_metrics()
+    export_path = current_app.config.get('NOTIFY_METRICS_EXPORT_PATH')
+    if export_path:
+        current_notify_metrics.export(export_path)
+
+
+RETRY_DELIVERY_STATUSES = {408, 425, 429}
+""" Response statuses of an actor inbox (besides 5xx) after which the delivery is retried """
+
+
+def is_transient_delivery_error(error: Exception) -> bool:
+    """
+    Check if a failed delivery of an endorsement request may succeed later.
+
+    Connection errors, timeouts and 5xx, 408, 425 and 429 responses are transient.
+    A missing inbox URL and other 4xx responses (e.g. an invalid token) are not.
+    """
+    if isinstance(error, ValueError):
+        return False
+    if isinstance(error, SendRequestFail) and error.status is not None:
+        return error.status >= 500 or error.status in RETRY_DELIVERY_STATUSES
+    return True
+
+
+@unit_of_work()
+def record_delivery_failure(endorsement_request: EndorsementRequestModel, error: Exception,
+                            uow=None) -> Optional[int]:
+    """
+    Count a failed delivery attempt of an endorsement request and schedule the
+    next attempt with exponential backoff (NOTIFY_DELIVERY_RETRY_BACKOFF doubled
+    per failed attempt, capped at NOTIFY_DELIVERY_RETRY_BACKOFF_MAX seconds).
+
+    The request is marked as failed if the error is not transient or if it
+    failed NOTIFY_DELIVERY_MAX_ATTEMPTS times.
+
+    Args:
+        endorsement_request: The endorsement request that failed to be delivered
+        error: The error raised while delivering the request
+
+    Returns:
+        int: Seconds until the next attempt, None if the request will not be retried
+    """
+    max_attempts = current_app.config.get('NOTIFY_DELIVERY_MAX_ATTEMPTS', 8)
+    backoff = current_app.config.get('NOTIFY_DELIVERY_RETRY_BACKOFF', 30)
+    backoff_max = current_app.config.get('NOTIFY_DELIVERY_RETRY_BACKOFF_MAX', 6 * 3600)
+
+    description = getattr(error, 'description', error)
+    status = getattr(error, 'status', None)
+    endorsement_request.delivery_attempts = (endorsement_request.delivery_attempts or 0) + 1
+    endorsement_request.last_delivery_error = (f"{type(error).__name__}: {description}"
+                                               + (f" [{status}]" if status else ""))
+    if not is_transient_delivery_error(error) or endorsement_request.delivery_attempts >= max_attempts:
+        endorsement_request.delivery_status = constants.DELIVERY_STATUS_FAILED
+        endorsement_request.next_delivery_at = None
+        # the actor can be requested again
+        RecordActorStatusModel.refresh(endorsement_request.record_id, endorsement_request.actor_id)
+        return None
+
+    delay = min(backoff * 2 ** (endorsement_request.delivery_attempts - 1), backoff_max)
+    endorsement_request.next_delivery_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+    return delay
+
+
+@unit_of_work()
+def mark_delivered(endorsement_request: EndorsementRequestModel, uow=None):
+    """Mark an endorsement request as accepted by the inbox of the actor."""
+    endorsement_request.delivery_status = constants.DELIVERY_STATUS_DELIVERED
+    endorsement_request.delivered_at = datetime.now(timezone.utc)
+    endorsement_request.next_delivery_at = None
+
+
+@unit_of_work()
+def defer_delivery(endorsement_request: EndorsementRequestModel, seconds: int, uow=None):
+    """Postpone the delivery of an endorsement request without counting a failed attempt."""
+    endorsement_request.next_delivery_at = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+def deliver_endorsement_request(endorsement_request: EndorsementRequestModel) -> str:
+    """
+    Post a claimed endorsement request to the inbox of its actor and record the outcome.
+
+    A failed request that will be retried is also scheduled as a Celery task
+    after its backoff, the scheduled delivery job picks it up if that task is lost.
+
+    Args:
+        endorsement_request: The claimed endorsement request
+
+    Returns:
+        str: The outcome, 'delivered', 'deferred' (the circuit breaker of the actor is open), 'retry' or 'failed'
+    """
+    request_id = endorsement_request.id
+    actor_id = endorsement_request.actor_id
+    try:
+        send_to_actor_inbox(endorsement_request.actor, endorsement_request.raw)
+    except CircuitOpenError as e:
+        defer_delivery(endorsement_request, e.retry_after)
+        log.info(f"Delivery of endorsement request [{request_id}] deferred by {e.retry_after}s, "
+                 f"the circuit of actor [{actor_id}] is open")
+        shared_task_deliver_endorsement_request.apply_async(args=[request_id], countdown=e.retry_after)
+        outcome = 'deferred'
+    except Exception as e:
+        if not isinstance(e, (SendRequestFail, ValueError)):
+            log.exception(f"Unexpected error while delivering endorsement request [{request_id}]")
+        retry_in = record_delivery_failure(endorsement_request, e)
+        if retry_in is None:
+            log.warning(f"Delivery of endorsement request [{request_id}] failed permanently: {e}")
+            outcome = 'failed'
+        else:
+            log.info(f"Delivery of endorsement request [{request_id}] failed, retry in {retry_in}s")
+            shared_task_deliver_endorsement_request.apply_async(args=[request_id], countdown=retry_in)
+            outcome = 'retry'
+    else:
+        mark_delivered(endorsement_request)
+        log.info(f"Delivered endorsement request [{request_id}] to actor [{actor_id}]")
+        outcome = 'delivered'
+
+    current_notify_metrics.incr('notify_endorsement_request_deliveries_total', actor=str(actor_id),
+                                outcome=outcome)
+    return outcome
+
+
+def deliver_pending_endorsement_requests(ids: Optional[list] = None, batch_size: Optional[int] = None):
+    """
+    Deliver the endorsement requests whose delivery is due until none can be claimed.
+
+    Requests are claimed in batches with ``SELECT ... FOR UPDATE SKIP LOCKED``
+    (see EndorsementRequestModel.claim_pending_deliveries), so the delivery
+    tasks and the scheduled delivery job never post the same request twice.
+
+    Args:
+        ids: Optional list of endorsement request ids, only these requests will be delivered
+        batch_size: Number of requests claimed per batch (default: NOTIFY_DELIVERY_BATCH_SIZE)
+    """
+    batch_size = batch_size or current_app.config.get('NOTIFY_DELIVERY_BATCH_SIZE', 100)
+    claim_timeout = current_app.config.get('NOTIFY_DELIVERY_CLAIM_TIMEOUT', 120)
+
+    while True:
+        batch = EndorsementRequestModel.claim_pending_deliveries(
+            batch_size=batch_size, claim_timeout=claim_timeout, ids=ids,
+        )
+        if not batch:
+            break
+        for endorsement_request in batch:
+            deliver_endorsement_request(endorsement_request)
+        if ids is not None:
+            break
+
+
+@shared_task(ignore_result=True)
+def shared_task_process_inbox_record(inbox_id):
+    """
+    Process one inbox record right after it has been received.
+
+    Scheduled after commit by NotifyInboxService.create when
+    NOTIFY_INBOX_PROCESS_ON_RECEIVE is enabled. The record is claimed first, so
+    it is skipped if a running inbox_processing worker already owns it.
+
+    Args:
+        inbox_id: The ID of the inbox record
+    """
+    worker_id = create_worker_id()
+    batch = NotifyInboxModel.claim_unprocessed_records(
+        worker_id,
+        batch_size=1,
+        claim_timeout=current_app.config.get('NOTIFY_INBOX_CLAIM_TIMEOUT', 600),
+        ids=[inbox_id],
+    )
+    process_inbox_batch(batch, worker_id=worker_id)
 
 
 @shared_task
 def shared_task_inbox_processing():
+    """Scheduled entry point, starts additional workers according to NOTIFY_INBOX_WORKERS."""
+    n_workers = current_app.config.get('NOTIFY_INBOX_WORKERS', 1)
+    for _ in range(n_workers - 1):
+        shared_task_inbox_worker.delay()
+    inbox_processing()
+
+
+@shared_task
+def shared_task_inbox_worker():
     inbox_processing()
+
+
+@shared_task(ignore_result=True)
+def shared_task_deliver_endorsement_request(endorsement_request_id):
+    """
+    Deliver one endorsement request to the inbox of its actor.
+
+    Scheduled after commit by EndorsementRequestResource.send and after the
+    backoff of a failed attempt. The request is claimed first, so it is skipped
+    if it is not due, already delivered or owned by another worker.
+
+    Args:
+        endorsement_request_id: The ID of the endorsement request
+    """
+    deliver_pending_endorsement_requests(ids=[endorsement_request_id], batch_size=1)
+
+
+@shared_task
+def shared_task_endorsement_request_delivery():
+    """Scheduled entry point, delivers the endorsement requests that are due (e.g. whose task was lost)."""
+    deliver_pending_endorsement_requests()
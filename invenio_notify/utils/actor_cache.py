@@ -0,0 +1,174 @@
+import logging
+import os
+import select
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from invenio_db import db
+from invenio_db.uow import Operation
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from invenio_notify.proxies import current_actor_cache
+from invenio_notify.records.models import ActorModel
+from invenio_notify.utils.cache_utils import TTLCache
+
+log = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = 'invenio_notify_actor_cache'
+""" Postgres LISTEN/NOTIFY channel on which actor changes are announced """
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CachedActor:
+    """The fields of an ActorModel needed to process notifications, safe to share between sessions."""
+    id: int
+    actor_id: str
+    name: str
+    inbox_url: Optional[str]
+
+    @classmethod
+    def from_model(cls, model: ActorModel) -> 'CachedActor':
+        return cls(model.id, model.actor_id, model.name, model.inbox_url)
+
+
+class ActorCache:
+    """
+    In-process cache of actors by ``actor_id`` and of memberships by ``(user_id, actor_id)``.
+
+    Entries expire after ``ttl`` seconds (a ``ttl`` of 0 disables the cache).
+    Changes of actors and memberships are announced with ``invalidate_actor_cache``,
+    which clears the cache of the current process after the commit and of all
+    other processes through Postgres ``LISTEN/NOTIFY``, see ``start_listener``.
+    """
+
+    def __init__(self, ttl: float = 60, maxsize: int = 1024, listen: bool = True):
+        self.enabled = ttl > 0
+        self.listen = listen
+        self._actors = TTLCache(ttl, maxsize)
+        self._memberships = TTLCache(ttl, maxsize)
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+        self._listening = threading.Event()
+        self._stop_listener = threading.Event()
+
+    def get_actor(self, actor_id) -> Optional[CachedActor]:
+        """Get an actor by its actor_id, None if the actor does not exist."""
+        self._ensure_listener()
+        actor = self._actors.get(actor_id, _MISSING)
+        if actor is _MISSING:
+            model = ActorModel.query.filter_by(actor_id=actor_id).first()
+            actor = CachedActor.from_model(model) if model else None
+            if self.enabled:
+                self._actors.set(actor_id, actor)
+        return actor
+
+    def has_member(self, user_id, actor_id) -> bool:
+        """Check if a user is a member of the actor with the given actor_id."""
+        self._ensure_listener()
+        key = (user_id, actor_id)
+        is_member = self._memberships.get(key)
+        if is_member is None:
+            is_member = ActorModel.has_member(user_id, actor_id)
+            if self.enabled:
+                self._memberships.set(key, is_member)
+        return is_member
+
+    def clear(self):
+        self._actors.clear()
+        self._memberships.clear()
+
+    def _ensure_listener(self):
+        if self.enabled and self.listen and self._listener_pid != os.getpid():
+            self.start_listener(db.engine)
+
+    def start_listener(self, engine):
+        """
+        Clear the cache whenever another process announces an actor change.
+
+        A daemon thread per process LISTENs on a dedicated connection, opened
+        outside the connection pool of ``engine`` so the listener does not take
+        a pooled connection away from the requests and tasks of the process.
+        It is started again in forked processes (e.g. gunicorn or Celery workers).
+        """
+        if not self.enabled or engine.dialect.name != 'postgresql':
+            return
+        with self._listener_lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            # events of this thread, a stopped thread may still be running
+            self._listening = threading.Event()
+            self._stop_listener = threading.Event()
+            threading.Thread(target=self._listen, args=(engine, self._listening, self._stop_listener),
+                             daemon=True, name='notify-actor-cache-listener').start()
+
+    def stop_listener(self):
+        """Stop the listener thread of this process, it is started again on the next use of the cache."""
+        with self._listener_lock:
+            self._stop_listener.set()
+            self._listener_pid = None
+
+    def wait_listening(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the listener thread LISTENs, True if it does."""
+        return self._listening.wait(timeout)
+
+    def _listen(self, engine, listening: threading.Event, stop: threading.Event):
+        # a connection of its own, not checked out of (and never returned to) the pool
+        listen_engine = create_engine(engine.url, poolclass=NullPool)
+        while not stop.is_set():
+            connection = None
+            try:
+                connection = listen_engine.raw_connection()
+                dbapi_connection = connection.dbapi_connection
+                dbapi_connection.autocommit = True
+                with dbapi_connection.cursor() as cursor:
+                    cursor.execute(f'LISTEN {INVALIDATION_CHANNEL}')
+                # changes may have been missed while not listening
+                self.clear()
+                listening.set()
+                while not stop.is_set():
+                    if select.select([dbapi_connection], [], [], 5) == ([], [], []):
+                        continue
+                    dbapi_connection.poll()
+                    if dbapi_connection.notifies:
+                        dbapi_connection.notifies.clear()
+                        self.clear()
+            except Exception:
+                log.exception("Actor cache listener failed, reconnecting")
+                stop.wait(5)
+            finally:
+                listening.clear()
+                if connection is not None:
+                    connection.close()
+        listen_engine.dispose()
+
+
+class ActorCacheInvalidateOp(Operation):
+    """Announce an actor change on commit and clear the actor cache of this process after it."""
+
+    def __init__(self, actor_cache: ActorCache):
+        self._actor_cache = actor_cache
+
+    def on_commit(self, uow):
+        if db.engine.dialect.name == 'postgresql':
+            # delivered to the listeners when the transaction commits
+            uow.session.execute(text('SELECT pg_notify(:channel, \'\')'), {'channel': INVALIDATION_CHANNEL})
+
+    def on_post_commit(self, uow):
+        self._actor_cache.clear()
+
+
+def invalidate_actor_cache(uow):
+    """
+    Invalidate the cached actors and memberships of all processes once the unit of work is committed.
+
+    Must be called by everything that creates, updates or deletes actors or memberships.
+
+    Args:
+        uow: The unit of work of the change
+    """
+    uow.register(ActorCacheInvalidateOp(current_actor_cache))
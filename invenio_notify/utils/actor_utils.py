@@ -1,8 +1,16 @@
 from invenio_db import db
 from invenio_db.uow import unit_of_work
 
-from invenio_notify.records.models import ActorMapModel
+from invenio_notify.records.models import ActorMapModel, ActorModel
 from invenio_notify.utils import user_utils
+from invenio_notify.utils.actor_cache import invalidate_actor_cache
+
+
+@unit_of_work()
+def create_actor(data: dict, uow=None) -> ActorModel:
+    actor = ActorModel.create(data)
+    invalidate_actor_cache(uow)
+    return actor
 
 
 @unit_of_work()
@@ -12,3 +20,4 @@ def add_member_to_actor(actor_id, user_id, uow=None):
         'actor_id': actor_id,
     })
     user_utils.add_coarnotify_action(db, user_id)
+    invalidate_actor_cache(uow)
@@ -0,0 +1,72 @@
+import logging
+from typing import Optional
+
+from flask import current_app, has_app_context
+from invenio_pidstore.models import PersistentIdentifier
+from invenio_rdm_records.records.models import RDMVersionsState
+from sqlalchemy import event, inspect
+
+from invenio_notify.utils.cache_utils import TTLCache
+from invenio_notify.utils.record_utils import get_recid_by_doi
+
+log = logging.getLogger(__name__)
+
+
+class DoiCache:
+    """
+    In-process cache of the recids of records by normalized DOI.
+
+    A miss is resolved with ``get_recid_by_doi`` and only found recids are
+    cached. Entries expire after ``ttl`` seconds (a ``ttl`` of 0 disables the
+    cache) and are dropped when a DOI PID is updated or deleted in this
+    process. The whole cache is cleared when a new version becomes the latest
+    one, since concept DOIs resolve to the latest version.
+
+    The invalidation is in-process only: a change made by another process (e.g.
+    a DOI deleted in a web worker) is not seen by this cache, which may return
+    the old recid until the entry expires. Keep ``ttl`` short for this reason.
+    """
+
+    def __init__(self, ttl: float = 60, maxsize: int = 10000):
+        self.enabled = ttl > 0
+        self._recids = TTLCache(ttl, maxsize)
+
+    def get_recid(self, doi: str) -> Optional[str]:
+        """Get the recid of the record with a normalized DOI, None if no published record has the DOI."""
+        recid = self._recids.get(doi)
+        if recid is None:
+            recid = get_recid_by_doi(doi)
+            if recid is not None and self.enabled:
+                self._recids.set(doi, recid)
+        return recid
+
+    def discard(self, doi: str):
+        self._recids.discard(doi)
+
+    def clear(self):
+        self._recids.clear()
+
+
+def _get_doi_cache() -> Optional[DoiCache]:
+    if not has_app_context():
+        return None
+    ext = current_app.extensions.get('invenio-notify')
+    return getattr(ext, 'doi_cache', None)
+
+
+@event.listens_for(PersistentIdentifier, 'after_update')
+@event.listens_for(PersistentIdentifier, 'after_delete')
+def _discard_doi(mapper, connection, target):
+    doi_cache = _get_doi_cache()
+    if doi_cache is None or target.pid_type != 'doi':
+        return
+    history = inspect(target).attrs.pid_value.history
+    for doi in {target.pid_value, *history.deleted}:
+        doi_cache.discard(doi)
+
+
+@event.listens_for(RDMVersionsState, 'after_update')
+def _clear_dois(mapper, connection, target):
+    doi_cache = _get_doi_cache()
+    if doi_cache is not None:
+        doi_cache.clear()
@@ -1,9 +1,14 @@
 import uuid
+from typing import Optional
 
+import requests
+from flask import current_app
 from invenio_base import invenio_url_for
 from invenio_records_resources.services.records.results import RecordItem
 
 from invenio_notify.constants import WORKFLOW_STATUS_TENTATIVE_REJECT
+from invenio_notify.errors import SendRequestFail
+from invenio_notify.proxies import current_actor_circuit_breaker, current_inbox_sessions
 from invenio_notify.records.models import ActorModel, EndorsementRequestModel
 
 
@@ -15,7 +20,8 @@ def _get_user_name(user):
 
     return user.email
 
-def create_endorsement_request_data(user, record: RecordItem, actor: ActorModel, origin_id=None):
+def create_endorsement_request_data(user, record: RecordItem, actor: ActorModel, origin_id=None,
+                                    latest_request_status: Optional[tuple] = None):
     """Create endorsement request data following COAR notification structure.
     
     Args:
@@ -23,18 +29,21 @@ def create_endorsement_request_data(user, record: RecordItem, actor: ActorModel,
         record: RecordItem object representing the record
         actor: Actor object containing inbox URL and other details
         origin_id: Origin ID from configuration (optional, will be retrieved from config if not provided)
+        latest_request_status: (status, reply_notification_id) of the latest request to the actor
+            (optional, will be queried if not provided)
     """
 
     if origin_id is None:
-        from flask import current_app
         origin_id = current_app.config.get("NOTIFY_ORIGIN_ID", None)
         if not origin_id:
             raise ValueError("NOTIFY_ORIGIN_ID must be set in invenio.cfg")
 
     # Check for existing TentativeReject reply to include as inReplyTo
-    status, noti_id = EndorsementRequestModel.get_latest_status(
-        record._record.model.id, actor.id, True
-    )
+    if latest_request_status is None:
+        latest_request_status = EndorsementRequestModel.get_latest_status(
+            record._record.model.id, actor.id, True
+        )
+    status, noti_id = latest_request_status
 
     # define the object structure
     noti_obj = {
@@ -85,3 +94,59 @@ def create_endorsement_request_data(user, record: RecordItem, actor: ActorModel,
         data["inReplyTo"] = noti_id
 
     return data
+
+
+def send_to_actor_inbox(actor, endorsement_request_data: dict):
+    """Send endorsement request to actor's inbox, over a pooled keep-alive connection.
+
+    The circuit breaker of the actor is updated in the current transaction, the
+    caller commits it with the outcome of the request. The claim of a probe of a
+    half-open circuit commits the session before the request, so it must not
+    have pending changes.
+    
+    Args:
+        actor: ActorModel instance
+        endorsement_request_data: Dictionary containing endorsement request data
+        
+    Raises:
+        ValueError: If the actor has no inbox URL
+        CircuitOpenError: If the circuit breaker of the actor is open, the request is not sent
+        SendRequestFail: If the request fails or the inbox does not accept it
+    """
+    if not actor.inbox_url:
+        current_app.logger.error(
+            f'Actor inbox URL is not configured for actor {actor.id} url[{actor.inbox_url}]'
+        )
+        raise ValueError('Actor inbox URL is not configured')
+
+    current_actor_circuit_breaker.before_request(actor.id)
+
+    try:
+        response = current_inbox_sessions.post(
+            actor.inbox_url,
+            json=endorsement_request_data,
+            headers={
+                'Content-Type': 'application/ld+json',
+                'Authorization': f'Bearer {actor.inbox_api_token}',
+            },
+        )
+
+    except requests.exceptions.RequestException as e:
+        current_app.logger.error(f'Failed to send request to actor inbox: {e}')
+        current_actor_circuit_breaker.record_failure(actor.id, f'{type(e).__name__}: {e}')
+        raise SendRequestFail(f'Failed to send request: {e}')
+
+    if response.status_code >= 500:
+        current_actor_circuit_breaker.record_failure(actor.id, f'Status {response.status_code}')
+    else:
+        current_actor_circuit_breaker.record_success(actor.id)
+
+    if response.status_code not in {200, 201, 202}:
+        current_app.logger.warning(
+            f'Actor inbox request failed with '
+            f'status code [{response.status_code}] for actor [{actor.inbox_url}]'
+            f' -- {response.text}'
+        )
+        raise SendRequestFail('Actor reply invalid request', status=response.status_code)
+
+    return None
@@ -0,0 +1,68 @@
+import os
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class InboxSessionPool:
+    """
+    Keep-alive HTTP sessions to actor inboxes, one ``requests.Session`` per host.
+
+    Connections to the same host are reused, so sending to an inbox pays for the
+    TCP connection and TLS handshake once per pooled connection instead of once
+    per request. The sessions are created lazily on first use and recreated in
+    a forked process (e.g. Celery prefork workers), sockets are never shared
+    between processes. The same pool is used by the endorsement request API and
+    the background delivery.
+
+    Only connection errors are retried by the adapter, i.e. requests that did
+    not reach the inbox; other failures are retried by the delivery with backoff.
+    """
+
+    def __init__(self, pool_maxsize: int = 10, connect_timeout: float = 5, read_timeout: float = 30,
+                 retries: int = 2, retry_backoff: float = 0.5):
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self._sessions: dict[str, requests.Session] = {}
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def create_session(self) -> requests.Session:
+        retry = Retry(total=self.retries, connect=self.retries, read=0, status=0,
+                      backoff_factor=self.retry_backoff, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def get_session(self, url) -> requests.Session:
+        """Get the session of the host of a URL."""
+        parts = urlsplit(str(url))
+        key = f'{parts.scheme}://{parts.netloc}'.lower()
+        with self._lock:
+            if self._pid != os.getpid():
+                # forked, the connections belong to the parent process
+                self._sessions = {}
+                self._pid = os.getpid()
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._sessions[key] = self.create_session()
+            return session
+
+    def post(self, url, **kwargs) -> requests.Response:
+        """Send a POST request with the session of the host, with the configured timeouts by default."""
+        kwargs.setdefault('timeout', self.timeout)
+        return self.get_session(url).post(str(url), **kwargs)
+
+    def clear(self):
+        """Close all sessions and their connections."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
@@ -0,0 +1,119 @@
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from sqlalchemy.orm import selectinload
+
+from invenio_notify.notifications.digest import NotificationDigest
+from invenio_notify.proxies import current_actor_cache
+from invenio_notify.records.models import ActorModel, EndorsementRequestModel, NotifyInboxModel
+from invenio_notify.utils.actor_cache import CachedActor
+from invenio_notify.utils.reindex_utils import ReindexCollector
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedEndorsementRequest:
+    """The fields of an EndorsementRequestModel needed to handle a reply, not expired by commits."""
+    id: int
+    notification_id: str
+    record_id: uuid.UUID
+    actor_id: int
+    actor: CachedActor
+
+    @classmethod
+    def from_model(cls, model: EndorsementRequestModel) -> 'CachedEndorsementRequest':
+        return cls(model.id, model.notification_id, model.record_id, model.actor_id,
+                   CachedActor.from_model(model.actor))
+
+
+class InboxBatchContext:
+    """
+    State shared by all inbox records processed in one batch.
+
+    ``prefetch`` loads the actors, actor memberships and endorsement requests
+    referenced by a whole batch with one ``IN`` query each, so handling a record
+    reads from in-memory maps instead of querying the database per record.
+    Lookups of keys that were not prefetched fall back to the actor cache.
+
+    The maps hold plain snapshots instead of ORM instances, which would be
+    expired by the commit of each chunk of the batch and lazily reloaded one
+    row at a time.
+
+    Args:
+        digest: Buffer the emails to record owners in a digest sent after the batch
+    """
+
+    def __init__(self, digest: bool = False):
+        self.reindex_collector = ReindexCollector()
+        self.digest = NotificationDigest() if digest else None
+        self._actors: dict[str, Optional[CachedActor]] = {}
+        self._memberships: dict[tuple, bool] = {}
+        self._endorsement_requests: dict[str, Optional[CachedEndorsementRequest]] = {}
+
+    def prefetch(self, inbox_records: Iterable[NotifyInboxModel]):
+        """
+        Load everything referenced by the raw notifications of the inbox records.
+
+        Args:
+            inbox_records: The inbox records of the batch
+        """
+        actor_ids = set()
+        member_pairs = set()
+        reply_to_ids = set()
+        for inbox_record in inbox_records:
+            actor_id = inbox_record.actor_id
+            in_reply_to = inbox_record.in_reply_to
+            if not inbox_record.notification_type:
+                # not normalized when received, read from the raw notification
+                raw = inbox_record.raw if isinstance(inbox_record.raw, dict) else {}
+                actor = raw.get('actor')
+                actor_id = actor.get('id') if isinstance(actor, dict) else None
+                in_reply_to = raw.get('inReplyTo')
+
+            if actor_id:
+                actor_ids.add(actor_id)
+                member_pairs.add((inbox_record.user_id, actor_id))
+
+            if in_reply_to:
+                reply_to_ids.add(in_reply_to)
+
+        if actor_ids:
+            actors = ActorModel.query.filter(ActorModel.actor_id.in_(actor_ids)).all()
+            self._actors.update(dict.fromkeys(actor_ids))
+            self._actors.update({a.actor_id: CachedActor.from_model(a) for a in actors})
+
+        if member_pairs:
+            memberships = ActorModel.find_memberships({p[0] for p in member_pairs}, actor_ids)
+            self._memberships.update({p: p in memberships for p in member_pairs})
+
+        if reply_to_ids:
+            requests = (EndorsementRequestModel.query
+                        .options(selectinload(EndorsementRequestModel.actor))
+                        .filter(EndorsementRequestModel.notification_id.in_(reply_to_ids))
+                        .all())
+            self._endorsement_requests.update(dict.fromkeys(reply_to_ids))
+            self._endorsement_requests.update({r.notification_id: CachedEndorsementRequest.from_model(r)
+                                               for r in requests})
+
+        log.debug(f"Prefetched {len(actor_ids)} actors, {len(member_pairs)} memberships "
+                  f"and {len(reply_to_ids)} endorsement requests")
+
+    def get_actor(self, actor_id) -> Optional[CachedActor]:
+        if actor_id in self._actors:
+            return self._actors[actor_id]
+        return current_actor_cache.get_actor(actor_id)
+
+    def has_member(self, user_id, actor_id) -> bool:
+        key = (user_id, actor_id)
+        if key in self._memberships:
+            return self._memberships[key]
+        return current_actor_cache.has_member(user_id, actor_id)
+
+    def get_endorsement_request(self, notification_id) -> Optional[CachedEndorsementRequest]:
+        if notification_id in self._endorsement_requests:
+            return self._endorsement_requests[notification_id]
+        request = EndorsementRequestModel.query.filter_by(notification_id=notification_id).first()
+        return CachedEndorsementRequest.from_model(request) if request else None
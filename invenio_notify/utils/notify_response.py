@@ -29,3 +29,23 @@ def response_coar_notify_receipt(receipt: COARNotifyReceipt, msg=None):
 
     data["message"] = msg or create_default_msg_by_status(receipt.status)
     return data, receipt.status
+
+
+def bulk_receipt(index, notification_id, status, msg=None) -> dict:
+    """Receipt of one notification of a bulk request."""
+    return {
+        "index": index,
+        "notification_id": notification_id,
+        "status": status,
+        "message": msg or create_default_msg_by_status(status),
+    }
+
+
+def response_bulk_receipts(receipts: list[dict]):
+    accepted = sum(1 for r in receipts if r["status"] == COARNotifyReceipt.ACCEPTED)
+    data = {
+        "accepted": accepted,
+        "rejected": len(receipts) - accepted,
+        "receipts": receipts,
+    }
+    return data, 200
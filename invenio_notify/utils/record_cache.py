@@ -0,0 +1,46 @@
+from flask import current_app, has_app_context
+from invenio_pidstore.models import PersistentIdentifier
+from sqlalchemy import event
+
+from invenio_notify.utils.cache_utils import TTLCache
+from invenio_notify.utils.record_utils import record_exists
+
+
+class RecordExistenceCache:
+    """
+    In-process cache of whether records exist, by recid.
+
+    A miss is resolved with ``record_exists``. Existing and missing records are
+    cached for ``ttl`` seconds (a ``ttl`` of 0 disables the cache), so keep it
+    short: a record published in the meantime is reported missing until its
+    entry expires. Entries are dropped when a recid PID is updated or deleted
+    in this process.
+    """
+
+    def __init__(self, ttl: float = 30, maxsize: int = 10000):
+        self.enabled = ttl > 0
+        self._exists = TTLCache(ttl, maxsize)
+
+    def exists(self, recid: str) -> bool:
+        exists = self._exists.get(recid)
+        if exists is None:
+            exists = record_exists(recid)
+            if self.enabled:
+                self._exists.set(recid, exists)
+        return exists
+
+    def discard(self, recid: str):
+        self._exists.discard(recid)
+
+    def clear(self):
+        self._exists.clear()
+
+
+@event.listens_for(PersistentIdentifier, 'after_update')
+@event.listens_for(PersistentIdentifier, 'after_delete')
+def _discard_recid(mapper, connection, target):
+    if not has_app_context() or target.pid_type != 'recid':
+        return
+    record_cache = getattr(current_app.extensions.get('invenio-notify'), 'record_cache', None)
+    if record_cache is not None:
+        record_cache.discard(target.pid_value)
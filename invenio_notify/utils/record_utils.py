@@ -1,9 +1,15 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from invenio_db import db
 from invenio_records_resources.services.records.results import RecordItem
 from invenio_pidstore.errors import PIDDoesNotExistError
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from sqlalchemy import or_
 
 from invenio_rdm_records.proxies import current_rdm_records_service
 from invenio_rdm_records.records import RDMRecord
-from invenio_rdm_records.records.models import RDMRecordMetadata
+from invenio_rdm_records.records.models import RDMRecordMetadata, RDMParentMetadata, RDMVersionsState
 
 
 def resolve_record_from_pid(pid_value) -> RDMRecord:
@@ -35,3 +41,105 @@ def get_recid_by_record_uuid(record_uuid: str) -> str:
 def get_rdm_record_by_uuid(record_uuid: str) -> RDMRecord:
     recid = get_recid_by_record_uuid(record_uuid)
     return resolve_record_from_pid(recid)
+
+
+@dataclass(frozen=True)
+class RecordSummary:
+    """The fields of an RDM record needed to notify its owner, see ``get_record_summaries``."""
+    id: str
+    pid_value: Optional[str]
+    title: Optional[str]
+    parent_id: Optional[str]
+    owner_user_id: Optional[int]
+
+
+def get_record_summaries(record_uuids: Iterable) -> dict[str, RecordSummary]:
+    """Get the summaries of records by UUID.
+
+    Only the needed JSON paths of the record and its parent are selected in one
+    joined query, the (possibly large) JSON documents are not loaded.
+
+    Args:
+        record_uuids: The record UUIDs
+
+    Returns:
+        dict: RecordSummary by record UUID (as string), missing records are not included
+    """
+    record_uuids = {str(u) for u in record_uuids}
+    if not record_uuids:
+        return {}
+
+    rows = (db.session.query(
+        RDMRecordMetadata.id,
+        RDMRecordMetadata.json.op("->>")('id'),
+        RDMRecordMetadata.json.op("->")('metadata').op("->>")('title'),
+        RDMRecordMetadata.parent_id,
+        RDMParentMetadata.json.op("#>>")('{access,owned_by,user}'),
+    )
+            .outerjoin(RDMParentMetadata, RDMParentMetadata.id == RDMRecordMetadata.parent_id)
+            .filter(RDMRecordMetadata.id.in_(record_uuids))
+            .all())
+    return {
+        str(record_id): RecordSummary(
+            id=str(record_id),
+            pid_value=pid_value,
+            title=title,
+            parent_id=str(parent_id) if parent_id else None,
+            owner_user_id=int(owner) if owner is not None else None,
+        )
+        for record_id, pid_value, title, parent_id, owner in rows
+    }
+
+
+def get_record_summary(record_uuid) -> Optional[RecordSummary]:
+    """Get the summary of a record by UUID, None if the record does not exist."""
+    return get_record_summaries([record_uuid]).get(str(record_uuid))
+
+
+def get_recid_by_doi(doi: str) -> Optional[str]:
+    """Get the recid of the published record with a DOI from the PID table.
+
+    A DOI of a record resolves to the record, a concept DOI (of the parent) to
+    the latest version. Only registered DOI PIDs are resolved (as
+    ``pids.resolve`` does), a reserved, new or deleted DOI resolves to None.
+    Only the recid is selected, the record is not loaded.
+
+    Args:
+        doi: The normalized DOI
+
+    Returns:
+        str: The recid, None if no published record has the DOI
+    """
+    pid = (PersistentIdentifier.query
+           .with_entities(PersistentIdentifier.object_uuid)
+           .filter(PersistentIdentifier.pid_type == 'doi',
+                   PersistentIdentifier.pid_value == doi,
+                   PersistentIdentifier.status == PIDStatus.REGISTERED)
+           .first())
+    if pid is None or pid.object_uuid is None:
+        return None
+
+    latest_id = (db.session.query(RDMVersionsState.latest_id)
+                 .filter(RDMVersionsState.parent_id == pid.object_uuid)
+                 .scalar_subquery())
+    return (db.session.query(RDMRecordMetadata.json.op("->>")('id'))
+            .filter(or_(RDMRecordMetadata.id == pid.object_uuid, RDMRecordMetadata.id == latest_id),
+                    RDMRecordMetadata.json.isnot(None))
+            .scalar())
+
+
+def record_exists(recid: str) -> bool:
+    """Check if a record with a registered recid exists, with one query on the PID table.
+
+    Args:
+        recid: The recid of the record
+
+    Returns:
+        bool: True if the recid is registered
+    """
+    query = PersistentIdentifier.query.filter(
+        PersistentIdentifier.pid_type == 'recid',
+        PersistentIdentifier.pid_value == recid,
+        PersistentIdentifier.status == PIDStatus.REGISTERED,
+    )
+    return db.session.query(query.exists()).scalar()
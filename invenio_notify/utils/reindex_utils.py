@@ -0,0 +1,57 @@
+import logging
+
+from invenio_db import db
+
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_rdm_records.records.models import RDMRecordMetadata
+
+log = logging.getLogger(__name__)
+
+
+def find_record_ids_by_parent_ids(parent_ids) -> list:
+    """Find the ids of all record versions of the given parents."""
+    if not parent_ids:
+        return []
+    return [row[0] for row in (db.session.query(RDMRecordMetadata.id)
+                               .filter(RDMRecordMetadata.parent_id.in_(parent_ids))
+                               .all())]
+
+
+def reindex_parent_versions(parent_id):
+    """Index all versions of a parent record immediately."""
+    for record_id in find_record_ids_by_parent_ids([parent_id]):
+        # Indexing the record will add the endorsement data via EndorsementsDumperExt
+        current_rdm_records_service.indexer.index_by_id(record_id)
+
+
+class ReindexCollector:
+    """
+    Collect parent records touched while processing a batch of notifications.
+
+    All versions of the collected parents are sent to the RDM indexer queue in
+    one bulk request by ``flush``, which should be called once the batch is
+    committed. A parent touched by many notifications is indexed only once.
+    """
+
+    def __init__(self):
+        self.parent_ids = set()
+
+    def add(self, parent_id):
+        self.parent_ids.add(parent_id)
+
+    def flush(self) -> int:
+        """
+        Send all versions of the collected parents to the bulk indexer queue.
+
+        Returns:
+            int: Number of records queued for indexing
+        """
+        if not self.parent_ids:
+            return 0
+
+        record_ids = find_record_ids_by_parent_ids(self.parent_ids)
+        self.parent_ids = set()
+        if record_ids:
+            current_rdm_records_service.indexer.bulk_index(record_ids)
+            log.info(f"Queued {len(record_ids)} record versions for bulk indexing")
+        return len(record_ids)
@@ -0,0 +1,132 @@
+"""
+Per-phase timing of requests to the inbox endpoints.
+
+``server_timing`` starts the timing of a request. The request is split into
+phases with ``request_phase`` (or ``begin_phase`` and ``end_phase`` when a
+phase does not fit in one block), each with its duration and the number of
+SQL statements executed in it. The phases are always logged with the
+structured log field ``server_timing``, also for error responses.
+
+Outside a timed request ``request_phase`` does nothing, and the SQL counter
+is a single attribute lookup per statement, so the timing is cheap enough
+for production. The phases are also sent in the ``Server-Timing`` header of
+the response if NOTIFY_INBOX_SERVER_TIMING is enabled; the header is visible
+to the clients of the inbox, so it is off by default.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Optional
+
+from flask import after_this_request, current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+log = logging.getLogger(__name__)
+
+_G_KEY = 'notify_request_timing'
+
+
+class RequestTiming:
+    """Durations and SQL statement counts of the phases of one request."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.phases: dict[str, dict] = {}
+        self._open: dict[str, tuple[float, int]] = {}
+
+    def begin_phase(self, name):
+        self._open[name] = (time.perf_counter(), self.queries)
+
+    def end_phase(self, name):
+        started = self._open.pop(name, None)
+        if started is None:
+            return
+        start, queries = started
+        phase = self.phases.setdefault(name, {'dur': 0.0, 'queries': 0})
+        phase['dur'] += time.perf_counter() - start
+        phase['queries'] += self.queries - queries
+
+    def finish(self) -> dict:
+        """End the open phases and add the ``total`` phase."""
+        for name in list(self._open):
+            self.end_phase(name)
+        self.phases['total'] = {'dur': time.perf_counter() - self.start, 'queries': self.queries}
+        return self.phases
+
+    def header(self) -> str:
+        """Value of the ``Server-Timing`` header, durations in milliseconds."""
+        return ', '.join(f'{name};dur={p["dur"] * 1000:.1f};desc="{p["queries"]} queries"'
+                         for name, p in self.phases.items())
+
+    def log_fields(self) -> dict:
+        fields = {}
+        for name, p in self.phases.items():
+            fields[f'{name}_ms'] = round(p['dur'] * 1000, 1)
+            fields[f'{name}_queries'] = p['queries']
+        return fields
+
+
+def get_request_timing() -> Optional[RequestTiming]:
+    """Get the timing of the current request, None if the request is not timed."""
+    if not has_request_context():
+        return None
+    return g.get(_G_KEY)
+
+
+def begin_phase(name):
+    timing = get_request_timing()
+    if timing is not None:
+        timing.begin_phase(name)
+
+
+def end_phase(name):
+    timing = get_request_timing()
+    if timing is not None:
+        timing.end_phase(name)
+
+
+@contextmanager
+def request_phase(name):
+    """Time the block as a phase of the current request, phases with the same name are summed up."""
+    timing = get_request_timing()
+    if timing is None:
+        yield
+        return
+    timing.begin_phase(name)
+    try:
+        yield
+    finally:
+        timing.end_phase(name)
+
+
+def server_timing(f):
+    """Decorator that times and logs the request, and adds the ``Server-Timing`` header if enabled."""
+
+    @wraps(f)
+    def inner(*args, **kwargs):
+        timing = RequestTiming()
+        setattr(g, _G_KEY, timing)
+
+        @after_this_request
+        def add_server_timing(response):
+            timing.finish()
+            log.info(f'{request.method} {request.path} {response.status_code} timing: {timing.header()}',
+                     extra={'server_timing': timing.log_fields()})
+            if current_app.config.get('NOTIFY_INBOX_SERVER_TIMING', False):
+                response.headers['Server-Timing'] = timing.header()
+            return response
+
+        return f(*args, **kwargs)
+
+    return inner
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_query(*args, **kwargs):
+    timing = get_request_timing()
+    if timing is not None:
+        timing.queries += 1
@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+
+from invenio_db.uow import Operation, UnitOfWork
+
+
+class SavepointOp(Operation):
+    """Operation that was registered in a savepoint, forwarded to the unit of work of the transaction."""
+
+    def __init__(self, op: Operation):
+        self.op = op
+
+    def on_register(self, uow):
+        # already called when the operation was registered in the savepoint
+        pass
+
+    def on_commit(self, uow):
+        self.op.on_commit(uow)
+
+    def on_post_commit(self, uow):
+        self.op.on_post_commit(uow)
+
+    def on_exception(self, uow, exception):
+        self.op.on_exception(uow, exception)
+
+    def on_rollback(self, uow):
+        self.op.on_rollback(uow)
+
+    def on_post_rollback(self, uow):
+        self.op.on_post_rollback(uow)
+
+
+class SavepointUnitOfWork:
+    """
+    Unit of work of a savepoint, it buffers the registered operations.
+
+    It is neither committed nor rolled back itself, see ``savepoint``.
+    """
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+        self.operations = []
+
+    @property
+    def session(self):
+        return self.uow.session
+
+    def register(self, op: Operation):
+        op.on_register(self)
+        self.operations.append(op)
+
+
+@contextmanager
+def savepoint(uow: UnitOfWork):
+    """
+    Run a block of work in a savepoint of the unit of work's transaction.
+
+    The block registers its operations (e.g. notifications) with the yielded
+    unit of work. They are forwarded to ``uow`` once the block succeeds. If the
+    block raises, only its database changes are rolled back and its operations
+    are discarded, so they are not executed when ``uow`` is committed. The
+    exception is re-raised.
+
+    Args:
+        uow: The unit of work of the transaction, or of an enclosing savepoint
+
+    Yields:
+        SavepointUnitOfWork: The unit of work to pass to the work of the block
+    """
+    savepoint_uow = SavepointUnitOfWork(uow)
+    with uow.session.begin_nested():
+        yield savepoint_uow
+    for op in savepoint_uow.operations:
+        uow.register(SavepointOp(op))
@@ -30,8 +30,9 @@ class ActorListView(PCIEndorsementAdminDisabledMixin, AdminResourceListView):
         "actor_id": {"text": _("Actor ID"), "order": 3, "width": 2},
         "inbox_url": {"text": _("Inbox URL"), "order": 4, "width": 2},
         "description": {"text": _("Description"), "order": 5, "width": 3},
-        "created": {"text": _("Created"), "order": 6, "width": 2},
-        "updated": {"text": _("Updated"), "order": 7, "width": 2},
+        "circuit_state": {"text": _("Inbox Circuit"), "order": 6, "width": 1},
+        "created": {"text": _("Created"), "order": 7, "width": 2},
+        "updated": {"text": _("Updated"), "order": 8, "width": 2},
     }
 
     create_view_name = "actor_create"
@@ -63,8 +64,12 @@ class ActorDetailView(PCIEndorsementAdminDisabledMixin, AdminResourceDetailView)
         "inbox_url": {"text": _("Inbox URL"), "order": 4, "width": 2},
         "inbox_api_token": {"text": _("Inbox API Token"), "order": 4, "width": 2},
         "description": {"text": _("Description"), "order": 5, "width": 3},
-        "created": {"text": _("Created"), "order": 6, "width": 2},
-        "updated": {"text": _("Updated"), "order": 7, "width": 2},
+        "circuit_state": {"text": _("Inbox Circuit"), "order": 6, "width": 1},
+        "circuit_failures": {"text": _("Consecutive Inbox Failures"), "order": 7, "width": 1},
+        "circuit_open_until": {"text": _("Inbox Circuit Open Until"), "order": 8, "width": 2},
+        "circuit_last_error": {"text": _("Last Inbox Error"), "order": 9, "width": 3},
+        "created": {"text": _("Created"), "order": 10, "width": 2},
+        "updated": {"text": _("Updated"), "order": 11, "width": 2},
     }
 
 
@@ -28,8 +28,9 @@ class EndorsementRequestListView(PCIAnnouncementOfEndorsementAdminDisabledMixin,
         "user_id": {"text": _("User ID"), "order": 4, "width": 1},
         "actor_id": {"text": _("Actor ID"), "order": 5, "width": 1},
         "latest_status": {"text": _("Latest Status"), "order": 6, "width": 2},
-        "created": {"text": _("Created"), "order": 7, "width": 2},
-        "updated": {"text": _("Updated"), "order": 8, "width": 2},
+        "delivery_status": {"text": _("Delivery"), "order": 7, "width": 1},
+        "created": {"text": _("Created"), "order": 8, "width": 2},
+        "updated": {"text": _("Updated"), "order": 9, "width": 2},
     }
 
     create_view_name = None
@@ -60,7 +61,11 @@ class EndorsementRequestDetailView(PCIAnnouncementOfEndorsementAdminDisabledMixi
         "user_id": {"text": _("User ID"), "order": 4, "width": 1},
         "actor_id": {"text": _("Actor ID"), "order": 5, "width": 1},
         "latest_status": {"text": _("Latest Status"), "order": 6, "width": 2},
-        "raw": {"text": _("Raw Data"), "order": 7, "width": 6},
-        "created": {"text": _("Created"), "order": 8, "width": 2},
-        "updated": {"text": _("Updated"), "order": 9, "width": 2},
+        "delivery_status": {"text": _("Delivery Status"), "order": 7, "width": 1},
+        "delivery_attempts": {"text": _("Failed Delivery Attempts"), "order": 8, "width": 1},
+        "last_delivery_error": {"text": _("Last Delivery Error"), "order": 9, "width": 4},
+        "delivered_at": {"text": _("Delivered"), "order": 10, "width": 2},
+        "raw": {"text": _("Raw Data"), "order": 11, "width": 6},
+        "created": {"text": _("Created"), "order": 12, "width": 2},
+        "updated": {"text": _("Updated"), "order": 13, "width": 2},
     }
\ No newline at end of file
@@ -68,4 +68,13 @@ class NotifyInboxDetailView(PCIEndorsementAdminDisabledMixin, AdminResourceDetai
         "process_note": {"text": _("Process Note"), "order": 7, "width": 2},
         "created": {"text": _("Created"), "order": 8, "width": 2},
         "updated": {"text": _("Updated"), "order": 9, "width": 2},
+        "notification_type": {"text": _("Notification Type"), "order": 10, "width": 2},
+        "workflow_status": {"text": _("Workflow Status"), "order": 11, "width": 2},
+        "actor_id": {"text": _("Actor ID"), "order": 12, "width": 2},
+        "in_reply_to": {"text": _("In Reply To"), "order": 13, "width": 2},
+        "context_url": {"text": _("Context URL"), "order": 14, "width": 2},
+        "attempts": {"text": _("Failed Attempts"), "order": 15, "width": 1},
+        "next_attempt_at": {"text": _("Next Attempt At"), "order": 16, "width": 2},
+        "last_error": {"text": _("Last Error"), "order": 17, "width": 2},
+        "quarantined_at": {"text": _("Quarantined At"), "order": 18, "width": 2},
     }
@@ -0,0 +1,175 @@
+"""
+Throughput benchmark of the inbox processing.
+
+Seeds a mix of notifications (review, endorsement, tentative accept, tentative
+reject, reject and endorsement replies to endorsement requests), runs
+``tasks.inbox_processing`` and reports the throughput, the p50/p99 latency of
+processing one notification and the number of SQL queries.
+
+The benchmark needs PostgreSQL and is skipped unless NOTIFY_BENCHMARK is set::
+
+    env DB=postgresql NOTIFY_BENCHMARK=1 ./run-tests.sh tests/benchmarks -s
+
+NOTIFY_BENCHMARK_SIZES overrides the number of seeded notifications
+(default: "1000,10000,100000"). If NOTIFY_BENCHMARK_REPORT is set, the results
+are appended to this file as JSON lines, so runs can be compared.
+"""
+
+import json
+import os
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from invenio_db import db
+from sqlalchemy import event
+
+from invenio_notify import tasks
+from invenio_notify.records.models import NotifyInboxModel, EndorsementRequestModel
+from invenio_notify.tasks import get_normalized_fields, inbox_processing
+from tests.fixtures import inbox_payload
+from tests.fixtures.endorsement_request_fixture import create_endorsement_request_data
+from invenio_rdm_records.proxies import current_rdm_records_service
+
+pytestmark = pytest.mark.skipif(not os.environ.get('NOTIFY_BENCHMARK'),
+                                reason="set NOTIFY_BENCHMARK to run the benchmarks")
+
+SIZES = [int(n) for n in os.environ.get('NOTIFY_BENCHMARK_SIZES', '1000,10000,100000').split(',')]
+
+SEED_CHUNK_SIZE = 5000
+
+# payload factory and whether the notification replies to an endorsement request
+NOTIFICATION_KINDS = [
+    (inbox_payload.payload_review, False),
+    (inbox_payload.payload_endorsement_resp, False),
+    (inbox_payload.payload_tentative_accept, True),
+    (inbox_payload.payload_tentative_reject, True),
+    (inbox_payload.payload_reject, True),
+    (inbox_payload.payload_endorsement_resp, True),
+]
+
+
+def seed_notifications(test_data, n_notifications):
+    """Insert the inbox records, and an endorsement request for each reply, in chunks."""
+    record_uuid = current_rdm_records_service.record_cls.pid.resolve(test_data.record_id).id
+    now = datetime.now(timezone.utc)
+    inbox_rows, request_rows = [], []
+
+    def insert_rows():
+        if request_rows:
+            db.session.execute(EndorsementRequestModel.__table__.insert(), request_rows)
+        if inbox_rows:
+            db.session.execute(NotifyInboxModel.__table__.insert(), inbox_rows)
+        db.session.commit()
+        inbox_rows.clear()
+        request_rows.clear()
+
+    for i in range(n_notifications):
+        payload_factory, is_reply = NOTIFICATION_KINDS[i % len(NOTIFICATION_KINDS)]
+        in_reply_to = inbox_payload.generate_notification_id() if is_reply else None
+        raw = payload_factory(test_data.record_id, in_reply_to=in_reply_to)
+        if is_reply:
+            request_rows.append({
+                **create_endorsement_request_data(test_data.actor.id, record_uuid,
+                                                  user_id=test_data.user_identity.id,
+                                                  notification_id=in_reply_to),
+                'created': now,
+                'updated': now,
+            })
+
+        inbox_rows.append({
+            'notification_id': raw['id'],
+            'raw': raw,
+            'record_id': test_data.record_id,
+            'user_id': test_data.user_identity.id,
+            'created': now,
+            'updated': now,
+            **get_normalized_fields(raw),
+        })
+        if len(inbox_rows) >= SEED_CHUNK_SIZE:
+            insert_rows()
+    insert_rows()
+
+
+@contextmanager
+def count_queries():
+    """Count the SQL statements executed in the block."""
+    counter = {'queries': 0}
+
+    def before_cursor_execute(*args, **kwargs):
+        counter['queries'] += 1
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+@contextmanager
+def measure_latencies():
+    """Measure the time spent processing each inbox record."""
+    latencies = []
+    process_inbox_record = tasks.process_inbox_record
+
+    def timed_process_inbox_record(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return process_inbox_record(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    with patch.object(tasks, 'process_inbox_record', side_effect=timed_process_inbox_record):
+        yield latencies
+
+
+def percentile(values, p):
+    """Nearest-rank percentile."""
+    values = sorted(values)
+    return values[max(0, round(p / 100 * len(values)) - 1)]
+
+
+def report(result):
+    print(f"\ninbox_processing of {result['notifications']} notifications: "
+          f"{result['throughput']:.1f} notifications/s, "
+          f"p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, "
+          f"{result['queries']} queries ({result['queries_per_notification']:.1f} per notification)")
+
+    report_path = os.environ.get('NOTIFY_BENCHMARK_REPORT')
+    if report_path:
+        with open(report_path, 'a') as f:
+            f.write(json.dumps(result) + '\n')
+
+
+@pytest.mark.parametrize('n_notifications', SIZES)
+def test_inbox_processing_benchmark(db, rdm_record, inbox_test_data_builder, test_app, n_notifications):
+    if db.engine.dialect.name != 'postgresql':
+        pytest.skip("the inbox processing benchmark needs PostgreSQL")
+
+    test_data = (inbox_test_data_builder(rdm_record.id, inbox_payload.payload_review(rdm_record.id))
+                 .create_actor()
+                 .add_member_to_actor())
+    seed_notifications(test_data, n_notifications)
+
+    with measure_latencies() as latencies, count_queries() as counter:
+        start = time.perf_counter()
+        inbox_processing()
+        elapsed = time.perf_counter() - start
+
+    assert NotifyInboxModel.query.filter(NotifyInboxModel.process_date.is_(None)).count() == 0
+    assert len(latencies) == n_notifications
+
+    report({
+        'notifications': n_notifications,
+        'batch_size': test_app.config['NOTIFY_INBOX_BATCH_SIZE'],
+        'commit_size': test_app.config['NOTIFY_INBOX_COMMIT_SIZE'],
+        'seconds': elapsed,
+        'throughput': n_notifications / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'queries': counter['queries'],
+        'queries_per_notification': counter['queries'] / n_notifications,
+    })
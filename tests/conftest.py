@@ -13,6 +13,7 @@ from invenio_vocabularies.records.api import Vocabulary
 from .fake_datacite_client import FakeDataCiteClient
 from invenio_notify.constants import NOTIFY_PCI_ENDORSEMENT, NOTIFY_PCI_ANNOUNCEMENT_OF_ENDORSEMENT
 from tests.builders.inbox_test_data_builder import *  # noqa
+from tests.fixtures.endorsement_fixture import *  # noqa
 from tests.fixtures.endorsement_request_fixture import *  # noqa
 from tests.fixtures.inbox_fixture import *  # noqa
 from tests.fixtures.actor_fixture import *  # noqa
@@ -236,6 +237,10 @@ def app_config(app_config, mock_datacite_client):
     app_config["NOTIFY_ORIGIN_ID"] = "yoooooooooooooooooooooo"
     app_config[NOTIFY_PCI_ENDORSEMENT] = True
     app_config[NOTIFY_PCI_ANNOUNCEMENT_OF_ENDORSEMENT] = True
+    # actors and records are recreated with the same ids by many tests
+    app_config["NOTIFY_ACTOR_CACHE_TTL"] = 0
+    app_config["NOTIFY_DOI_CACHE_TTL"] = 0
+    app_config["NOTIFY_RECORD_CACHE_TTL"] = 0
     
     # Enable DOI minting...
     app_config["DATACITE_ENABLED"] = True
@@ -0,0 +1,133 @@
+import time
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from invenio_db import db as invenio_db
+from sqlalchemy import text
+
+from invenio_notify import cli
+from invenio_notify.proxies import current_actor_service
+from invenio_notify.records.models import ActorModel
+from invenio_notify.utils.actor_cache import INVALIDATION_CHANNEL, ActorCache
+from invenio_notify.utils.cache_utils import TTLCache
+from tests.fixtures.user_fixture import create_test_users
+
+
+@pytest.fixture
+def actor_cache(test_app, monkeypatch):
+    """An enabled actor cache, used through ``current_actor_cache``."""
+    actor_cache = ActorCache(ttl=60, listen=False)
+    monkeypatch.setattr(test_app.extensions['invenio-notify'], 'actor_cache', actor_cache)
+    return actor_cache
+
+
+def test_ttl_cache__expire():
+    cache = TTLCache(ttl=10, maxsize=10)
+    with patch('invenio_notify.utils.cache_utils.time.monotonic', return_value=100):
+        cache.set('a', 1)
+        assert cache.get('a') == 1
+    with patch('invenio_notify.utils.cache_utils.time.monotonic', return_value=111):
+        assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache__maxsize():
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    # the least recently used entry is evicted
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_get_actor(db, create_actor, actor_cache):
+    actor = create_actor()
+
+    cached_actor = actor_cache.get_actor(actor.actor_id)
+    assert cached_actor.id == actor.id
+    assert cached_actor.name == actor.name
+    assert actor_cache.get_actor('unknown-actor-id') is None
+
+    with patch.object(ActorModel, 'query', new_callable=PropertyMock, side_effect=AssertionError):
+        assert actor_cache.get_actor(actor.actor_id) == cached_actor
+        assert actor_cache.get_actor('unknown-actor-id') is None
+
+
+def test_get_actor__disabled(db, create_actor):
+    actor_cache = ActorCache(ttl=0)
+    actor = create_actor()
+
+    assert actor_cache.get_actor(actor.actor_id).id == actor.id
+    assert len(actor_cache._actors) == 0
+
+
+def test_get_actor__created_by_cli(db, test_app, actor_cache):
+    """Actors created by the CLI are not missed because of the cache."""
+    actor_id = 'https://evolbiol.peercommunityin.org/coar_notify/'
+    assert actor_cache.get_actor(actor_id) is None
+
+    result = test_app.test_cli_runner().invoke(cli.notify, ['test-data'])
+    assert result.exit_code == 0, result.output
+
+    assert actor_cache.get_actor(actor_id).name == 'Peer Community in Evolutionary Biology'
+
+
+def test_has_member__invalidated(db, superuser_identity, create_actor, actor_cache):
+    """Memberships changed through the actor service are not served from the cache."""
+    actor = create_actor()
+    user = create_test_users(['member@example.com'])[0]
+
+    assert actor_cache.has_member(user.id, actor.actor_id) is False
+    with patch.object(ActorModel, 'has_member', side_effect=AssertionError):
+        assert actor_cache.has_member(user.id, actor.actor_id) is False
+
+    current_actor_service.add_member(superuser_identity, actor.id, {'emails': [user.email]})
+    assert actor_cache.has_member(user.id, actor.actor_id) is True
+
+    current_actor_service.del_member(superuser_identity, actor.id, {'user_id': user.id})
+    assert actor_cache.has_member(user.id, actor.actor_id) is False
+
+
+def test_get_actor__invalidated(db, superuser_identity, create_actor, actor_cache):
+    actor = create_actor()
+    assert actor_cache.get_actor(actor.actor_id).name == actor.name
+
+    current_actor_service.update(superuser_identity, actor.id, {'actor_id': actor.actor_id, 'name': 'New Name',
+                                                                'inbox_url': actor.inbox_url})
+    assert actor_cache.get_actor(actor.actor_id).name == 'New Name'
+
+    current_actor_service.delete(superuser_identity, actor.id)
+    assert actor_cache.get_actor(actor.actor_id) is None
+
+
+def test_listener(db, create_actor, test_app, monkeypatch):
+    """Another process announces an actor change through Postgres NOTIFY."""
+    actor_cache = ActorCache(ttl=60)
+    monkeypatch.setattr(test_app.extensions['invenio-notify'], 'actor_cache', actor_cache)
+    pool = invenio_db.engine.pool
+    checked_out = pool.checkedout()
+    actor = create_actor()
+    try:
+        actor_cache.start_listener(invenio_db.engine)
+        assert actor_cache.wait_listening(timeout=10)
+        # the listener does not hold a connection of the pool
+        assert pool.checkedout() == checked_out
+
+        actor_cache.get_actor(actor.actor_id)
+        assert len(actor_cache._actors) == 1
+
+        # NOTIFY is delivered on commit, so it is sent on a connection outside the test transaction
+        with invenio_db.engine.connect() as connection:
+            connection.execute(text('SELECT pg_notify(:channel, \'\')'), {'channel': INVALIDATION_CHANNEL})
+            connection.commit()
+
+        deadline = time.monotonic() + 10
+        while len(actor_cache._actors) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert len(actor_cache._actors) == 0
+    finally:
+        actor_cache.stop_listener()
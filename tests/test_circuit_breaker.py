@@ -0,0 +1,176 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from invenio_db import db
+
+from invenio_notify import constants, tasks
+from invenio_notify.circuit_breaker import ActorCircuitBreaker
+from invenio_notify.errors import CircuitOpenError, SendRequestFail
+from invenio_notify.proxies import current_actor_service
+from invenio_notify.records.models import ActorCircuitModel, ActorModel, EndorsementRequestModel
+from invenio_notify.utils.endorsement_request_utils import send_to_actor_inbox
+
+
+@pytest.fixture
+def circuit_breaker(test_app, monkeypatch):
+    breaker = ActorCircuitBreaker(failure_threshold=2, reset_timeout=60)
+    monkeypatch.setattr(test_app.extensions['invenio-notify'], 'circuit_breaker', breaker)
+    return breaker
+
+
+@pytest.fixture
+def inbox_actor(db, create_actor):
+    return create_actor(inbox_url='https://example.com/inbox', inbox_api_token='test-token')
+
+
+def get_circuit(actor_id):
+    # the breaker writes with bulk statements, reload the circuit from the database
+    db.session.expire_all()
+    return db.session.get(ActorCircuitModel, actor_id)
+
+
+def circuit_state(actor_id):
+    circuit = get_circuit(actor_id)
+    return circuit.state if circuit else constants.CIRCUIT_CLOSED
+
+
+def expire_circuit(actor_id):
+    circuit = get_circuit(actor_id)
+    circuit.open_until = datetime.now(timezone.utc) - timedelta(seconds=1)
+    ActorCircuitModel.commit()
+
+
+def test_open_after_threshold(circuit_breaker, inbox_actor):
+    circuit_breaker.before_request(inbox_actor.id)
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    circuit_breaker.before_request(inbox_actor.id)
+    assert circuit_state(inbox_actor.id) == constants.CIRCUIT_CLOSED
+
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    assert circuit_state(inbox_actor.id) == constants.CIRCUIT_OPEN
+    with pytest.raises(CircuitOpenError) as e:
+        circuit_breaker.before_request(inbox_actor.id)
+    assert 55 <= e.value.retry_after <= 60
+
+
+def test_success_resets_failures(circuit_breaker, inbox_actor):
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    circuit_breaker.record_success(inbox_actor.id)
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+
+    circuit = get_circuit(inbox_actor.id)
+    assert circuit.failures == 1
+    assert circuit.state == constants.CIRCUIT_CLOSED
+
+
+def test_caller_owns_transaction(circuit_breaker, inbox_actor):
+    """The breaker does not commit, the circuit is rolled back with the transaction of the caller."""
+    ActorCircuitModel.commit()
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    assert circuit_state(inbox_actor.id) == constants.CIRCUIT_OPEN
+
+    db.session.rollback()
+    assert circuit_state(inbox_actor.id) == constants.CIRCUIT_CLOSED
+    assert get_circuit(inbox_actor.id) is None
+
+
+def test_half_open_probe(circuit_breaker, inbox_actor):
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    expire_circuit(inbox_actor.id)
+    assert circuit_state(inbox_actor.id) == constants.CIRCUIT_HALF_OPEN
+
+    # only one caller probes the inbox
+    circuit_breaker.before_request(inbox_actor.id)
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.before_request(inbox_actor.id)
+
+    # a failed probe opens the circuit again, a successful one closes it
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    assert circuit_state(inbox_actor.id) == constants.CIRCUIT_OPEN
+    expire_circuit(inbox_actor.id)
+    circuit_breaker.before_request(inbox_actor.id)
+    circuit_breaker.record_success(inbox_actor.id)
+    circuit = get_circuit(inbox_actor.id)
+    assert circuit.state == constants.CIRCUIT_CLOSED
+    assert circuit.failures == 0
+    assert circuit.probe_started_at is None
+
+
+def test_half_open_probe__claim_committed(circuit_breaker, inbox_actor):
+    """The claim of a probe is committed before the request, the row is not locked while it is sent."""
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    expire_circuit(inbox_actor.id)
+
+    circuit_breaker.before_request(inbox_actor.id)
+    db.session.rollback()
+
+    circuit = get_circuit(inbox_actor.id)
+    assert circuit.state == constants.CIRCUIT_OPEN
+    assert circuit.probe_started_at is not None
+
+
+@patch('requests.Session.post')
+def test_send_to_actor_inbox__fails_fast(mock_post, circuit_breaker, inbox_actor):
+    mock_post.side_effect = requests.exceptions.ConnectTimeout('timed out')
+    for _ in range(2):
+        with pytest.raises(SendRequestFail):
+            send_to_actor_inbox(inbox_actor, {})
+    assert mock_post.call_count == 2
+
+    with pytest.raises(CircuitOpenError):
+        send_to_actor_inbox(inbox_actor, {})
+    assert mock_post.call_count == 2
+
+
+@patch('requests.Session.post')
+def test_send_to_actor_inbox__client_error_is_no_failure(mock_post, circuit_breaker, inbox_actor):
+    """A 4xx response means the inbox is reachable."""
+    mock_post.return_value = Mock(status_code=401, text='Unauthorized')
+    for _ in range(3):
+        with pytest.raises(SendRequestFail):
+            send_to_actor_inbox(inbox_actor, {})
+    assert circuit_state(inbox_actor.id) == constants.CIRCUIT_CLOSED
+
+
+@patch.object(tasks.shared_task_deliver_endorsement_request, 'apply_async')
+@patch('requests.Session.post')
+def test_delivery_deferred(mock_post, mock_apply_async, circuit_breaker, inbox_actor, create_endorsement_request):
+    """Requests to an actor with an open circuit are deferred without using up their attempts."""
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    request = create_endorsement_request(actor_id=inbox_actor.id)
+    request.next_delivery_at = datetime.now(timezone.utc)
+    EndorsementRequestModel.commit()
+
+    assert tasks.deliver_endorsement_request(request) == 'deferred'
+
+    mock_post.assert_not_called()
+    request = EndorsementRequestModel.get(request.id)
+    assert request.delivery_status == constants.DELIVERY_STATUS_PENDING
+    assert request.delivery_attempts == 0
+    assert request.next_delivery_at > datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def test_available_actors_and_admin_api(circuit_breaker, inbox_actor, rdm_record, superuser_identity):
+    actors = ActorModel.get_available_actors(rdm_record.id)
+    assert [a['status'] for a in actors if a['actor_id'] == inbox_actor.id] == [constants.WORKFLOW_STATUS_AVAILABLE]
+    result = current_actor_service.read(superuser_identity, inbox_actor.id).to_dict()
+    assert result['circuit_state'] == constants.CIRCUIT_CLOSED
+    assert result['circuit_failures'] == 0
+
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    circuit_breaker.record_failure(inbox_actor.id, 'ConnectTimeout')
+    db.session.expire_all()
+
+    actors = ActorModel.get_available_actors(rdm_record.id)
+    assert [a['status'] for a in actors if a['actor_id'] == inbox_actor.id] == [constants.WORKFLOW_STATUS_UNAVAILABLE]
+    result = current_actor_service.read(superuser_identity, inbox_actor.id).to_dict()
+    assert result['circuit_state'] == constants.CIRCUIT_OPEN
+    assert result['circuit_failures'] == 2
+    assert result['circuit_last_error'] == 'ConnectTimeout'
+    assert result['circuit_open_until'] is not None
@@ -2,6 +2,8 @@ from unittest.mock import patch, Mock
 
 from invenio_records_resources.services.records.results import RecordItem
 
+from invenio_notify import constants
+from invenio_notify.records.models import EndorsementRequestModel
 from invenio_notify.resources.resource import endorsement_request_resource
 from tests.fixtures.actor_fixture import create_multiple_actors
 from tests.fixtures.user_fixture import different_user
@@ -99,9 +101,9 @@ class TestSend:
                 # mock_read.read = AsyncMock(return_value=record)
                 return client.post(url, json={"actor_id": actor_id})
 
-    @patch.object(endorsement_request_resource.requests, 'post')
-    def test_success(self, mock_post, client, rdm_record, superuser_identity, create_actor, db):
-        """Test successful endorsement request."""
+    @patch.object(endorsement_request_resource, 'shared_task_deliver_endorsement_request')
+    def test_success(self, mock_task, client, rdm_record, superuser_identity, create_actor, db):
+        """Test successful endorsement request, the delivery is scheduled after commit."""
         # Create actor with proper configuration
         actor = create_actor(
             name='Test Actor',
@@ -112,9 +114,6 @@ class TestSend:
         # Set up record ownership
         rdm_record._record.parent.access.owner.owner_id = superuser_identity.user.id
 
-        # Mock successful external request
-        mock_post.return_value = Mock(status_code=200)
-
         response = self.send_endorsement_request(client, superuser_identity, rdm_record, actor.id)
 
         assert response.status_code == 200
@@ -122,8 +121,11 @@ class TestSend:
         assert data['is_success'] == 1
         assert 'Request Accepted' in data['message']
 
-        # Verify external request was made
-        mock_post.assert_called_once()
+        # The request is stored as pending and handed to the delivery task
+        request = EndorsementRequestModel.query.filter_by(actor_id=actor.id).one()
+        assert request.delivery_status == constants.DELIVERY_STATUS_PENDING
+        assert request.next_delivery_at is not None
+        mock_task.delay.assert_called_once_with(request.id)
 
     def test_missing_actor_id(self, client, rdm_record, superuser_identity):
         """Test request without actor_id field."""
@@ -184,9 +186,11 @@ class TestSend:
 
         assert response.status_code == 400
 
-    @patch.object(endorsement_request_resource.requests, 'post')
-    def test_actor_inbox_request_fails(self, mock_post, client, rdm_record, superuser_identity, create_actor, db):
-        """Test handling of actor inbox request failure."""
+    @patch('requests.Session.post')
+    @patch.object(endorsement_request_resource, 'shared_task_deliver_endorsement_request')
+    def test_actor_inbox_request_fails(self, mock_task, mock_post, client, rdm_record, superuser_identity,
+                                       create_actor, db):
+        """The actor inbox is not contacted by the request, a failing inbox doesn't fail it."""
         actor = create_actor(
             inbox_url='https://example.com/inbox',
             inbox_api_token='test-token'
@@ -199,4 +203,111 @@ class TestSend:
 
         response = self.send_endorsement_request(client, superuser_identity, rdm_record, actor.id)
 
+        assert response.status_code == 200
+        mock_post.assert_not_called()
+
+    @patch.object(endorsement_request_resource, 'shared_task_deliver_endorsement_request')
+    def test_resend_after_failed_delivery(self, mock_task, client, rdm_record, superuser_identity,
+                                          create_actor, db):
+        """A pending request blocks a new one, a request that could not be delivered doesn't."""
+        actor = create_actor(
+            inbox_url='https://example.com/inbox',
+            inbox_api_token='test-token'
+        )
+
+        rdm_record._record.parent.access.owner.owner_id = superuser_identity.user.id
+
+        response = self.send_endorsement_request(client, superuser_identity, rdm_record, actor.id)
+        assert response.status_code == 200
+
+        response = self.send_endorsement_request(client, superuser_identity, rdm_record, actor.id)
+        assert response.status_code == 400
+
+        request = EndorsementRequestModel.query.filter_by(actor_id=actor.id).one()
+        request.delivery_status = constants.DELIVERY_STATUS_FAILED
+        db.session.commit()
+
+        response = self.send_endorsement_request(client, superuser_identity, rdm_record, actor.id)
+        assert response.status_code == 200
+        assert EndorsementRequestModel.query.filter_by(actor_id=actor.id).count() == 2
+
+
+class TestSendMany:
+    """Test class for EndorsementRequestResource.send_many endpoint."""
+
+    @staticmethod
+    def send_endorsement_requests(client, identity, record: RecordItem, data):
+        url = f'/api/endorsement-request/send-many/{record.id}'
+
+        with patch.object(endorsement_request_resource, 'g') as mock_g:
+            mock_g.identity = identity
+            with patch.object(endorsement_request_resource.record_utils, 'read_record_item') as mock_read:
+                mock_read.return_value = record
+                return client.post(url, json=data)
+
+    @patch.object(endorsement_request_resource, 'shared_task_deliver_endorsement_request')
+    def test_success(self, mock_task, client, rdm_record, superuser_identity, create_actor, db):
+        """Available actors are accepted, the others are rejected with a reason, in the order of the request."""
+        actor_1 = create_actor(actor_id='actor-1', inbox_api_token='test-token')
+        actor_2 = create_actor(actor_id='actor-2', inbox_api_token='test-token')
+        actor_no_token = create_actor(actor_id='actor-3')
+        rdm_record._record.parent.access.owner.owner_id = superuser_identity.user.id
+
+        response = self.send_endorsement_requests(client, superuser_identity, rdm_record, {
+            'actor_ids': [actor_2.id, actor_no_token.id, 99999, actor_1.id, actor_2.id],
+        })
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['is_success'] == 1
+        assert data['accepted'] == 2
+        assert data['rejected'] == 2
+        assert [(r['actor_id'], r['status']) for r in data['results']] == [
+            (actor_2.id, 'accepted'),
+            (actor_no_token.id, 'rejected'),
+            (99999, 'rejected'),
+            (actor_1.id, 'accepted'),
+        ]
+        assert data['results'][2]['message'] == 'Actor not found'
+
+        requests = EndorsementRequestModel.query.order_by(EndorsementRequestModel.id).all()
+        assert {r.actor_id for r in requests} == {actor_1.id, actor_2.id}
+        assert {r.notification_id for r in requests} == {
+            r['notification_id'] for r in data['results'] if r['status'] == 'accepted'
+        }
+        assert mock_task.delay.call_count == 2
+
+        # the pending requests make the actors unavailable
+        response = self.send_endorsement_requests(client, superuser_identity, rdm_record, {
+            'actor_ids': [actor_1.id, actor_2.id],
+        })
+        data = response.get_json()
+        assert data['is_success'] == 0
+        assert data['rejected'] == 2
+        assert data['results'][0]['message'] == 'Actor not available for endorsement request'
+
+    def test_invalid_actor_ids(self, client, rdm_record, superuser_identity):
+        rdm_record._record.parent.access.owner.owner_id = superuser_identity.user.id
+
+        for data in [{}, {'actor_ids': []}, {'actor_ids': ['a']}, {'actor_ids': 1}]:
+            response = self.send_endorsement_requests(client, superuser_identity, rdm_record, data)
+            assert response.status_code == 400
+
+    def test_too_many_actors(self, client, rdm_record, superuser_identity, test_app, monkeypatch):
+        monkeypatch.setitem(test_app.config, 'NOTIFY_ENDORSEMENT_REQUEST_MAX_ACTORS', 2)
+        rdm_record._record.parent.access.owner.owner_id = superuser_identity.user.id
+
+        response = self.send_endorsement_requests(client, superuser_identity, rdm_record, {'actor_ids': [1, 2, 3]})
+
+        assert response.status_code == 400
+        assert 'Too many actors' in response.get_json()['message']
+
+    def test_unauthorized_user(self, client, rdm_record, superuser_identity, different_user, create_actor, db):
+        actor = create_actor(inbox_api_token='test-token')
+        rdm_record._record.parent.access.owner.owner_id = different_user.id
+
+        response = self.send_endorsement_requests(client, superuser_identity, rdm_record, {'actor_ids': [actor.id]})
+
         assert response.status_code == 400
+        assert 'User is not the owner of this record' in response.get_json().get('message', '')
+        assert EndorsementRequestModel.query.count() == 0
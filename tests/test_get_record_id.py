@@ -2,9 +2,13 @@
 
 import pytest
 from unittest.mock import patch
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_rdm_records.proxies import current_rdm_records
 
 from invenio_notify.services.service.inbox_service import get_record_id_from_notification
+from invenio_notify.utils.doi_cache import DoiCache
+from invenio_notify.utils.record_utils import get_recid_by_doi
 
 
 @pytest.fixture()
@@ -36,3 +40,35 @@ def test_resolve_record_from_doi(running_app, search_clear, location,
         {'context': {'id': 'https://doi.org/' + published_doi["identifier"]}})
     assert record._data['id'] == get_record_id_from_notification(
         {'context': {'id': parent_doi["identifier"]}})  # concept doi resolves to latest version
+
+
+def test_resolve_record_from_doi__cached(running_app, search_clear, location, resource_type_v, minimal_record,
+                                         mock_public_doi, monkeypatch):
+    """A DOI is looked up once, until its PID is updated."""
+    doi_cache = DoiCache(ttl=60)
+    monkeypatch.setattr(running_app.app.extensions['invenio-notify'], 'doi_cache', doi_cache)
+
+    superuser_identity = running_app.superuser_identity
+    service = current_rdm_records.records_service
+    minimal_record["pids"] = {}
+    draft = service.create(superuser_identity, minimal_record)
+    record = service.publish(superuser_identity, draft.id)
+    doi = record["pids"]["doi"]["identifier"]
+    notification = {'context': {'id': doi}}
+
+    with patch('invenio_notify.utils.doi_cache.get_recid_by_doi', wraps=get_recid_by_doi) as lookup:
+        assert get_record_id_from_notification(notification) == record.id
+        assert get_record_id_from_notification(notification) == record.id
+        assert lookup.call_count == 1
+
+        # only registered DOIs are resolved
+        pid = PersistentIdentifier.get('doi', doi)
+        pid.status = PIDStatus.RESERVED
+        db.session.commit()
+        assert doi_cache.get_recid(doi) is None
+        assert lookup.call_count == 2
+
+        pid.status = PIDStatus.REGISTERED
+        db.session.commit()
+        assert get_record_id_from_notification(notification) == record.id
+        assert lookup.call_count == 3
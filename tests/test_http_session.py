@@ -0,0 +1,47 @@
+from unittest.mock import Mock, patch
+
+from invenio_notify.utils.http_session import InboxSessionPool
+
+
+def test_session_per_host():
+    pool = InboxSessionPool()
+    session = pool.get_session('https://example.com/inbox')
+    assert pool.get_session('https://EXAMPLE.com/other-inbox') is session
+    assert pool.get_session('https://other.example.com/inbox') is not session
+    assert pool.get_session('http://example.com/inbox') is not session
+
+
+def test_session_adapter():
+    pool = InboxSessionPool(pool_maxsize=4, retries=3, retry_backoff=0.1)
+    adapter = pool.get_session('https://example.com/inbox').get_adapter('https://example.com/inbox')
+    assert adapter._pool_maxsize == 4
+    # only connection errors are retried
+    assert adapter.max_retries.connect == 3
+    assert adapter.max_retries.read == 0
+    assert adapter.max_retries.status == 0
+
+
+def test_post__default_timeouts():
+    pool = InboxSessionPool(connect_timeout=2, read_timeout=10)
+    with patch('requests.Session.post', return_value=Mock(status_code=202)) as mock_post:
+        pool.post('https://example.com/inbox', json={})
+        pool.post('https://example.com/inbox', json={}, timeout=1)
+
+    assert mock_post.call_args_list[0].kwargs['timeout'] == (2, 10)
+    assert mock_post.call_args_list[1].kwargs['timeout'] == 1
+
+
+def test_sessions_recreated_after_fork():
+    pool = InboxSessionPool()
+    session = pool.get_session('https://example.com/inbox')
+    pool._pid = -1  # as if the pool was created by the parent process
+    assert pool.get_session('https://example.com/inbox') is not session
+
+
+def test_clear():
+    pool = InboxSessionPool()
+    session = pool.get_session('https://example.com/inbox')
+    with patch.object(session, 'close') as mock_close:
+        pool.clear()
+    mock_close.assert_called_once()
+    assert pool.get_session('https://example.com/inbox') is not session
@@ -1,9 +1,15 @@
+import json
+from unittest.mock import patch
+
 import pytest
+from coarnotify.server import COARNotifyServer, COARNotifyServerError
 from invenio_oauth2server.models import Token
 
-from invenio_notify.records.models import ActorMapModel
+from invenio_notify.proxies import current_inbox_rate_limiter
+from invenio_notify.records.models import ActorMapModel, NotifyInboxModel
 from invenio_notify.scopes import inbox_scope
-from invenio_notify.utils import user_utils
+from invenio_notify.tasks import get_notification_type
+from invenio_notify.utils import request_timing, user_utils
 from tests.fixtures.inbox_payload import (
     payload_review,
     payload_endorsement_resp,
@@ -108,4 +114,159 @@ def test_inbox__duplicate_notification_id(client, rdm_record, user_actor_setup):
     # Send the same notification second time - should fail due to duplicate notification_id
     response2 = send_inbox(client, token, notify_review_data)
     assert response2.status_code == 400
-    assert response2.json['message'] == f'Notification already exists: {notification_id}'
\ No newline at end of file
+    assert response2.json['message'] == f'Notification already exists: {notification_id}'
+
+def send_inbox_bulk(client, token, data, content_type='application/json'):
+    """Make an authenticated request to the bulk inbox endpoint."""
+    headers = {'Authorization': f'Bearer {token.access_token}', 'Content-Type': content_type}
+    return client.post("/api/notify/inbox/bulk", data=data, headers=headers)
+
+
+def test_inbox_bulk(client, rdm_record, user_actor_setup):
+    review = payload_review(rdm_record.id)
+    token, user, actor = user_actor_setup(review['actor']['id'])
+    existing = payload_endorsement_resp(rdm_record.id)
+    assert send_inbox(client, token, existing).status_code == 202
+
+    mismatch = payload_review(rdm_record.id)
+    mismatch['actor']['id'] += 'wrong'
+    notifications = [review, mismatch, review, existing, payload_tentative_accept(rdm_record.id)]
+
+    response = send_inbox_bulk(client, token, json.dumps(notifications))
+    assert response.status_code == 200
+    assert response.json['accepted'] == 2
+    assert response.json['rejected'] == 3
+    assert [r['status'] for r in response.json['receipts']] == [202, 403, 400, 400, 202]
+    assert response.json['receipts'][3]['message'] == f'Notification already exists: {existing["id"]}'
+    assert NotifyInboxModel.query.count() == 3
+
+    inbox = NotifyInboxModel.query.filter_by(notification_id=review['id']).one()
+    assert inbox.user_id == user.id
+    assert inbox.record_id == rdm_record.id
+    assert inbox.notification_type == get_notification_type(review)
+
+
+def test_inbox_bulk__invalid_notification(client, rdm_record, user_actor_setup):
+    """The receipt of a notification rejected by the COAR server has its error message."""
+    notification = payload_review(rdm_record.id)
+    token, user, actor = user_actor_setup(notification['actor']['id'])
+
+    error = COARNotifyServerError(400, 'Invalid notification: missing object')
+    with patch.object(COARNotifyServer, 'receive', side_effect=error):
+        response = send_inbox_bulk(client, token, json.dumps([notification]))
+
+    assert response.status_code == 200
+    assert response.json['receipts'][0]['status'] == 400
+    assert response.json['receipts'][0]['message'] == 'Invalid notification: missing object'
+
+
+def test_inbox_bulk__ndjson(client, rdm_record, user_actor_setup):
+    notifications = [payload_review(rdm_record.id), payload_reject(rdm_record.id)]
+    token, user, actor = user_actor_setup(notifications[0]['actor']['id'])
+
+    data = '\n'.join(json.dumps(n) for n in notifications) + '\n'
+    response = send_inbox_bulk(client, token, data, content_type='application/x-ndjson')
+    assert response.status_code == 200
+    assert response.json['accepted'] == 2
+    assert {r['notification_id'] for r in response.json['receipts']} == {n['id'] for n in notifications}
+
+    response = send_inbox_bulk(client, token, 'not json\n', content_type='application/x-ndjson')
+    assert response.status_code == 400
+
+
+def test_inbox_bulk__too_many(client, rdm_record, user_actor_setup, monkeypatch, test_app):
+    monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_BULK_MAX_ITEMS', 1)
+    notifications = [payload_review(rdm_record.id), payload_review(rdm_record.id)]
+    token, user, actor = user_actor_setup(notifications[0]['actor']['id'])
+
+    response = send_inbox_bulk(client, token, json.dumps(notifications))
+    assert response.status_code == 400
+    assert NotifyInboxModel.query.count() == 0
+
+
+def test_inbox__record_not_found(client, rdm_record, user_actor_setup):
+    notify_review_data = payload_review('abcde-fghij')
+    token, user, actor = user_actor_setup(notify_review_data['actor']['id'])
+
+    response = send_inbox(client, token, notify_review_data)
+    assert response.status_code == 404
+    assert NotifyInboxModel.query.count() == 0
+
+
+@pytest.fixture
+def rate_limits(test_app, monkeypatch):
+    """Set the rate limits, starting with full buckets."""
+    current_inbox_rate_limiter.backend.reset()
+
+    def _set(per_token=None, per_actor=None, by_actor=None):
+        monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_RATE_LIMIT_PER_TOKEN', per_token)
+        monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_RATE_LIMIT_PER_ACTOR', per_actor)
+        monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_RATE_LIMITS_BY_ACTOR', by_actor or {})
+
+    yield _set
+    current_inbox_rate_limiter.backend.reset()
+
+
+def test_inbox__rate_limit_per_token(client, rdm_record, user_actor_setup, rate_limits):
+    rate_limits(per_token=(0.1, 1))
+    notification = payload_review(rdm_record.id)
+    token, user, actor = user_actor_setup(notification['actor']['id'])
+
+    assert send_inbox(client, token, notification).status_code == 202
+
+    response = send_inbox(client, token, payload_review(rdm_record.id))
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '10'
+
+
+def test_inbox_bulk__rate_limit_per_actor(client, rdm_record, user_actor_setup, rate_limits):
+    notifications = [payload_review(rdm_record.id) for _ in range(3)]
+    actor_id = notifications[0]['actor']['id']
+    rate_limits(per_actor=(100, 100), by_actor={actor_id: (1, 2)})
+    token, user, actor = user_actor_setup(actor_id)
+
+    response = send_inbox_bulk(client, token, json.dumps(notifications))
+    assert response.status_code == 200
+
+    response = send_inbox_bulk(client, token, json.dumps([payload_review(rdm_record.id)]))
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+
+
+def test_inbox__rate_limit_per_actor__not_member(client, rdm_record, user_actor_setup, create_actor, rate_limits):
+    """Notifications claiming an actor the user is not a member of do not drain the bucket of the actor."""
+    notification = payload_review(rdm_record.id)
+    actor_id = notification['actor']['id']
+    rate_limits(per_actor=(0.1, 1))
+    create_actor(actor_id=actor_id)
+    token, user, actor = user_actor_setup(actor_id + 'wrong')
+
+    for _ in range(2):
+        response = send_inbox(client, token, payload_review(rdm_record.id))
+        assert response.status_code == 403
+
+    # the whole bucket of the actor is left for its members
+    current_inbox_rate_limiter.check('token-member', [actor_id])
+
+
+def test_inbox__server_timing(client, rdm_record, user_actor_setup, monkeypatch, test_app):
+    monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_SERVER_TIMING', True)
+    notification = payload_review(rdm_record.id)
+    token, user, actor = user_actor_setup(notification['actor']['id'])
+
+    response = send_inbox(client, token, notification)
+    assert response.status_code == 202
+    phases = {p.split(';')[0].strip() for p in response.headers['Server-Timing'].split(',')}
+    assert {'auth', 'coar_validate', 'record_id', 'membership', 'record_exists', 'insert', 'total'} <= phases
+
+    # also for error responses
+    response = send_inbox(client, token, notification)
+    assert response.status_code == 400
+    assert 'total;dur=' in response.headers['Server-Timing']
+
+    # the phases are logged without the header
+    monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_SERVER_TIMING', False)
+    with patch.object(request_timing.log, 'info') as mock_log:
+        response = send_inbox(client, token, payload_review(rdm_record.id))
+    assert 'Server-Timing' not in response.headers
+    assert 'insert_ms' in mock_log.call_args.kwargs['extra']['server_timing']
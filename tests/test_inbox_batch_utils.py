@@ -0,0 +1,103 @@
+from contextlib import contextmanager
+from unittest.mock import PropertyMock, patch
+
+from invenio_db import db
+from sqlalchemy import event
+
+from invenio_notify import tasks
+from invenio_notify.records.models import ActorModel, EndorsementRequestModel
+from invenio_notify.utils.inbox_batch_utils import InboxBatchContext
+from tests.fixtures import inbox_payload
+from tests.fixtures.inbox_payload import payload_endorsement_resp, payload_reject
+
+
+@contextmanager
+def no_db_lookup():
+    """Fail if actors, memberships or endorsement requests are queried."""
+    with patch.object(ActorModel, 'has_member', side_effect=AssertionError), \
+            patch.object(ActorModel, 'query', new_callable=PropertyMock, side_effect=AssertionError), \
+            patch.object(EndorsementRequestModel, 'query', new_callable=PropertyMock, side_effect=AssertionError):
+        yield
+
+
+def test_prefetch(db, rdm_record, inbox_test_data_builder):
+    """Lookups for prefetched keys are served without querying the database."""
+    notification_data = payload_endorsement_resp(rdm_record.id, in_reply_to=inbox_payload.generate_notification_id())
+    test_data = (inbox_test_data_builder(rdm_record.id, notification_data)
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_endorsement_request()
+                 .create_inbox())
+
+    batch_context = InboxBatchContext()
+    batch_context.prefetch([test_data.inbox])
+
+    actor_id = notification_data['actor']['id']
+    with no_db_lookup():
+        assert batch_context.get_actor(actor_id).id == test_data.actor.id
+        assert batch_context.has_member(test_data.user_identity.id, actor_id) is True
+        endorsement_request = batch_context.get_endorsement_request(notification_data['inReplyTo'])
+        assert endorsement_request.id == test_data.endorsement_request.id
+        assert endorsement_request.actor.name == test_data.actor.name
+
+
+def test_prefetch__not_found(db, rdm_record, inbox_test_data_builder):
+    """Keys that were prefetched but do not exist are cached as missing."""
+    notification_data = payload_endorsement_resp(rdm_record.id, in_reply_to=inbox_payload.generate_notification_id())
+    test_data = inbox_test_data_builder(rdm_record.id, notification_data).create_inbox()
+
+    batch_context = InboxBatchContext()
+    batch_context.prefetch([test_data.inbox])
+
+    actor_id = notification_data['actor']['id']
+    with no_db_lookup():
+        assert batch_context.get_actor(actor_id) is None
+        assert batch_context.has_member(test_data.user_identity.id, actor_id) is False
+        assert batch_context.get_endorsement_request(notification_data['inReplyTo']) is None
+
+
+@contextmanager
+def count_lookup_queries():
+    """Count the SELECTs of actors, memberships and endorsement requests executed in the block."""
+    counter = {'queries': 0}
+
+    def before_cursor_execute(conn, cursor, statement, *args, **kwargs):
+        statement = statement.lower()
+        if statement.lstrip().startswith('select') and any(
+                f'{keyword} {table}' in statement
+                for keyword in ('from', 'join') for table in ('notify_actor', 'actor_map', 'endorsement_request ')):
+            counter['queries'] += 1
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def test_process_inbox_batch__prefetch_not_expired(db, rdm_record, inbox_test_data_builder):
+    """The prefetched lookups survive the commit of each record, their queries do not grow with the batch."""
+    notification_data = payload_reject(rdm_record.id)
+    test_data = (inbox_test_data_builder(rdm_record.id, notification_data)
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_endorsement_request()
+                 .create_inbox())
+    inboxes = [test_data.inbox]
+    for _ in range(3):
+        in_reply_to = inbox_payload.generate_notification_id()
+        test_data.create_endorsement_request(notification_id=in_reply_to)
+        inboxes.append(test_data._create_inbox_fixture(
+            record_id=test_data.record_id,
+            raw=payload_reject(rdm_record.id, in_reply_to=in_reply_to),
+            user_id=test_data.user_identity.id,
+        ))
+
+    with count_lookup_queries() as single:
+        tasks.process_inbox_batch(inboxes[:1], commit_size=1)
+    with count_lookup_queries() as batch:
+        tasks.process_inbox_batch(inboxes[1:], commit_size=1)
+
+    assert all(inbox.process_date is not None for inbox in inboxes)
+    assert all(inbox.process_note is None for inbox in inboxes)
+    assert batch['queries'] == single['queries']
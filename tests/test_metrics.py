@@ -0,0 +1,62 @@
+"""Unit tests for the metrics backends."""
+
+from invenio_notify.metrics import InMemoryMetrics, NotifyMetrics, to_prometheus_text
+
+
+def test_in_memory_metrics__snapshot():
+    metrics = InMemoryMetrics(buckets=(0.1, 1))
+    metrics.incr('notify_inbox_notifications_total', type='review', outcome='processed')
+    metrics.incr('notify_inbox_notifications_total', type='review', outcome='processed')
+    metrics.gauge('notify_inbox_queue_depth', 3)
+    metrics.observe('notify_inbox_stage_seconds', 0.05, stage='decode')
+    metrics.observe('notify_inbox_stage_seconds', 2, stage='decode')
+
+    snapshot = metrics.snapshot()
+    assert snapshot['counters'] == [{'name': 'notify_inbox_notifications_total',
+                                     'labels': {'outcome': 'processed', 'type': 'review'},
+                                     'value': 2}]
+    assert snapshot['gauges'] == [{'name': 'notify_inbox_queue_depth', 'labels': {}, 'value': 3}]
+    histogram, = snapshot['histograms']
+    assert histogram['labels'] == {'stage': 'decode'}
+    assert histogram['buckets'] == {0.1: 1, 1: 0, float('inf'): 1}
+    assert histogram['sum'] == 2.05
+    assert histogram['count'] == 2
+
+
+def test_timer__records_on_error():
+    metrics = InMemoryMetrics()
+    try:
+        with metrics.timer('notify_inbox_stage_seconds', stage='decode'):
+            raise ValueError()
+    except ValueError:
+        pass
+
+    histogram, = metrics.snapshot()['histograms']
+    assert histogram['count'] == 1
+
+
+def test_notify_metrics__discards():
+    metrics = NotifyMetrics()
+    metrics.incr('a')
+    with metrics.timer('b'):
+        pass
+    metrics.export('/does/not/exist')
+
+
+def test_to_prometheus_text(tmp_path):
+    metrics = InMemoryMetrics(buckets=(1,))
+    metrics.incr('notify_inbox_notifications_total', actor='https://a"b', outcome='processed')
+    metrics.observe('notify_inbox_stage_seconds', 0.5, stage='decode')
+
+    path = tmp_path / 'notify.prom'
+    metrics.export(str(path))
+
+    assert path.read_text() == to_prometheus_text(metrics.snapshot()) == (
+        '# TYPE notify_inbox_notifications_total counter\n'
+        'notify_inbox_notifications_total{actor="https://a\\"b",outcome="processed"} 1\n'
+        '# TYPE notify_inbox_stage_seconds histogram\n'
+        'notify_inbox_stage_seconds_bucket{stage="decode",le="1"} 1\n'
+        'notify_inbox_stage_seconds_bucket{stage="decode",le="+Inf"} 1\n'
+        'notify_inbox_stage_seconds_sum{stage="decode"} 0.5\n'
+        'notify_inbox_stage_seconds_count{stage="decode"} 1\n'
+    )
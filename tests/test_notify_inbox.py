@@ -1,5 +1,12 @@
+from unittest.mock import patch
+
+import pytest
+
+from invenio_notify import constants, tasks
+from invenio_notify.errors import DuplicateNotificationError
 from invenio_notify.proxies import current_inbox_service
 from invenio_notify.records.models import NotifyInboxModel
+from invenio_notify.tasks import mark_as_processed
 from tests.fixtures.inbox_fixture import create_inbox
 from tests.fixtures.inbox_payload import payload_review
 
@@ -33,6 +40,13 @@ def test_service_create(test_app, superuser_identity):
     assert 'links' in result_dict
     assert NotifyInboxModel.query.count() == 1
 
+    # normalized columns are extracted from the raw notification
+    assert result_dict['notification_type'] == constants.TYPE_REVIEW
+    assert result_dict['workflow_status'] == constants.WORKFLOW_STATUS_ANNOUNCE_REVIEW
+    assert result_dict['actor_id'] == raw_payload['actor']['id']
+    assert result_dict['in_reply_to'] is None
+    assert result_dict['context_url'] == raw_payload['context']['id']
+
 
 def test_service_search(test_app, superuser_identity):
     notify_inbox_serv = current_inbox_service
@@ -66,3 +80,83 @@ def test_service_search(test_app, superuser_identity):
     assert record_id_1 in record_ids
     assert record_id_2 in record_ids
     assert record_id_3 in record_ids
+
+
+def test_service_search__normalized_fields(test_app, superuser_identity):
+    """Records are found by their normalized columns, e.g. the actor ID."""
+    raw = payload_review('record1')
+    current_inbox_service.create(superuser_identity, {'raw': raw, 'record_id': 'record1'})
+
+    result = current_inbox_service.search(superuser_identity, params={'q': raw['actor']['id']})
+    hits = result.to_dict()['hits']['hits']
+    assert [hit['notification_id'] for hit in hits] == [raw['id']]
+
+    result = current_inbox_service.search(superuser_identity, params={'q': constants.TYPE_REVIEW})
+    assert len(result.to_dict()['hits']['hits']) == 1
+
+
+def test_unprocessed_records__processed_while_iterating(db, superuser_identity, create_inbox):
+    """Marking records as processed during iteration must not skip any pending record."""
+    inboxes = [create_inbox(record_id=f'r{i}') for i in range(5)]
+    db.session.commit()
+
+    seen_ids = []
+    for inbox in NotifyInboxModel.unprocessed_records(batch_size=2):
+        seen_ids.append(inbox.id)
+        mark_as_processed(inbox)
+
+    assert seen_ids == sorted(i.id for i in inboxes)
+    assert NotifyInboxModel.query.filter(NotifyInboxModel.process_date.is_(None)).count() == 0
+
+
+def test_claim_unprocessed_records(db, superuser_identity, create_inbox):
+    """Workers claim disjoint batches and skip rows claimed by others."""
+    inboxes = [create_inbox(record_id=f'r{i}') for i in range(3)]
+    db.session.commit()
+
+    batch_1 = NotifyInboxModel.claim_unprocessed_records('worker-1', batch_size=2)
+    batch_2 = NotifyInboxModel.claim_unprocessed_records('worker-2', batch_size=2)
+
+    assert [r.id for r in batch_1] == [inboxes[0].id, inboxes[1].id]
+    assert [r.id for r in batch_2] == [inboxes[2].id]
+    assert {r.claimed_by for r in batch_1} == {'worker-1'}
+    assert NotifyInboxModel.claim_unprocessed_records('worker-3', batch_size=2) == []
+
+
+def test_claim_unprocessed_records__expired_claim(db, superuser_identity, create_inbox):
+    """A claim older than the claim timeout can be claimed again."""
+    inbox = create_inbox(record_id='r1')
+    db.session.commit()
+
+    assert len(NotifyInboxModel.claim_unprocessed_records('worker-1')) == 1
+    reclaimed = NotifyInboxModel.claim_unprocessed_records('worker-2', claim_timeout=-1)
+
+    assert [r.id for r in reclaimed] == [inbox.id]
+    assert reclaimed[0].claimed_by == 'worker-2'
+
+
+def test_service_create__process_on_receive(test_app, superuser_identity, monkeypatch):
+    """A processing task is scheduled for the new record when enabled."""
+    monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_PROCESS_ON_RECEIVE', True)
+
+    record_id = 'kajsdlkasjk'
+    with patch.object(tasks.shared_task_process_inbox_record, 'delay') as mock_delay:
+        result = current_inbox_service.create(superuser_identity, {
+            'raw': payload_review(record_id), 'record_id': record_id
+        })
+
+    mock_delay.assert_called_once_with(result._record.id)
+
+
+def test_service_create__duplicate(db, superuser_identity):
+    """A duplicate notification ID is skipped without failing the transaction."""
+    record_id = 'kajsdlkasjk'
+    raw = payload_review(record_id)
+    result = current_inbox_service.create(superuser_identity, {'raw': raw, 'record_id': record_id})
+
+    assert current_inbox_service.create_if_absent(superuser_identity, {'raw': raw, 'record_id': record_id}) is None
+    with pytest.raises(DuplicateNotificationError):
+        current_inbox_service.create(superuser_identity, {'raw': raw, 'record_id': record_id})
+
+    # the session is still usable
+    assert [r.id for r in NotifyInboxModel.query.all()] == [result._record.id]
@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import pytest
+
+from invenio_notify.rate_limit import InboxRateLimiter, InMemoryRateLimitBackend, RateLimitBackend, \
+    RateLimitExceeded
+
+
+def test_in_memory_backend():
+    backend = InMemoryRateLimitBackend()
+    with patch('invenio_notify.rate_limit.time.monotonic', return_value=100):
+        assert backend.consume('k', rate=2, burst=2) == 0
+        assert backend.consume('k', rate=2, burst=2) == 0
+        assert backend.consume('k', rate=2, burst=2) == 0.5
+        # other keys have their own bucket
+        assert backend.consume('other', rate=2, burst=2) == 0
+
+    with patch('invenio_notify.rate_limit.time.monotonic', return_value=100.5):
+        assert backend.consume('k', rate=2, burst=2) == 0
+
+
+def test_in_memory_backend__cost_above_burst():
+    """A cost above the burst is allowed with a full bucket and paid back before the next request."""
+    backend = InMemoryRateLimitBackend()
+    with patch('invenio_notify.rate_limit.time.monotonic', return_value=100):
+        assert backend.consume('k', rate=1, burst=2, cost=5) == 0
+        assert backend.consume('k', rate=1, burst=2) == 4
+
+
+def test_backend_is_abstract():
+    with pytest.raises(TypeError):
+        RateLimitBackend()
+
+
+def test_in_memory_backend__refund():
+    backend = InMemoryRateLimitBackend()
+    with patch('invenio_notify.rate_limit.time.monotonic', return_value=100):
+        assert backend.consume('k', rate=1, burst=2, cost=2) == 0
+        backend.refund('k', rate=1, burst=2, cost=1)
+        assert backend.consume('k', rate=1, burst=2) == 0
+        assert backend.consume('k', rate=1, burst=2) == 1
+        # the refund does not fill a bucket above its burst
+        backend.refund('k', rate=1, burst=2, cost=5)
+        assert backend._buckets['k'][0] == 2
+
+
+def test_limiter__rejected_request_is_not_charged(test_app, monkeypatch):
+    """A request rejected by an actor limit does not drain the bucket of the token."""
+    monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_RATE_LIMIT_PER_TOKEN', (1, 2))
+    monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_RATE_LIMIT_PER_ACTOR', (1, 1))
+    monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_RATE_LIMITS_BY_ACTOR', {})
+    limiter = InboxRateLimiter(InMemoryRateLimitBackend())
+
+    with patch('invenio_notify.rate_limit.time.monotonic', return_value=100):
+        limiter.check('token-1', ['actor-1'])
+        for _ in range(3):
+            with pytest.raises(RateLimitExceeded) as e:
+                limiter.check('token-1', ['actor-1'])
+            assert e.value.scope == 'actor'
+
+        # the token still has the token of the rejected requests
+        limiter.check('token-1', ['actor-2'])
@@ -0,0 +1,147 @@
+from unittest.mock import patch
+
+from invenio_notify import constants, tasks
+from invenio_notify.errors import SendRequestFail
+from invenio_notify.records.models import (
+    ActorModel,
+    EndorsementModel,
+    EndorsementRequestModel,
+    RecordActorStatusModel,
+)
+from invenio_notify.resources.resource import basic_db_resource, endorsement_request_resource
+from invenio_notify.tasks import inbox_processing
+from tests.fixtures import inbox_payload
+from tests.fixtures.inbox_payload import payload_endorsement_resp, payload_reject
+
+
+def get_status(record_id, actor_id):
+    return RecordActorStatusModel.get_statuses(record_id, [actor_id]).get(actor_id)
+
+
+def test_endorsement(db, rdm_record, inbox_test_data_builder):
+    notification_data = payload_endorsement_resp(rdm_record.id, in_reply_to=inbox_payload.generate_notification_id())
+    test_data = (inbox_test_data_builder(rdm_record.id, notification_data)
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_inbox())
+
+    inbox_processing()
+
+    status = get_status(rdm_record._record.id, test_data.actor.id)
+    assert status.endorsement_type == constants.TYPE_ENDORSEMENT
+    assert status.request_id is None
+
+
+def test_reply(db, rdm_record, inbox_test_data_builder):
+    notification_data = payload_reject(rdm_record.id)
+    test_data = (inbox_test_data_builder(rdm_record.id, notification_data)
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_endorsement_request()
+                 .create_inbox())
+    record_id = rdm_record._record.id
+    actor_id = test_data.actor.id
+    # the fixture creates the request without maintaining the table, as before the backfill
+    RecordActorStatusModel.refresh(record_id, actor_id)
+    RecordActorStatusModel.commit()
+    assert get_status(record_id, actor_id).request_status == test_data.endorsement_request.latest_status
+
+    inbox_processing()
+
+    status = get_status(record_id, actor_id)
+    assert status.request_id == test_data.endorsement_request.id
+    assert (status.request_status, status.reply_notification_id) == tuple(
+        EndorsementRequestModel.get_latest_status(record_id, actor_id, include_id=True)
+    )
+    assert status.reply_notification_id == test_data.inbox.notification_id
+
+
+@patch.object(endorsement_request_resource, 'shared_task_deliver_endorsement_request')
+def test_request_and_failed_delivery(mock_task, db, rdm_record, superuser_identity, create_actor):
+    actor = create_actor(inbox_url='https://example.com/inbox', inbox_api_token='test-token')
+    record_id = rdm_record._record.id
+    assert ActorModel.get_available_actors(record_id) == [
+        {'actor_id': actor.id, 'actor_name': actor.name, 'status': constants.WORKFLOW_STATUS_AVAILABLE},
+    ]
+
+    request = endorsement_request_resource.create_endorsement_request_record(
+        {'id': inbox_payload.generate_notification_id()}, record_id, superuser_identity.id, actor.id,
+    )
+
+    status = get_status(record_id, actor.id)
+    assert status.request_id == request.id
+    assert status.request_status == constants.WORKFLOW_STATUS_REQUEST_ENDORSEMENT
+    assert [a['status'] for a in ActorModel.get_available_actors(record_id)] == [
+        constants.WORKFLOW_STATUS_REQUEST_ENDORSEMENT,
+    ]
+
+    # the actor can be requested again when the request could not be delivered
+    tasks.record_delivery_failure(EndorsementRequestModel.get(request.id), SendRequestFail('Unauthorized', 401))
+
+    assert get_status(record_id, actor.id) is None
+    assert [a['status'] for a in ActorModel.get_available_actors(record_id)] == [
+        constants.WORKFLOW_STATUS_AVAILABLE,
+    ]
+
+
+def test_refresh(db, create_endorsement_request, create_endorsement, create_actor):
+    """The refreshed row matches the latest statuses of the endorsement tables."""
+    request = create_endorsement_request(latest_status=constants.WORKFLOW_STATUS_TENTATIVE_REJECT)
+    record_id, actor_id = request.record_id, request.actor_id
+
+    RecordActorStatusModel.refresh(record_id, actor_id)
+    status = get_status(record_id, actor_id)
+    assert status.endorsement_type is None
+    assert status.request_status == EndorsementRequestModel.get_latest_status(record_id, actor_id)
+
+    create_endorsement(record_id, actor_id, review_type=constants.TYPE_REVIEW)
+    RecordActorStatusModel.refresh(record_id, actor_id)
+    status = get_status(record_id, actor_id)
+    assert status.endorsement_type == EndorsementModel.get_latest_status(record_id, actor_id)
+    assert status.request_id == request.id
+
+
+def test_admin_delete_endorsement(db, client, rdm_record, superuser_identity, create_actor, create_endorsement):
+    """The actor becomes available again when its endorsement is deleted by an admin."""
+    actor = create_actor(inbox_url='https://example.com/inbox', inbox_api_token='test-token')
+    record_id = rdm_record._record.id
+    create_endorsement(record_id, actor.id)
+    RecordActorStatusModel.set_endorsement(record_id, actor.id, constants.TYPE_ENDORSEMENT)
+    RecordActorStatusModel.commit()
+    endorsement = EndorsementModel.query.filter_by(record_id=record_id, actor_id=actor.id).one()
+    assert ActorModel.get_available_actors(record_id) == []
+
+    with patch.object(basic_db_resource, 'g') as mock_g:
+        mock_g.identity = superuser_identity
+        response = client.delete(f'/api/endorsement-admin/{endorsement.id}')
+
+    assert response.status_code == 204
+    assert EndorsementModel.query.count() == 0
+    assert get_status(record_id, actor.id) is None
+    assert ActorModel.get_available_actors(record_id) == [
+        {'actor_id': actor.id, 'actor_name': actor.name, 'status': constants.WORKFLOW_STATUS_AVAILABLE},
+    ]
+
+
+def test_admin_delete_inbox(db, client, rdm_record, superuser_identity, inbox_test_data_builder):
+    """The reply of a deleted inbox record is removed from the status."""
+    notification_data = payload_reject(rdm_record.id)
+    test_data = (inbox_test_data_builder(rdm_record.id, notification_data)
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_endorsement_request()
+                 .create_inbox())
+    record_id = rdm_record._record.id
+    actor_id = test_data.actor.id
+    inbox_processing()
+    assert get_status(record_id, actor_id).reply_notification_id == test_data.inbox.notification_id
+
+    with patch.object(basic_db_resource, 'g') as mock_g:
+        mock_g.identity = superuser_identity
+        response = client.delete(f'/api/notify-inbox/{test_data.inbox.id}')
+
+    assert response.status_code == 204
+    db.session.expire_all()
+    status = get_status(record_id, actor_id)
+    assert status.request_id == test_data.endorsement_request.id
+    assert status.reply_notification_id is None
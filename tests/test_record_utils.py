@@ -0,0 +1,39 @@
+import uuid
+from unittest.mock import patch
+
+from invenio_notify.utils.record_cache import RecordExistenceCache
+from invenio_notify.utils.record_utils import get_record_summaries, get_record_summary, record_exists
+from invenio_rdm_records.proxies import current_rdm_records_service
+
+
+def test_get_record_summary(db, rdm_record, superuser_identity):
+    record = current_rdm_records_service.record_cls.pid.resolve(rdm_record.id)
+
+    summary = get_record_summary(record.id)
+
+    assert summary.id == str(record.id)
+    assert summary.pid_value == rdm_record.id
+    assert summary.title == rdm_record.data['metadata']['title']
+    assert summary.parent_id == str(record.parent.id)
+    assert summary.owner_user_id == int(superuser_identity.id)
+
+
+def test_get_record_summaries__not_found(db):
+    assert get_record_summary(uuid.uuid4()) is None
+    assert get_record_summaries([]) == {}
+
+
+def test_record_exists(db, rdm_record):
+    assert record_exists(rdm_record.id) is True
+    assert record_exists('abcde-fghij') is False
+
+
+def test_record_existence_cache(db, rdm_record):
+    record_cache = RecordExistenceCache(ttl=60)
+
+    with patch('invenio_notify.utils.record_cache.record_exists', wraps=record_exists) as lookup:
+        for _ in range(2):
+            assert record_cache.exists(rdm_record.id) is True
+            assert record_cache.exists('abcde-fghij') is False
+        assert lookup.call_count == 2
+
@@ -0,0 +1,28 @@
+from flask import Flask
+
+from invenio_notify.utils.request_timing import RequestTiming, request_phase, get_request_timing
+
+
+def test_request_timing():
+    timing = RequestTiming()
+    timing.begin_phase('a')
+    timing.queries += 2
+    timing.end_phase('a')
+    timing.begin_phase('a')
+    timing.queries += 1
+    timing.end_phase('a')
+    timing.begin_phase('unfinished')
+    timing.finish()
+
+    assert timing.phases['a']['queries'] == 3
+    assert set(timing.phases) == {'a', 'unfinished', 'total'}
+    assert timing.phases['total']['queries'] == 3
+    assert timing.header().startswith('a;dur=')
+    assert timing.log_fields()['a_queries'] == 3
+
+
+def test_request_phase__not_timed():
+    with Flask(__name__).test_request_context():
+        assert get_request_timing() is None
+        with request_phase('a'):
+            pass
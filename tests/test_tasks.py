@@ -1,12 +1,16 @@
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
 
-from invenio_notify import constants
+from invenio_indexer.api import RecordIndexer
+
+from invenio_notify import constants, tasks
+from invenio_notify.notifications.builders import EndorsementDigestNotificationBuilder
+from invenio_notify.proxies import current_notify_metrics
 from invenio_notify.records.models import NotifyInboxModel, EndorsementModel, EndorsementRequestModel, \
     EndorsementReplyModel
-from invenio_notify.tasks import inbox_processing, mark_as_processed
+from invenio_notify.tasks import inbox_processing, mark_as_processed, shared_task_process_inbox_record
 from tests.fixtures import inbox_payload
-from tests.fixtures.inbox_fixture import create_inbox
 from tests.fixtures.inbox_payload import payload_endorsement_resp
 from tests.fixtures.inbox_payload import payload_review, \
     payload_reject
@@ -47,6 +51,15 @@ def assert_inbox_processing_failed(inbox, process_note_startswith, n_request=0):
     assert EndorsementReplyModel.query.count() == 0
 
 
+def create_inbox_for_builder(test_data, notification_data):
+    """Create another inbox record for the record and user of a test data builder."""
+    return test_data._create_inbox_fixture(
+        record_id=test_data.record_id,
+        raw=notification_data,
+        user_id=test_data.user_identity.id,
+    )
+
+
 def test_mark_as_processed(db, superuser_identity, create_inbox):
     """Test the mark_as_processed function."""
     # Create a test inbox record
@@ -221,7 +234,49 @@ def test_inbox_processing__fail__record_not_found(db, superuser_identity, create
                  .add_member_to_actor()
                  .create_inbox())
 
+    inbox_processing()
+
+    # the record may not be registered yet, so it is retried later
+    inbox = NotifyInboxModel.get(test_data.inbox.id)
+    assert inbox.process_date is None
+    assert inbox.attempts == 1
+    assert inbox.last_error == "TransientError: Failed to resolve record from notification"
+    assert inbox.next_attempt_at is not None
+    assert inbox.claimed_by is None
+    assert list(NotifyInboxModel.unprocessed_records()) == []
+
+
+def test_inbox_processing__fail__record_not_found__attempts_used_up(db, inbox_test_data_builder,
+                                                                     test_app, monkeypatch):
+    """Test inbox processing when the "record" is still not found at the last attempt."""
+    monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_MAX_ATTEMPTS', 2)
+
+    record_id = 'r1'
+    test_data = (inbox_test_data_builder(record_id, payload_review(record_id))
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_inbox())
+    inbox_processing()
+
+    # next attempt is due
+    NotifyInboxModel.get(test_data.inbox.id).next_attempt_at = datetime(2000, 1, 1)
+    db.session.commit()
+
     assert_inbox_processing_failed(test_data.inbox, "Failed to resolve record from notification")
+    assert NotifyInboxModel.get(test_data.inbox.id).attempts == 2
+
+
+def test_inbox_processing__fail__record_url_invalid(db, inbox_test_data_builder):
+    """A record URL without record ID is not retried."""
+    notification_data = payload_review('r1')
+    notification_data['context']['id'] = 'https://example.com/not-a-record'
+    test_data = (inbox_test_data_builder('r1', notification_data)
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_inbox())
+
+    assert_inbox_processing_failed(test_data.inbox, "Failed to extract record ID from notification URL")
+    assert NotifyInboxModel.get(test_data.inbox.id).attempts == 0
 
 
 def test_inbox_processing__fail__actor_not_found(db, rdm_record, inbox_test_data_builder):
@@ -247,3 +302,265 @@ def test_inbox_processing__fail__not_a_member(db, rdm_record, inbox_test_data_bu
                  .create_inbox())
 
     assert_inbox_processing_failed(test_data.inbox, "User is not a member of actor")
+
+
+def test_process_inbox_batch__claim_expired(db, rdm_record, inbox_test_data_builder):
+    """Records claimed again by another worker after the claim timeout are not processed twice."""
+    record_id = rdm_record.id
+    test_data = (inbox_test_data_builder(record_id, payload_review(record_id))
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_inbox())
+    batch_1 = NotifyInboxModel.claim_unprocessed_records('worker-1')
+    batch_2 = NotifyInboxModel.claim_unprocessed_records('worker-2', claim_timeout=-1)
+    assert [r.id for r in batch_2] == [test_data.inbox.id]
+
+    tasks.process_inbox_batch(batch_1, worker_id='worker-1')
+    inbox = NotifyInboxModel.get(test_data.inbox.id)
+    assert inbox.process_date is None
+    assert inbox.claimed_by == 'worker-2'
+
+    tasks.process_inbox_batch(batch_2, worker_id='worker-2')
+    assert_inbox_processed(test_data.inbox)
+    assert EndorsementModel.query.count() == 1
+    # the owner does not process it again either
+    tasks.process_inbox_batch(batch_2, worker_id='worker-2')
+    assert EndorsementModel.query.count() == 1
+
+
+def test_shared_task_process_inbox_record(db, rdm_record, inbox_test_data_builder):
+    """Only the given inbox record is processed by the per-notification task."""
+    record_id = rdm_record.id
+    test_data = (inbox_test_data_builder(record_id, payload_review(record_id))
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_inbox())
+    other_inbox = create_inbox_for_builder(test_data, payload_review(record_id))
+
+    shared_task_process_inbox_record(test_data.inbox.id)
+
+    assert_inbox_processed(test_data.inbox)
+    assert NotifyInboxModel.get(other_inbox.id).process_date is None
+    assert EndorsementModel.query.count() == 1
+
+
+def test_inbox_processing__coalesced_reindex(db, rdm_record, inbox_test_data_builder):
+    """Versions of a record touched by several notifications are bulk indexed once per batch."""
+    record_id = rdm_record.id
+    test_data = (inbox_test_data_builder(record_id, payload_review(record_id))
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_inbox())
+    create_inbox_for_builder(test_data, payload_review(record_id))
+
+    with patch.object(RecordIndexer, 'bulk_index') as mock_bulk_index, \
+            patch.object(RecordIndexer, 'index_by_id') as mock_index_by_id:
+        inbox_processing()
+
+    record = current_rdm_records_service.record_cls.pid.resolve(record_id)
+    assert EndorsementModel.query.count() == 2
+    mock_bulk_index.assert_called_once_with([record.id])
+    mock_index_by_id.assert_not_called()
+
+
+def test_inbox_processing__commit_size__failed_record_rolled_back(db, rdm_record, inbox_test_data_builder,
+                                                                  test_app, monkeypatch):
+    """A failing record only rolls back its own savepoint, the rest of the transaction is committed."""
+    monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_COMMIT_SIZE', 2)
+
+    record_id = rdm_record.id
+    notification_data = payload_endorsement_resp(record_id, in_reply_to=inbox_payload.generate_notification_id())
+    test_data = (inbox_test_data_builder(record_id, notification_data)
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_endorsement_request()
+                 .create_inbox())
+    other_inbox = create_inbox_for_builder(test_data, payload_review(record_id))
+
+    # the record of the first notification cannot be resolved
+    resolve_record = tasks.resolve_record_from_notification
+    results = [None]
+    with patch.object(tasks, 'resolve_record_from_notification',
+                      side_effect=lambda url: results.pop() if results else resolve_record(url)):
+        inbox_processing()
+
+    # the reply created before resolving the record failed is rolled back
+    assert NotifyInboxModel.get(test_data.inbox.id).attempts == 1
+    assert EndorsementReplyModel.query.count() == 0
+    assert_inbox_processed(other_inbox)
+    assert EndorsementModel.query.count() == 1
+
+
+def test_inbox_processing__unexpected_error__isolated(db, rdm_record, inbox_test_data_builder):
+    """An unexpected error is counted on the failing record, the other records are processed."""
+    record_id = rdm_record.id
+    test_data = (inbox_test_data_builder(record_id, payload_review(record_id))
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_inbox())
+    other_inbox = create_inbox_for_builder(test_data, payload_review(record_id))
+
+    resolve_record = tasks.resolve_record_from_notification
+    errors = [KeyError('id')]
+
+    def resolve_record_or_raise(url):
+        if errors:
+            raise errors.pop()
+        return resolve_record(url)
+
+    with patch.object(tasks, 'resolve_record_from_notification', side_effect=resolve_record_or_raise):
+        inbox_processing()
+
+    failed_inbox = NotifyInboxModel.get(test_data.inbox.id)
+    assert failed_inbox.process_date is None
+    assert failed_inbox.attempts == 1
+    assert failed_inbox.last_error == "KeyError: 'id'"
+    assert failed_inbox.quarantined_at is None
+    assert_inbox_processed(other_inbox)
+    assert EndorsementModel.query.count() == 1
+
+
+def test_inbox_processing__unexpected_error__quarantined(db, rdm_record, inbox_test_data_builder,
+                                                        test_app, monkeypatch):
+    """A record is quarantined after NOTIFY_INBOX_MAX_ATTEMPTS failed attempts and no longer claimed."""
+    monkeypatch.setitem(test_app.config, 'NOTIFY_INBOX_MAX_ATTEMPTS', 1)
+
+    record_id = rdm_record.id
+    test_data = (inbox_test_data_builder(record_id, payload_review(record_id))
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_inbox())
+
+    with patch.object(tasks, 'resolve_record_from_notification', side_effect=RuntimeError('boom')):
+        inbox_processing()
+
+    inbox = NotifyInboxModel.get(test_data.inbox.id)
+    assert inbox.process_date is None
+    assert inbox.attempts == 1
+    assert inbox.quarantined_at is not None
+    assert NotifyInboxModel.claim_unprocessed_records('worker', claim_timeout=0) == []
+    assert list(NotifyInboxModel.unprocessed_records()) == []
+
+
+def test_inbox_processing__metrics(db, rdm_record, inbox_test_data_builder):
+    """Stage timings, notification counters and queue gauges are recorded."""
+    record_id = rdm_record.id
+    (inbox_test_data_builder(record_id, payload_review(record_id))
+     .create_actor()
+     .add_member_to_actor()
+     .create_inbox())
+    current_notify_metrics.reset()
+
+    inbox_processing()
+
+    snapshot = current_notify_metrics.snapshot()
+    stages = {h['labels']['stage'] for h in snapshot['histograms']}
+    assert {'claim', 'prefetch', 'actor_lookup', 'record_resolve', 'endorsement_create',
+            'notification_build', 'commit', 'reindex'} <= stages
+    counter, = snapshot['counters']
+    assert counter['name'] == 'notify_inbox_notifications_total'
+    assert counter['labels']['outcome'] == 'processed'
+    assert counter['value'] == 1
+    gauges = {g['name']: g['value'] for g in snapshot['gauges']}
+    assert gauges['notify_inbox_queue_depth'] == 0
+    assert gauges['notify_inbox_oldest_unprocessed_age_seconds'] == 0
+
+
+def test_inbox_processing__email_digest(db, rdm_record, inbox_test_data_builder, test_app, monkeypatch):
+    """The emails of a batch are sent as one digest per record owner."""
+    monkeypatch.setitem(test_app.config, 'NOTIFY_EMAIL_DIGEST', True)
+
+    record_id = rdm_record.id
+    test_data = (inbox_test_data_builder(record_id, payload_review(record_id))
+                 .create_actor()
+                 .add_member_to_actor()
+                 .create_inbox())
+    create_inbox_for_builder(test_data, payload_review(record_id))
+    create_inbox_for_builder(test_data, payload_endorsement_resp(record_id))
+
+    with patch('invenio_notify.notifications.digest.broadcast_notification') as mock_broadcast:
+        inbox_processing()
+
+    assert EndorsementModel.query.count() == 3
+    mock_broadcast.delay.assert_called_once()
+    notification, = mock_broadcast.delay.call_args.args
+    assert notification['type'] == 'endorsement-digest'
+    assert [i['type'] for i in notification['context']['items']] == [
+        'endorsement-update', 'endorsement-update', 'new-endorsement',
+    ]
+    assert {i['record_title'] for i in notification['context']['items']} == {rdm_record.data['metadata']['title']}
+    # the builder is registered by the extension
+    assert test_app.config['NOTIFICATIONS_BUILDERS'][notification['type']] is EndorsementDigestNotificationBuilder
+
+
+def create_pending_request(create_endorsement_request, create_actor, next_delivery_at=None):
+    actor = create_actor(inbox_url='https://example.com/inbox', inbox_api_token='test-token')
+    request = create_endorsement_request(actor_id=actor.id)
+    request.next_delivery_at = next_delivery_at or datetime.now(timezone.utc)
+    EndorsementRequestModel.commit()
+    return request.id
+
+
+@patch('requests.Session.post')
+def test_deliver_endorsement_request__delivered(mock_post, db, create_endorsement_request, create_actor):
+    request_id = create_pending_request(create_endorsement_request, create_actor)
+    mock_post.return_value = Mock(status_code=202)
+
+    tasks.shared_task_deliver_endorsement_request(request_id)
+
+    mock_post.assert_called_once()
+    request = EndorsementRequestModel.get(request_id)
+    assert request.delivery_status == constants.DELIVERY_STATUS_DELIVERED
+    assert request.delivered_at is not None
+    assert request.next_delivery_at is None
+
+    # a delivered request is not posted again
+    tasks.shared_task_deliver_endorsement_request(request_id)
+    mock_post.assert_called_once()
+
+
+@patch.object(tasks.shared_task_deliver_endorsement_request, 'apply_async')
+@patch('requests.Session.post')
+def test_deliver_endorsement_request__retry(mock_post, mock_apply_async, db, create_endorsement_request,
+                                            create_actor, test_app, monkeypatch):
+    """A transient failure is retried with backoff, the request fails once the attempts are used up."""
+    monkeypatch.setitem(test_app.config, 'NOTIFY_DELIVERY_MAX_ATTEMPTS', 2)
+    monkeypatch.setitem(test_app.config, 'NOTIFY_DELIVERY_RETRY_BACKOFF', 30)
+    request_id = create_pending_request(create_endorsement_request, create_actor)
+    mock_post.return_value = Mock(status_code=503, text='Service Unavailable')
+
+    tasks.deliver_pending_endorsement_requests()
+
+    request = EndorsementRequestModel.get(request_id)
+    assert request.delivery_status == constants.DELIVERY_STATUS_PENDING
+    assert request.delivery_attempts == 1
+    assert request.last_delivery_error == 'SendRequestFail: Actor reply invalid request [503]'
+    assert request.next_delivery_at > datetime.now(timezone.utc).replace(tzinfo=None)
+    mock_apply_async.assert_called_once_with(args=[request_id], countdown=30)
+
+    # not due yet
+    tasks.deliver_pending_endorsement_requests()
+    assert mock_post.call_count == 1
+
+    request.next_delivery_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    EndorsementRequestModel.commit()
+    tasks.deliver_pending_endorsement_requests()
+
+    request = EndorsementRequestModel.get(request_id)
+    assert mock_post.call_count == 2
+    assert request.delivery_status == constants.DELIVERY_STATUS_FAILED
+    assert request.delivery_attempts == 2
+
+
+@patch('requests.Session.post')
+def test_deliver_endorsement_request__rejected(mock_post, db, create_endorsement_request, create_actor):
+    """A request rejected by the actor inbox fails immediately and no longer blocks the actor."""
+    request_id = create_pending_request(create_endorsement_request, create_actor)
+    mock_post.return_value = Mock(status_code=401, text='Unauthorized')
+
+    tasks.shared_task_deliver_endorsement_request(request_id)
+
+    request = EndorsementRequestModel.get(request_id)
+    assert request.delivery_status == constants.DELIVERY_STATUS_FAILED
+    assert request.delivery_attempts == 1
+    assert EndorsementRequestModel.get_latest_status(request.record_id, request.actor_id) is None
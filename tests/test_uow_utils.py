@@ -0,0 +1,29 @@
+from unittest.mock import Mock
+
+import pytest
+from invenio_db.uow import Operation, UnitOfWork
+
+from invenio_notify.utils.uow_utils import savepoint
+
+
+def test_savepoint(db):
+    """Operations of a savepoint are run once on commit, the operations of a failed savepoint are discarded."""
+    kept, nested, discarded = Mock(spec=Operation), Mock(spec=Operation), Mock(spec=Operation)
+    with UnitOfWork(db.session) as uow:
+        with savepoint(uow) as savepoint_uow:
+            savepoint_uow.register(kept)
+            with savepoint(savepoint_uow) as nested_uow:
+                nested_uow.register(nested)
+        with pytest.raises(RuntimeError):
+            with savepoint(uow) as savepoint_uow:
+                savepoint_uow.register(discarded)
+                raise RuntimeError('boom')
+        uow.commit()
+
+    for op in (kept, nested):
+        op.on_register.assert_called_once()
+        op.on_commit.assert_called_once_with(uow)
+        op.on_post_commit.assert_called_once_with(uow)
+    discarded.on_register.assert_called_once()
+    discarded.on_commit.assert_not_called()
+    discarded.on_post_commit.assert_not_called()